@@ -1,4 +1,9 @@
-from .bboard import BBoard, create_board, get_board, list_boards
+"""Bulletin boards.
+
+The board helpers are re-exported lazily: Django imports this package while
+populating its app registry, before Evennia's flat API (which
+:mod:`bboard.bboard` builds on) is available.
+"""
 
 __all__ = [
 	"BBoard",
@@ -6,3 +11,11 @@ __all__ = [
 	"list_boards",
 	"create_board",
 ]
+
+
+def __getattr__(name):
+	if name in __all__:
+		from . import bboard
+
+		return getattr(bboard, name)
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
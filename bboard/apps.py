@@ -0,0 +1,13 @@
+"""Django application configuration for the ``bboard`` app."""
+
+from __future__ import annotations
+
+from django.apps import AppConfig
+
+
+class BBoardConfig(AppConfig):
+	"""Register the bulletin board post and read-state tables."""
+
+	default_auto_field = "django.db.models.BigAutoField"
+	name = "bboard"
+	verbose_name = "Bulletin boards"
@@ -29,106 +29,73 @@ DEFAULT_BOARD_DEFINITIONS = [
 class BBoard(DefaultScript):
 	"""Simple bulletin board stored as a persistent Script.
 
-	Posts are kept in ``self.db.posts`` as a list of dictionaries with keys
-	``subject``, ``body``, ``author`` (Character name), ``author_dbref``,
-	``created`` and optional ``edited`` timestamps.
+	Posts and per-reader read state live in the ``bboard`` tables (see
+	:mod:`bboard.storage`); the script holds the board's name, locks and
+	display settings.  Posts are handed out as dictionaries with keys
+	``id``, ``subject``, ``body``, ``author`` (Character name),
+	``author_dbref``, ``created`` and optional ``edited`` timestamps, and are
+	addressed by their 1-based position on the board.
 	"""
 
 	def at_script_creation(self):
 		self.persistent = True
-		if not self.db.posts:
-			self.db.posts = []
-		if not self.db.read_tracking:
-			# {char_dbref: {"post_ids": [...]}}
-			# Legacy int values are migrated lazily when a player checks a board.
-			self.db.read_tracking = {}
 		if not self.locks.get():
 			# default locks: anyone can read/post, only Admins delete/edit
 			self.locks.add("read:all();post:all();delete:perm(Admin);edit:perm(Admin)")
 
+	@property
+	def storage(self):
+		from .storage import BoardStorage
+
+		return BoardStorage(self)
+
 	# ---------------------------------------------------------------------
 	# Post handling
 	# ---------------------------------------------------------------------
 	def num_posts(self) -> int:
-		return len(self.db.posts or [])
+		return self.storage.count()
 
 	def posts(self) -> List[Dict[str, Any]]:
-		"""Return posts with stable ids populated for legacy rows."""
-		posts = list(self.db.posts or [])
-		changed = False
-		for index, post in enumerate(posts, 1):
-			if not post.get("id"):
-				post["id"] = self._post_id(post, index)
-				changed = True
-		if changed:
-			self.db.posts = posts
-		return posts
-
-	def _post_id(self, post: Dict[str, Any], index: int | None = None) -> str:
-		"""Return a stable post identifier, deriving one for pre-id posts."""
-		if post.get("id"):
-			return str(post["id"])
-		created = post.get("created")
-		if hasattr(created, "isoformat"):
-			return str(created.isoformat())
-		if created:
-			return str(created)
-		return f"legacy-{index or 0}"
+		"""Return every post in board order."""
+		return self.storage.all()
+
+	def latest_post(self) -> Optional[Dict[str, Any]]:
+		"""Return the most recent post, if any."""
+		return self.storage.latest()
 
 	def post(self, subject: str, body: str, author) -> int:
 		"""Create a new post by the given Character ``author``."""
-		posts = self.posts()
-		created = datetime.datetime.utcnow()
-		posts.append(
+		index, post = self.storage.create(
 			{
-				"id": f"{int(created.timestamp() * 1000000)}-{len(posts) + 1}",
 				"subject": subject,
 				"body": body,
 				"author": author.key,
 				"author_dbref": author.dbref,
-				"created": created,
+				"created": datetime.datetime.utcnow(),
 				"edited": None,
 			}
 		)
-		self.db.posts = posts
-		index = len(posts)
 		self.mark_read(author, index)
-		self.notify_new_post(author, index, posts[-1])
+		self.notify_new_post(author, index, post)
 		return index
 
 	def add_post(self, post: Dict[str, Any]):
-		"""Add an existing post dict without modification."""
-		posts = self.posts()
-		if not post.get("id"):
-			post["id"] = self._post_id(post, len(posts) + 1)
-		posts.append(post)
-		self.db.posts = posts
-		return len(posts)
+		"""Add an existing post dict, keeping its id and timestamps."""
+		index, _post = self.storage.create(post)
+		return index
 
 	def get_post(self, index: int) -> Optional[Dict[str, Any]]:
-		posts = self.posts()
-		if 1 <= index <= len(posts):
-			return posts[index - 1]
-		return None
+		return self.storage.get(index)
 
 	def edit_post(self, index: int, body: str) -> bool:
-		post = self.get_post(index)
-		if not post:
-			return False
-		post["body"] = body
-		post["edited"] = datetime.datetime.utcnow()
-		posts = self.posts()
-		posts[index - 1] = post
-		self.db.posts = posts
-		return True
+		return self.storage.update_body(index, body)
 
 	def delete_post(self, index: int) -> bool:
-		posts = self.posts()
-		if 1 <= index <= len(posts):
-			posts.pop(index - 1)
-			self.db.posts = posts
-			return True
-		return False
+		return self.storage.delete(index)
+
+	def purge(self) -> None:
+		"""Remove every post and all read state."""
+		self.storage.purge()
 
 	# ------------------------------------------------------------------
 	# Read tracking
@@ -142,66 +109,28 @@ class BBoard(DefaultScript):
 			or id(reader)
 		)
 
-	def _read_post_ids(self, reader) -> tuple[str, set[str], dict]:
-		"""Return read post ids, migrating old last-index records lazily."""
-		reads = dict(self.db.read_tracking or {})
-		key = self._reader_key(reader)
-		raw = reads.get(key)
-		legacy_key = getattr(reader, "dbref", None)
-		if raw is None and legacy_key in reads:
-			raw = reads.pop(legacy_key)
-		if isinstance(raw, dict):
-			ids = {str(post_id) for post_id in raw.get("post_ids", [])}
-		elif isinstance(raw, int):
-			ids = {
-				self._post_id(post, index)
-				for index, post in enumerate(self.posts()[: max(raw, 0)], 1)
-			}
-			reads[key] = {"post_ids": sorted(ids)}
-			self.db.read_tracking = reads
-		elif isinstance(raw, (list, set, tuple)):
-			ids = {str(post_id) for post_id in raw}
-		else:
-			ids = set()
-		return key, ids, reads
-
-	def _save_read_post_ids(self, reader, ids: set[str]):
-		reads = dict(self.db.read_tracking or {})
-		key = self._reader_key(reader)
-		reads[key] = {"post_ids": sorted(ids)}
-		self.db.read_tracking = reads
-
 	def mark_read(self, reader, index: int):
 		"""Mark one post read for ``reader``."""
-		post = self.get_post(index)
-		if not post:
-			return
-		_, ids, _ = self._read_post_ids(reader)
-		ids.add(self._post_id(post, index))
-		self._save_read_post_ids(reader, ids)
+		self.storage.mark_read(self._reader_key(reader), index)
 
 	def mark_all_read(self, reader):
 		"""Mark all current posts read for ``reader``."""
-		ids = {self._post_id(post, index) for index, post in enumerate(self.posts(), 1)}
-		self._save_read_post_ids(reader, ids)
+		self.storage.mark_all_read(self._reader_key(reader))
 
 	def has_read(self, reader, index: int) -> bool:
-		post = self.get_post(index)
-		if not post:
-			return False
-		_, ids, _ = self._read_post_ids(reader)
-		return self._post_id(post, index) in ids
+		return self.storage.has_read(self._reader_key(reader), index)
 
 	def unread_count(self, reader) -> int:
 		"""Return how many posts ``reader`` (Character) hasn't read yet."""
-		return sum(1 for index, _post in enumerate(self.posts(), 1) if not self.has_read(reader, index))
+		return self.storage.unread_count(self._reader_key(reader))
 
 	def first_unread_index(self, reader) -> int | None:
 		"""Return the 1-based index of the first unread post for ``reader``."""
-		for index, _post in enumerate(self.posts(), 1):
-			if not self.has_read(reader, index):
-				return index
-		return None
+		return self.storage.first_unread_index(self._reader_key(reader))
+
+	def post_rows(self, reader, *, unread_only: bool = False, start: int = 1, limit: int | None = None):
+		"""Return ``(index, post, has_read)`` rows for listing the board."""
+		return self.storage.rows(self._reader_key(reader), unread_only=unread_only, start=start, limit=limit)
 
 	def notify_new_post(self, author, index: int, post: Dict[str, Any]) -> None:
 		"""Notify online characters who can read this board."""
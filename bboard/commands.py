@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import Iterable
 
 from evennia import Command
@@ -9,6 +10,9 @@ from utils.enhanced_evmenu import EnhancedEvMenu
 
 from .bboard import BBoard, create_board, get_board, list_boards, seed_default_boards
 
+POSTS_PER_PAGE = 30
+_PAGE_RE = re.compile(r"#page\s*(\d+)", re.IGNORECASE)
+
 
 def _board_sort_key(board: BBoard) -> tuple[int, str]:
 	sort_order = getattr(getattr(board, "db", None), "sort_order", None)
@@ -134,6 +138,14 @@ def _parse_unread_filter(raw: str) -> tuple[str, bool]:
 	return " ".join(text.split()), unread
 
 
+def _parse_page_filter(raw: str) -> tuple[str, int | None]:
+	match = _PAGE_RE.search(raw or "")
+	if not match:
+		return raw, None
+	text = f"{raw[:match.start()]}{raw[match.end():]}"
+	return " ".join(text.split()), max(int(match.group(1)), 1)
+
+
 def _parse_positive_int(caller, raw: str, usage: str) -> int | None:
 	try:
 		value = int(str(raw).strip())
@@ -153,10 +165,32 @@ def _format_date(value) -> str:
 
 
 def _latest_post_date(board: BBoard) -> str:
-	posts = _board_posts(board)
-	if not posts:
+	latest_post = getattr(board, "latest_post", None)
+	if callable(latest_post):
+		latest = latest_post()
+	else:
+		posts = _board_posts(board)
+		latest = posts[-1] if posts else None
+	if not latest:
 		return "-"
-	return _format_date(posts[-1].get("created"))
+	return _format_date(latest.get("created"))
+
+
+def _post_rows(board: BBoard, caller, *, unread_only: bool, start: int, limit: int | None):
+	"""Return ``(index, post, has_read)`` rows, querying only what is shown."""
+	post_rows = getattr(board, "post_rows", None)
+	if callable(post_rows):
+		return post_rows(caller, unread_only=unread_only, start=start, limit=limit)
+	rows = []
+	for index, post in enumerate(_board_posts(board), 1):
+		has_read = board.has_read(caller, index)
+		if unread_only and has_read:
+			continue
+		rows.append((index, post, has_read))
+	if unread_only:
+		return rows
+	end = None if limit is None else start - 1 + limit
+	return rows[start - 1 : end]
 
 
 def display_board_overview(caller) -> None:
@@ -190,17 +224,24 @@ def display_board_overview(caller) -> None:
 	caller.msg("\n".join(lines))
 
 
-def display_post_list(caller, board: BBoard, *, unread_only: bool = False) -> None:
+def display_post_list(caller, board: BBoard, *, unread_only: bool = False, page: int | None = None) -> None:
 	if not _can_access(board, caller, "read"):
 		caller.msg("You are not allowed to read this board.")
 		return
 
 	board_num = _board_number(caller, board)
-	posts = _board_posts(board)
-	if not posts:
+	total = _num_posts(board)
+	if not total:
 		caller.msg(f"{board.key} is empty.")
 		return
 
+	pages = max((total + POSTS_PER_PAGE - 1) // POSTS_PER_PAGE, 1)
+	if page is not None and not unread_only:
+		page = min(page, pages)
+		start, limit = (page - 1) * POSTS_PER_PAGE + 1, POSTS_PER_PAGE
+	else:
+		page, start, limit = None, 1, None
+
 	lines = [
 		f"|w{board_num}. {board.key}|n" if board_num else f"|w{board.key}|n",
 		"|g" + "-" * 78 + "|n",
@@ -208,10 +249,7 @@ def display_post_list(caller, board: BBoard, *, unread_only: bool = False) -> No
 		"|g" + "-" * 78 + "|n",
 	]
 	visible_rows = 0
-	for index, post in enumerate(posts, 1):
-		has_read = board.has_read(caller, index)
-		if unread_only and has_read:
-			continue
+	for index, post, has_read in _post_rows(board, caller, unread_only=unread_only, start=start, limit=limit):
 		visible_rows += 1
 		marker = "U" if not has_read else " "
 		lines.append(
@@ -223,6 +261,8 @@ def display_post_list(caller, board: BBoard, *, unread_only: bool = False) -> No
 		caller.msg(f"No unread posts on {board.key}.")
 		return
 	lines.append("|g" + "-" * 78 + "|n")
+	if page is not None:
+		lines.append(f"Page {page}/{pages}")
 	caller.msg("\n".join(lines))
 
 
@@ -295,6 +335,7 @@ class CmdBBHelp(Command):
 					"|y+bbread #|n                     - Check a section.",
 					"|y+bbread #/#|n                   - Check a post.",
 					"|y+bbread # #unread|n             - Check unread posts in a section.",
+					"|y+bbread # #page #|n             - Check one page of a section.",
 					"|y+bbpost #|n                     - Post in a section.",
 					"|y+bbremove #/#|n                 - Remove a post.",
 					"|y+bbcatchup all or #|n           - Mark posts as read.",
@@ -313,12 +354,13 @@ class CmdBBList(Command):
 
 	def func(self):
 		raw, unread_only = _parse_unread_filter(self.args)
+		raw, page = _parse_page_filter(raw)
 		if not raw:
 			display_board_overview(self.caller)
 			return
 		board = resolve_board(self.caller, raw)
 		if board:
-			display_post_list(self.caller, board, unread_only=unread_only)
+			display_post_list(self.caller, board, unread_only=unread_only, page=page)
 
 
 class CmdBBRead(Command):
@@ -329,6 +371,7 @@ class CmdBBRead(Command):
 
 	def func(self):
 		raw, unread_only = _parse_unread_filter(self.args)
+		raw, page = _parse_page_filter(raw)
 		if not raw:
 			display_board_overview(self.caller)
 			return
@@ -342,7 +385,7 @@ class CmdBBRead(Command):
 
 		board = resolve_board(self.caller, raw)
 		if board:
-			display_post_list(self.caller, board, unread_only=unread_only)
+			display_post_list(self.caller, board, unread_only=unread_only, page=page)
 			return
 
 		current = get_current_board(self.caller)
@@ -560,8 +603,7 @@ class CmdBBPurge(Command):
 		board = resolve_board(self.caller, self.args, allow_current=True)
 		if not board:
 			return
-		board.db.posts = []
-		board.db.read_tracking = {}
+		board.purge()
 		self.caller.msg(f"Purged posts on {board.key}.")
 
 
@@ -0,0 +1,110 @@
+# Generated manually for table-backed bulletin boards.
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("scripts", "__latest__"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BoardPost",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("seq", models.PositiveIntegerField()),
+                ("post_id", models.CharField(max_length=64)),
+                ("subject", models.CharField(blank=True, max_length=255)),
+                ("body", models.TextField(blank=True)),
+                ("author", models.CharField(blank=True, max_length=255)),
+                ("author_dbref", models.CharField(blank=True, max_length=32)),
+                ("created", models.DateTimeField(blank=True, null=True)),
+                ("edited", models.DateTimeField(blank=True, null=True)),
+                (
+                    "board",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="bboard_posts",
+                        to="scripts.scriptdb",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("board", "seq"),
+                "constraints": [
+                    models.UniqueConstraint(fields=("board", "seq"), name="bboard_post_board_seq_uniq"),
+                    models.UniqueConstraint(fields=("board", "post_id"), name="bboard_post_board_id_uniq"),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="BoardReadMark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("reader", models.CharField(max_length=64)),
+                ("high_water", models.PositiveIntegerField(default=0)),
+                (
+                    "board",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="bboard_read_marks",
+                        to="scripts.scriptdb",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(fields=("board", "reader"), name="bboard_readmark_board_reader_uniq"),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="BoardPostRead",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("reader", models.CharField(max_length=64)),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reads",
+                        to="bboard.boardpost",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(fields=("reader", "post"), name="bboard_postread_reader_post_uniq"),
+                ],
+            },
+        ),
+    ]
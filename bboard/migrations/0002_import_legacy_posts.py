@@ -0,0 +1,23 @@
+# Generated manually to move attribute-stored board posts into tables.
+
+from django.db import migrations
+
+
+def import_posts(apps, schema_editor):
+    """Copy each board's ``db.posts`` and ``db.read_tracking`` into rows."""
+
+    from bboard.storage import import_legacy_boards
+
+    import_legacy_boards()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bboard", "0001_initial"),
+        ("typeclasses", "__latest__"),
+    ]
+
+    operations = [
+        migrations.RunPython(import_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+"""Bulletin board post and read-state tables."""
+
+from __future__ import annotations
+
+from django.db import models
+from evennia.scripts.models import ScriptDB
+
+
+class BoardPost(models.Model):
+	"""One post on a :class:`bboard.bboard.BBoard`.
+
+	``seq`` orders posts on their board and is never reused, so a post's
+	display number is the count of posts with a lower ``seq`` plus one.
+	"""
+
+	board = models.ForeignKey(ScriptDB, on_delete=models.CASCADE, related_name="bboard_posts")
+	seq = models.PositiveIntegerField()
+	post_id = models.CharField(max_length=64)
+	subject = models.CharField(max_length=255, blank=True)
+	body = models.TextField(blank=True)
+	author = models.CharField(max_length=255, blank=True)
+	author_dbref = models.CharField(max_length=32, blank=True)
+	created = models.DateTimeField(null=True, blank=True)
+	edited = models.DateTimeField(null=True, blank=True)
+
+	class Meta:
+		ordering = ("board", "seq")
+		constraints = (
+			models.UniqueConstraint(fields=("board", "seq"), name="bboard_post_board_seq_uniq"),
+			models.UniqueConstraint(fields=("board", "post_id"), name="bboard_post_board_id_uniq"),
+		)
+
+	def __str__(self):  # pragma: no cover - simple representation
+		return f"{self.board_id}/{self.seq}: {self.subject}"
+
+
+class BoardReadMark(models.Model):
+	"""Per-reader high-water mark: every post with ``seq <= high_water`` is read."""
+
+	board = models.ForeignKey(ScriptDB, on_delete=models.CASCADE, related_name="bboard_read_marks")
+	reader = models.CharField(max_length=64)
+	high_water = models.PositiveIntegerField(default=0)
+
+	class Meta:
+		constraints = (
+			models.UniqueConstraint(fields=("board", "reader"), name="bboard_readmark_board_reader_uniq"),
+		)
+
+
+class BoardPostRead(models.Model):
+	"""A post read out of order, above the reader's high-water mark."""
+
+	post = models.ForeignKey(BoardPost, on_delete=models.CASCADE, related_name="reads")
+	reader = models.CharField(max_length=64)
+
+	class Meta:
+		constraints = (
+			models.UniqueConstraint(fields=("reader", "post"), name="bboard_postread_reader_post_uniq"),
+		)
@@ -0,0 +1,337 @@
+"""Database storage for bulletin board posts and read state.
+
+Posts live in :class:`bboard.models.BoardPost` rows ordered by ``seq``.  Read
+state is a per-reader high-water mark (every post up to it is read) plus
+explicit rows for posts read out of order above the mark, so unread counts
+and the first unread post come from indexed queries instead of scanning the
+whole board.  When the posts directly above a mark have all been read the
+mark advances over them and their explicit rows are dropped.
+
+:func:`legacy_board_rows` converts the old ``db.posts``/``db.read_tracking``
+attributes; :func:`import_legacy_boards` runs it for every board and is
+called from the data migration.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def _models():
+	from .models import BoardPost, BoardPostRead, BoardReadMark
+
+	return BoardPost, BoardReadMark, BoardPostRead
+
+
+def legacy_post_id(post: Dict[str, Any], index: int | None = None) -> str:
+	"""Return a stable post identifier, deriving one for pre-id posts."""
+	if post.get("id"):
+		return str(post["id"])
+	created = post.get("created")
+	if hasattr(created, "isoformat"):
+		return str(created.isoformat())
+	if created:
+		return str(created)
+	return f"legacy-{index or 0}"
+
+
+def new_post_id(seq: int) -> str:
+	created = datetime.datetime.utcnow()
+	return f"{int(created.timestamp() * 1000000)}-{seq}"
+
+
+def _compact(high_water: int, read_seqs: Iterable[int], post_seqs: Iterable[int]) -> Tuple[int, List[int]]:
+	"""Advance ``high_water`` over posts already read and return the rest.
+
+	``post_seqs`` must be the ascending sequence numbers above
+	``high_water``.
+	"""
+	read = set(read_seqs)
+	for seq in post_seqs:
+		if seq not in read:
+			break
+		high_water = seq
+	return high_water, sorted(seq for seq in read if seq > high_water)
+
+
+def legacy_board_rows(
+	posts: Iterable[Dict[str, Any]], read_tracking: Optional[Dict[Any, Any]]
+) -> Tuple[List[Dict[str, Any]], Dict[str, Tuple[int, List[int]]]]:
+	"""Convert attribute-stored posts and read tracking into table rows.
+
+	Returns post rows (with ``seq`` and ``post_id``) in board order and a map
+	of reader key to ``(high_water, out_of_order_seqs)``.  Read tracking may
+	be a legacy last-read index, a ``{"post_ids": [...]}`` record or a bare
+	collection of post ids.
+	"""
+	rows: List[Dict[str, Any]] = []
+	seq_by_id: Dict[str, int] = {}
+	for seq, post in enumerate(posts or [], 1):
+		post_id = legacy_post_id(post, seq)
+		if post_id in seq_by_id:
+			post_id = f"{post_id}-{seq}"
+		seq_by_id[post_id] = seq
+		rows.append(
+			{
+				"seq": seq,
+				"post_id": post_id,
+				"subject": str(post.get("subject") or ""),
+				"body": str(post.get("body") or ""),
+				"author": str(post.get("author") or ""),
+				"author_dbref": str(post.get("author_dbref") or ""),
+				"created": post.get("created"),
+				"edited": post.get("edited"),
+			}
+		)
+
+	all_seqs = [row["seq"] for row in rows]
+	reads: Dict[str, Tuple[int, List[int]]] = {}
+	for reader, raw in (read_tracking or {}).items():
+		if isinstance(raw, int):
+			read_seqs = all_seqs[: max(raw, 0)]
+		elif isinstance(raw, dict):
+			read_seqs = [seq_by_id[str(pid)] for pid in raw.get("post_ids", []) if str(pid) in seq_by_id]
+		elif isinstance(raw, (list, set, tuple)):
+			read_seqs = [seq_by_id[str(pid)] for pid in raw if str(pid) in seq_by_id]
+		else:
+			continue
+		reads[str(reader)] = _compact(0, read_seqs, all_seqs)
+	return rows, reads
+
+
+def post_dict(row) -> Dict[str, Any]:
+	"""Return the post mapping handed to commands and menus."""
+	return {
+		"id": row.post_id,
+		"subject": row.subject,
+		"body": row.body,
+		"author": row.author,
+		"author_dbref": row.author_dbref,
+		"created": row.created,
+		"edited": row.edited,
+	}
+
+
+class BoardStorage:
+	"""Post and read-state queries for one board."""
+
+	def __init__(self, board):
+		self.board_id = board.id
+
+	def _posts(self):
+		BoardPost, _, _ = _models()
+		return BoardPost.objects.filter(board_id=self.board_id)
+
+	# ------------------------------------------------------------------
+	# Posts
+	# ------------------------------------------------------------------
+	def count(self) -> int:
+		return self._posts().count()
+
+	def row(self, index: int):
+		if index < 1:
+			return None
+		return self._posts().order_by("seq")[index - 1 : index].first()
+
+	def get(self, index: int) -> Optional[Dict[str, Any]]:
+		row = self.row(index)
+		return post_dict(row) if row else None
+
+	def all(self) -> List[Dict[str, Any]]:
+		return [post_dict(row) for row in self._posts().order_by("seq")]
+
+	def latest(self) -> Optional[Dict[str, Any]]:
+		row = self._posts().order_by("-seq").first()
+		return post_dict(row) if row else None
+
+	def create(self, post: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+		"""Append ``post`` and return its index and stored mapping."""
+		from django.db import transaction
+		from django.db.models import Max
+
+		BoardPost, _, _ = _models()
+		with transaction.atomic():
+			seq = (self._posts().aggregate(top=Max("seq"))["top"] or 0) + 1
+			post_id = str(post.get("id") or new_post_id(seq))
+			if self._posts().filter(post_id=post_id).exists():
+				post_id = f"{post_id}-{seq}"
+			row = BoardPost.objects.create(
+				board_id=self.board_id,
+				seq=seq,
+				post_id=post_id,
+				subject=str(post.get("subject") or ""),
+				body=str(post.get("body") or ""),
+				author=str(post.get("author") or ""),
+				author_dbref=str(post.get("author_dbref") or ""),
+				created=post.get("created") or datetime.datetime.utcnow(),
+				edited=post.get("edited"),
+			)
+		return self.count(), post_dict(row)
+
+	def update_body(self, index: int, body: str) -> bool:
+		row = self.row(index)
+		if not row:
+			return False
+		row.body = body
+		row.edited = datetime.datetime.utcnow()
+		row.save(update_fields=["body", "edited"])
+		return True
+
+	def delete(self, index: int) -> bool:
+		row = self.row(index)
+		if not row:
+			return False
+		row.delete()
+		return True
+
+	def purge(self) -> None:
+		_, BoardReadMark, _ = _models()
+		self._posts().delete()
+		BoardReadMark.objects.filter(board_id=self.board_id).delete()
+
+	# ------------------------------------------------------------------
+	# Read state
+	# ------------------------------------------------------------------
+	def high_water(self, reader: str) -> int:
+		_, BoardReadMark, _ = _models()
+		mark = (
+			BoardReadMark.objects.filter(board_id=self.board_id, reader=reader)
+			.values_list("high_water", flat=True)
+			.first()
+		)
+		return mark or 0
+
+	def _explicit_reads(self, reader: str):
+		_, _, BoardPostRead = _models()
+		return BoardPostRead.objects.filter(reader=reader, post__board_id=self.board_id)
+
+	def _set_high_water(self, reader: str, high_water: int) -> None:
+		_, BoardReadMark, _ = _models()
+		BoardReadMark.objects.update_or_create(
+			board_id=self.board_id, reader=reader, defaults={"high_water": high_water}
+		)
+
+	def mark_read(self, reader: str, index: int) -> None:
+		_, _, BoardPostRead = _models()
+		row = self.row(index)
+		if not row:
+			return
+		high_water = self.high_water(reader)
+		if row.seq <= high_water:
+			return
+		BoardPostRead.objects.get_or_create(post=row, reader=reader)
+		explicit = self._explicit_reads(reader)
+		read_seqs = explicit.values_list("post__seq", flat=True)
+		post_seqs = self._posts().filter(seq__gt=high_water).order_by("seq").values_list("seq", flat=True)
+		new_mark, _rest = _compact(high_water, read_seqs, post_seqs.iterator())
+		if new_mark != high_water:
+			self._set_high_water(reader, new_mark)
+			explicit.filter(post__seq__lte=new_mark).delete()
+
+	def mark_all_read(self, reader: str) -> None:
+		from django.db.models import Max
+
+		top = self._posts().aggregate(top=Max("seq"))["top"] or 0
+		if top > self.high_water(reader):
+			self._set_high_water(reader, top)
+		self._explicit_reads(reader).delete()
+
+	def has_read(self, reader: str, index: int) -> bool:
+		row = self.row(index)
+		if not row:
+			return False
+		if row.seq <= self.high_water(reader):
+			return True
+		return row.reads.filter(reader=reader).exists()
+
+	def unread_count(self, reader: str) -> int:
+		high_water = self.high_water(reader)
+		above = self._posts().filter(seq__gt=high_water).count()
+		return above - self._explicit_reads(reader).filter(post__seq__gt=high_water).count()
+
+	def first_unread_index(self, reader: str) -> int | None:
+		high_water = self.high_water(reader)
+		seq = (
+			self._posts()
+			.filter(seq__gt=high_water)
+			.exclude(reads__reader=reader)
+			.order_by("seq")
+			.values_list("seq", flat=True)
+			.first()
+		)
+		if seq is None:
+			return None
+		return self._posts().filter(seq__lte=seq).count()
+
+	def rows(
+		self, reader: str, *, unread_only: bool = False, start: int = 1, limit: int | None = None
+	) -> List[Tuple[int, Dict[str, Any], bool]]:
+		"""Return ``(index, post, has_read)`` for a page of the board.
+
+		With ``unread_only`` every unread post is returned and ``start`` and
+		``limit`` are ignored.
+		"""
+		from django.db.models import Exists, OuterRef
+
+		_, _, BoardPostRead = _models()
+		high_water = self.high_water(reader)
+		is_read = Exists(BoardPostRead.objects.filter(post=OuterRef("pk"), reader=reader))
+		posts = self._posts().order_by("seq")
+		if unread_only:
+			first = self._posts().filter(seq__lte=high_water).count() + 1
+			queryset = posts.filter(seq__gt=high_water).annotate(is_read=is_read)
+			return [
+				(index, post_dict(row), False)
+				for index, row in enumerate(queryset, first)
+				if not row.is_read
+			]
+		start = max(start, 1)
+		queryset = posts.annotate(is_read=is_read)
+		end = None if limit is None else start - 1 + limit
+		return [
+			(index, post_dict(row), row.seq <= high_water or row.is_read)
+			for index, row in enumerate(queryset[start - 1 : end], start)
+		]
+
+
+def import_legacy_board(board) -> int:
+	"""Move ``board``'s attribute-stored posts into the tables.
+
+	Boards that already have post rows are left alone.  Returns the number
+	of posts imported.
+	"""
+	BoardPost, BoardReadMark, BoardPostRead = _models()
+	posts = board.attributes.get("posts") or []
+	read_tracking = board.attributes.get("read_tracking") or {}
+	storage = BoardStorage(board)
+	if storage.count():
+		return 0
+
+	rows, reads = legacy_board_rows(posts, read_tracking)
+	created = BoardPost.objects.bulk_create(BoardPost(board_id=board.id, **row) for row in rows)
+	by_seq = {post.seq: post for post in created}
+	if not all(post.pk for post in created):
+		by_seq = {post.seq: post for post in storage._posts()}
+	BoardReadMark.objects.bulk_create(
+		BoardReadMark(board_id=board.id, reader=reader, high_water=high_water)
+		for reader, (high_water, _seqs) in reads.items()
+	)
+	BoardPostRead.objects.bulk_create(
+		BoardPostRead(post=by_seq[seq], reader=reader)
+		for reader, (_high_water, seqs) in reads.items()
+		for seq in seqs
+	)
+	board.attributes.remove("posts")
+	board.attributes.remove("read_tracking")
+	return len(rows)
+
+
+def import_legacy_boards() -> int:
+	"""Import attribute-stored posts for every board; return posts imported."""
+	from evennia.scripts.models import ScriptDB
+
+	total = 0
+	for board in ScriptDB.objects.filter(db_typeclass_path="bboard.bboard.BBoard"):
+		total += import_legacy_board(board)
+	return total
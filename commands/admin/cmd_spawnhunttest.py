@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from evennia import Command
 
-from pokemon.spawns.adapters import SpawnAdapterError, spawn_chart_from_room
+from pokemon.spawns.adapters import SpawnAdapterError
+from pokemon.spawns.chart_cache import cached_spawn_chart_for_room
 from pokemon.spawns.hunttest import (
     SpawnHuntTestError,
     parse_hunttest_band,
@@ -40,7 +41,7 @@ class CmdSpawnHuntTest(Command):
             return
 
         try:
-            chart = spawn_chart_from_room(room)
+            chart = cached_spawn_chart_for_room(room)
             result = run_spawn_hunt_test(caller, chart, band=band)
         except SpawnAdapterError as err:
             caller.msg(f"Spawn hunt test adapter error: {err}")
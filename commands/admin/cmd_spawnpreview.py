@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from evennia import Command
 
-from pokemon.spawns.adapters import SpawnAdapterError, spawn_chart_from_room
+from pokemon.spawns.adapters import SpawnAdapterError
+from pokemon.spawns.chart_cache import cached_spawn_chart_for_room
 from pokemon.spawns.preview import format_spawn_preview, parse_preview_band
 
 
@@ -44,7 +45,7 @@ class CmdSpawnPreview(Command):
             return
 
         try:
-            chart = spawn_chart_from_room(room)
+            chart = cached_spawn_chart_for_room(room)
         except SpawnAdapterError as err:
             caller.msg(f"Spawn preview error: {err}")
             return
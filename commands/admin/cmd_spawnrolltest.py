@@ -5,7 +5,8 @@ from __future__ import annotations
 from evennia import Command
 
 from commands.admin.cmd_spawnpreview import detect_room_spawn_source
-from pokemon.spawns.adapters import SpawnAdapterError, spawn_chart_from_room
+from pokemon.spawns.adapters import SpawnAdapterError
+from pokemon.spawns.chart_cache import cached_spawn_chart_for_room
 from pokemon.spawns.rolltest import (
     format_spawn_roll_test,
     parse_rolltest_args,
@@ -41,7 +42,7 @@ class CmdSpawnRollTest(Command):
             return
 
         try:
-            chart = spawn_chart_from_room(room)
+            chart = cached_spawn_chart_for_room(room)
         except SpawnAdapterError as err:
             caller.msg(f"Spawn roll test error: {err}")
             return
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from evennia import Command
 
+from pokemon.spawns.revision import bump_spawn_chart_revision
 from utils.enhanced_evmenu import EnhancedEvMenu
 
 
@@ -78,6 +79,7 @@ class CmdSpawns(Command):
 				}
 			)
 			caller.location.db.spawn_table = table
+			bump_spawn_chart_revision(caller.location)
 			caller.msg("Spawn added.")
 			return _menunode_main(caller)
 
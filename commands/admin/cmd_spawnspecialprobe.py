@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from evennia import Command
 
-from pokemon.spawns.adapters import SpawnAdapterError, spawn_chart_from_room
+from pokemon.spawns.adapters import SpawnAdapterError
+from pokemon.spawns.chart_cache import cached_spawn_chart_for_room
 from pokemon.spawns.profile_data import SpawnProfileDataError
 from pokemon.spawns.profiles import SpawnProfileError
 from pokemon.spawns.special_probe import (
@@ -44,7 +45,7 @@ class CmdSpawnSpecialProbe(Command):
                 caller.msg("You must be in a room to probe room-backed special spawns.")
                 return
             try:
-                chart = spawn_chart_from_room(room)
+                chart = cached_spawn_chart_for_room(room)
             except SpawnAdapterError as err:
                 caller.msg(f"Special spawn probe error: {err}")
                 return
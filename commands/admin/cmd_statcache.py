@@ -0,0 +1,41 @@
+"""Wizard command for inspecting the Pokémon stat cache."""
+
+from __future__ import annotations
+
+from evennia import Command
+
+from pokemon.helpers.pokemon_helpers import clear_stat_cache, stat_cache_info
+
+
+def format_stat_cache_info(info: dict) -> str:
+    """Return a one-line summary of stat cache counters."""
+
+    lookups = info["hits"] + info["misses"]
+    ratio = f"{info['hits'] / lookups:.1%}" if lookups else "n/a"
+    return (
+        f"Stat cache: {info['hits']} hits, {info['misses']} misses "
+        f"(hit rate {ratio}), {info['size']}/{info['maxsize']} entries."
+    )
+
+
+class CmdStatCache(Command):
+    """Show or reset the calculated-stat cache counters.
+
+    Usage:
+      @statcache
+      @statcache/clear
+    """
+
+    key = "@statcache"
+    aliases = ["statcache", "@statcache/clear"]
+    locks = "cmd:perm(Wizards)"
+    help_category = "Admin"
+
+    def func(self):
+        switches = {switch.lower() for switch in getattr(self, "switches", [])}
+        arg = (getattr(self, "args", "") or "").strip().lower()
+        if "clear" in switches or arg == "clear":
+            clear_stat_cache()
+            self.caller.msg("Stat cache cleared.")
+            return
+        self.caller.msg(format_stat_cache_info(stat_cache_info()))
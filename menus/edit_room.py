@@ -1,5 +1,6 @@
 from evennia import create_object
 
+from pokemon.spawns.revision import bump_spawn_chart_revision
 from typeclasses.exits import Exit
 from typeclasses.rooms import Room
 from utils.enhanced_evmenu import free_input_node
@@ -158,6 +159,7 @@ def node_save(caller, raw_input=None):
 	room.db.is_item_shop = data.get("is_shop", False)
 	room.db.allow_hunting = data.get("allow_hunting", False)
 	room.db.hunt_chart = data.get("hunt_chart", [])
+	bump_spawn_chart_revision(room)
 	caller.msg(f"|gRoom '{room.key}' updated.|n")
 	caller.ndb.rw_room = room
 	del caller.ndb.er_data
@@ -90,6 +90,12 @@ def get_pp(entry: Any) -> Optional[int]:
 def ensure_movedex_aliases(movedex: MutableMapping[str, Any]) -> None:
     """Add TitleKey aliases to ``MOVEDEX`` style mappings."""
 
+    add_aliases = getattr(movedex, "add_aliases", None)
+    if callable(add_aliases):
+        # Lazy dex mappings alias pending entries without building them.
+        add_aliases(_normalize_key)
+        return
+
     try:
         items: Iterable[tuple[str, Any]] = list(movedex.items())
     except Exception:
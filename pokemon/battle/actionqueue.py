@@ -113,7 +113,7 @@ class ActionQueue:
 
 		# Persist only the (compacted) state on input to avoid duplicating
 		# turndata snapshots.
-		self.storage.set("state", self._compact_state_for_persist(self.logic.state.to_dict()))
+		self._record_persisted(state=self._compact_state_for_persist(self.logic.state.to_dict()))
 		try:
 			self.storage.set("last_action", state)
 		except Exception:
@@ -11,7 +11,12 @@ DEFAULT_INTENT = "safe_damage"
 
 @dataclass(frozen=True)
 class AIScoringWeights:
-    """Profile-tunable weights for the current move-only AI scorer."""
+    """Profile-tunable weights for the current move-only AI scorer.
+
+    A positive ``damage_calc_budget_ms`` lets the scorer replace its power
+    heuristic with damage-calculator estimates, spending at most that many
+    milliseconds per decision on estimates not already memoized this turn.
+    """
 
     damage_weight: float = 1.0
     accuracy_weight: float = 1.4
@@ -24,6 +29,7 @@ class AIScoringWeights:
     risk_tolerance: float = 0.5
     top_candidate_band: float = 0.8
     randomness: float = 0.55
+    damage_calc_budget_ms: float = 0.0
 
 
 @dataclass(frozen=True)
@@ -181,6 +187,7 @@ DEFAULT_AI_PROFILES: dict[str, AIProfile] = {
             risk_tolerance=0.35,
             top_candidate_band=0.86,
             randomness=0.35,
+            damage_calc_budget_ms=2.0,
         ),
     ),
     "gym_leader": AIProfile(
@@ -211,6 +218,7 @@ DEFAULT_AI_PROFILES: dict[str, AIProfile] = {
             risk_tolerance=0.25,
             top_candidate_band=0.9,
             randomness=0.15,
+            damage_calc_budget_ms=4.0,
         ),
     ),
     "feature_boss": AIProfile(
@@ -243,6 +251,7 @@ DEFAULT_AI_PROFILES: dict[str, AIProfile] = {
             risk_tolerance=0.7,
             top_candidate_band=0.85,
             randomness=0.25,
+            damage_calc_budget_ms=4.0,
         ),
     ),
 }
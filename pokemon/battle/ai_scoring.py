@@ -1,14 +1,23 @@
-"""Move-only AI scoring helpers for runtime battle action selection."""
+"""Move-only AI scoring helpers for runtime battle action selection.
+
+Profiles with a ``damage_calc_budget_ms`` score damaging moves from
+:func:`~pokemon.battle.damage.estimate_damage` ranges instead of the power
+heuristic.  Estimates are memoized in an :class:`AIDamageCache` kept on the
+battle for one turn, so every AI decision of that turn (both slots in
+doubles) shares them.
+"""
 
 from __future__ import annotations
 
 import random
+import time
 from dataclasses import dataclass
 from typing import Any, Callable, Mapping, Sequence
 
 from ._shared import _normalize_key
 from .ai_profiles import AIScoringWeights
-from .damage import stab_multiplier, type_effectiveness
+from .damage import DamageEstimate, estimate_damage, stab_multiplier, type_effectiveness
+from .moveindex import MoveRecord, compiled_move_record, move_resolver
 
 
 DEFAULT_SCORING_WEIGHTS = AIScoringWeights()
@@ -32,6 +41,73 @@ class ScoredAIMove:
     reasons: tuple[str, ...]
 
 
+class AIDamageCache:
+    """Damage estimates memoized for one battle turn.
+
+    Keys are ``(user, target, move key)`` identities; nothing that changes an
+    estimate happens while actions are being chosen, so entries stay valid
+    until the turn number moves on.
+    """
+
+    def __init__(self, turn: Any = None):
+        self.turn = turn
+        self.hits = 0
+        self.misses = 0
+        self._estimates: dict[tuple, DamageEstimate | None] = {}
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._estimates
+
+    def get(self, key: tuple) -> DamageEstimate | None:
+        self.hits += 1
+        return self._estimates[key]
+
+    def store(self, key: tuple, estimate: DamageEstimate | None) -> DamageEstimate | None:
+        self.misses += 1
+        self._estimates[key] = estimate
+        return estimate
+
+
+def ai_damage_cache(battle: Any) -> AIDamageCache:
+    """Return ``battle``'s damage-estimate cache for the current turn."""
+
+    turn = getattr(battle, "turn_count", None)
+    cache = getattr(battle, "ai_damage_cache", None)
+    if isinstance(cache, AIDamageCache) and cache.turn == turn:
+        return cache
+    cache = AIDamageCache(turn)
+    try:
+        setattr(battle, "ai_damage_cache", cache)
+    except Exception:
+        pass
+    return cache
+
+
+@dataclass
+class _DamageBudget:
+    """Damage-calculator access for one AI decision."""
+
+    battle: Any
+    cache: AIDamageCache
+    deadline: float
+
+    def estimate(
+        self, user: Any, target: Any, key: str, make_move: Callable[[], "_EstimateMove"]
+    ) -> DamageEstimate | None | bool:
+        """Return a memoized estimate, or ``False`` once the budget is spent."""
+
+        cache_key = (id(user), id(target), key)
+        if cache_key in self.cache:
+            return self.cache.get(cache_key)
+        if time.perf_counter() > self.deadline:
+            return False
+        try:
+            estimate = estimate_damage(user, target, make_move(), self.battle)
+        except Exception:
+            estimate = None
+        return self.cache.store(cache_key, estimate)
+
+
 def score_ai_moves(
     context,
     moves: Sequence[Any],
@@ -40,14 +116,27 @@ def score_ai_moves(
     target: Any,
     movedex: Mapping[str, Any],
     raw_getter: Callable[[Any], dict[str, Any]],
+    battle: Any | None = None,
 ) -> list[ScoredAIMove]:
     """Return legal, scored move candidates for the current AI decision.
 
-    This is intentionally a cheap heuristic, not the real damage calculator.
-    It scores only move actions and leaves switching, items, doubles strategy,
-    and full setup/status intelligence for later phases.
+    Without ``battle``, or for profiles without a damage-calculator budget,
+    this is a cheap power heuristic.  Otherwise damaging moves are scored from
+    event-light damage estimates shared through :func:`ai_damage_cache`,
+    falling back to the heuristic once the profile's budget is spent.  Only
+    move actions are scored; switching, items, doubles strategy and full
+    setup/status intelligence are left for later phases.
     """
 
+    budget = None
+    budget_ms = _weights_for_context(context).damage_calc_budget_ms
+    if battle is not None and budget_ms > 0:
+        budget = _DamageBudget(
+            battle,
+            ai_damage_cache(battle),
+            time.perf_counter() + budget_ms / 1000.0,
+        )
+
     scored: list[ScoredAIMove] = []
     for move in moves:
         candidate = _score_one_move(
@@ -57,6 +146,7 @@ def score_ai_moves(
             target=target,
             movedex=movedex,
             raw_getter=raw_getter,
+            budget=budget,
         )
         if candidate is not None:
             scored.append(candidate)
@@ -172,6 +262,7 @@ def _score_one_move(
     target: Any,
     movedex: Mapping[str, Any],
     raw_getter: Callable[[Any], dict[str, Any]],
+    budget: _DamageBudget | None = None,
 ) -> ScoredAIMove | None:
     key, dex_entry, raw = _move_lookup(move, movedex, raw_getter)
     weights = _weights_for_context(context)
@@ -208,6 +299,23 @@ def _score_one_move(
             reasons=tuple(reasons),
         )
 
+    if budget is not None:
+        estimate = _budgeted_estimate(budget, user, target, key, raw, movedex, power, move_type, category)
+        if estimate is False:
+            reasons.append("damage_budget_exhausted")
+        elif estimate is not None:
+            score = _score_from_estimate(estimate, target, weights, accuracy_factor, reasons)
+            if score is not None:
+                score += _priority_bonus(priority, user, target, weights, reasons)
+                return _candidate_from_parts(
+                    move,
+                    key=key,
+                    dex_entry=dex_entry,
+                    raw=raw,
+                    score=max(0.0, score),
+                    reasons=tuple(reasons),
+                )
+
     score = float(power) * weights.damage_weight * accuracy_factor
     if power < 40:
         reasons.append("low_power")
@@ -252,20 +360,7 @@ def _score_one_move(
             if weights.overkill_penalty_weight != 1.0:
                 reasons.append("weighted_overkill_penalty")
 
-    if priority > 0:
-        bonus = 0.0
-        target_max_hp = _number_attr(target, "max_hp")
-        if target_hp is not None and target_max_hp and target_hp / target_max_hp <= 0.25:
-            bonus += 5.0
-        user_speed = _stat_value(user, "speed", "spe")
-        target_speed = _stat_value(target, "speed", "spe")
-        if user_speed is not None and target_speed is not None and user_speed < target_speed:
-            bonus += 2.0 * priority
-        if bonus:
-            score += bonus * weights.priority_weight
-            reasons.append("priority")
-            if weights.priority_weight != 1.0:
-                reasons.append("weighted_priority")
+    score += _priority_bonus(priority, user, target, weights, reasons)
 
     if not raw:
         reasons.append("incomplete_dex")
@@ -280,6 +375,117 @@ def _score_one_move(
     )
 
 
+def _priority_bonus(
+    priority: int,
+    user: Any,
+    target: Any,
+    weights: AIScoringWeights,
+    reasons: list[str],
+) -> float:
+    if priority <= 0:
+        return 0.0
+    bonus = 0.0
+    target_hp = _number_attr(target, "hp", "current_hp")
+    target_max_hp = _number_attr(target, "max_hp")
+    if target_hp is not None and target_max_hp and target_hp / target_max_hp <= 0.25:
+        bonus += 5.0
+    user_speed = _stat_value(user, "speed", "spe")
+    target_speed = _stat_value(target, "speed", "spe")
+    if user_speed is not None and target_speed is not None and user_speed < target_speed:
+        bonus += 2.0 * priority
+    if not bonus:
+        return 0.0
+    reasons.append("priority")
+    if weights.priority_weight != 1.0:
+        reasons.append("weighted_priority")
+    return bonus * weights.priority_weight
+
+
+def _budgeted_estimate(
+    budget: _DamageBudget,
+    user: Any,
+    target: Any,
+    key: str,
+    raw: dict[str, Any],
+    movedex: Mapping[str, Any],
+    power: int,
+    move_type: str | None,
+    category: str,
+) -> DamageEstimate | None | bool:
+    if not raw or not move_type:
+        return None
+    return budget.estimate(
+        user,
+        target,
+        key,
+        lambda: _EstimateMove(
+            name=str(raw.get("name") or key),
+            key=key,
+            type=move_type,
+            category=category or "Physical",
+            power=power,
+            raw=raw,
+            record=compiled_move_record(key, raw, movedex) if movedex else MoveRecord(raw, key=key),
+        ),
+    )
+
+
+def _score_from_estimate(
+    estimate: DamageEstimate,
+    target: Any,
+    weights: AIScoringWeights,
+    accuracy_factor: float,
+    reasons: list[str],
+) -> float | None:
+    """Score expected damage as a percentage of the target's max HP.
+
+    STAB and type effectiveness are already part of the estimate; the
+    profile weights re-skew them the same way the heuristic does.
+    """
+
+    target_max_hp = _number_attr(target, "max_hp")
+    if not target_max_hp or target_max_hp <= 0:
+        return None
+    target_hp = _number_attr(target, "hp", "current_hp")
+    if target_hp is None:
+        target_hp = target_max_hp
+    reasons.append("damage_calc")
+    effectiveness = estimate.effectiveness
+    if effectiveness == 0:
+        reasons.append("immune")
+        return 0.0
+
+    expected = estimate.expected
+    dealt = min(expected, target_hp) if target_hp > 0 else expected
+    neutral = dealt / (estimate.stab * effectiveness)
+    score = neutral / target_max_hp * 100.0 * weights.damage_weight * accuracy_factor
+    if estimate.stab > 1.0:
+        score *= _weighted_multiplier(estimate.stab, weights.stab_weight)
+        reasons.append("stab")
+        if weights.stab_weight != 1.0:
+            reasons.append("weighted_stab")
+    if effectiveness != 1.0:
+        score *= _weighted_multiplier(effectiveness, weights.type_effectiveness_weight)
+        reasons.append("super_effective" if effectiveness > 1.0 else "resisted")
+        reasons.append("weighted_type_effectiveness")
+
+    ko_chance = estimate.ko_chance(target_hp) if target_hp > 0 else 0.0
+    if ko_chance > 0:
+        score += 30.0 * ko_chance * weights.ko_bonus_weight
+        reasons.append("ko_candidate")
+        reasons.append(f"ko_chance_{int(round(ko_chance * 100))}")
+        reasons.append("weighted_ko_bonus")
+        if target_hp > 0:
+            score -= (
+                min(15.0, max(0.0, expected - target_hp) / target_hp * 3.0)
+                * weights.overkill_penalty_weight
+            )
+            reasons.append("overkill_checked")
+            if weights.overkill_penalty_weight != 1.0:
+                reasons.append("weighted_overkill_penalty")
+    return score
+
+
 def _candidate_from_parts(
     move: Any,
     *,
@@ -311,7 +517,7 @@ def _move_lookup(
     raw_getter: Callable[[Any], dict[str, Any]],
 ) -> tuple[str, Any, dict[str, Any]]:
     key = _normalize_key(getattr(move, "key", None) or getattr(move, "name", ""))
-    dex_entry = movedex.get(key)
+    dex_entry = move_resolver(movedex).get(key) if movedex else None
     raw = dict(raw_getter(dex_entry) or {})
     return key, dex_entry, raw
 
@@ -492,8 +698,23 @@ class _MoveLike:
     type: str
 
 
+@dataclass(frozen=True)
+class _EstimateMove:
+    """Read-only move view handed to :func:`estimate_damage`."""
+
+    name: str
+    key: str
+    type: str
+    category: str
+    power: int
+    raw: Mapping[str, Any]
+    record: MoveRecord
+
+
 __all__ = [
+    "AIDamageCache",
     "ScoredAIMove",
+    "ai_damage_cache",
     "candidate_band_for_context",
     "choose_weighted_ai_move",
     "fallback_scored_move",
@@ -1006,9 +1006,9 @@ class Pokemon:
             except Exception:  # pragma: no cover - DB not available in tests
                 OwnedPokemon = None
             try:
-                EncounterPokemon = safe_import("pokemon.models.core").EncounterPokemon  # type: ignore[attr-defined]
+                get_encounter_from_ref = safe_import("pokemon.services.encounters").get_encounter_from_ref  # type: ignore[attr-defined]
             except Exception:  # pragma: no cover - DB not available in tests
-                EncounterPokemon = None
+                get_encounter_from_ref = None
 
             if ref_kind == "owned" and OwnedPokemon:
                 try:
@@ -1048,9 +1048,11 @@ class Pokemon:
                         moves = [Move(name=m) for m in move_names]
                 except Exception:
                     pass
-            elif ref_kind == "encounter" and EncounterPokemon:
+            elif ref_kind == "encounter" and get_encounter_from_ref:
                 try:
-                    poke = EncounterPokemon.objects.get(encounter_id=ref_identifier)
+                    poke = get_encounter_from_ref(model_id)
+                    if poke is None:
+                        raise LookupError(model_id)
                     name = getattr(poke, "name", getattr(poke, "species", "Pikachu"))
                     level = getattr(poke, "level", 1)
                     ability = getattr(poke, "ability", ability)
@@ -493,7 +493,7 @@ class BattleSession(TurnManager, MessagingMixin, WatcherManager, ActionQueue, St
         if queued and self.logic and getattr(self, "storage", None):
             try:
                 compact = self._compact_state_for_persist(self.logic.state.to_dict())
-                self.storage.set("state", compact)
+                self._record_persisted(state=compact)
             except Exception:
                 log_warn("Failed to persist AI action selection", exc_info=True)
 
@@ -723,8 +723,7 @@ class BattleSession(TurnManager, MessagingMixin, WatcherManager, ActionQueue, St
         except Exception as err:
             log_err(f"Room type check failed: {err}")
         storage = BattleDataWrapper(room, battle_id)
-        data = storage.get("data")
-        state = storage.get("state")
+        data, state = storage.load()
         if data is None and state is None and storage.get("logic") is None:
             log_info(f"No stored entry for battle {battle_id}")
             return None
@@ -928,7 +927,7 @@ class BattleSession(TurnManager, MessagingMixin, WatcherManager, ActionQueue, St
 
         # Watchers: keep a live, non-persistent copy on ndb; normalize any persisted list
         try:
-            raw_watchers: Any = storage.get("state", {}).get("watchers") or storage.get("watchers") or []
+            raw_watchers: Any = (state or {}).get("watchers") or storage.get("watchers") or []
             watchers_live: Set[int] = set(normalize_watchers(raw_watchers))
             obj.ndb.watchers_live = watchers_live
         except Exception:
@@ -1513,12 +1512,15 @@ class BattleSession(TurnManager, MessagingMixin, WatcherManager, ActionQueue, St
         ``BattleSession`` creates temporary battle representations of a
         trainer's Pokémon. This helper mirrors the resulting HP and status back
         onto the owning :class:`~pokemon.models.core.OwnedPokemon` instances so
-        that battles leave lasting effects on a player's party.
+        that battles leave lasting effects on a player's party.  HP is clamped
+        to the battle-side max HP and every participant's changes are written
+        with one ``bulk_update``.
         """
 
         if not self.battle or not getattr(self.battle, "participants", None):
             return
 
+        synced: List[Any] = []
         for participant in self.battle.participants:
             player = getattr(participant, "player", None)
             if not player:
@@ -1564,13 +1566,15 @@ class BattleSession(TurnManager, MessagingMixin, WatcherManager, ActionQueue, St
                 if not mon:
                     continue
 
-                max_hp = getattr(mon, "current_hp", 0)
-                get_max_hp = getattr(mon, "get_max_hp", None)
-                if callable(get_max_hp):
-                    try:
-                        max_hp = int(get_max_hp())
-                    except Exception:
-                        max_hp = getattr(mon, "current_hp", 0)
+                max_hp = getattr(poke, "max_hp", None)
+                if not max_hp:
+                    max_hp = getattr(mon, "current_hp", 0)
+                    get_max_hp = getattr(mon, "get_max_hp", None)
+                    if callable(get_max_hp):
+                        try:
+                            max_hp = int(get_max_hp())
+                        except Exception:
+                            max_hp = getattr(mon, "current_hp", 0)
 
                 hp_val = int(getattr(poke, "hp", getattr(mon, "current_hp", 0)) or 0)
                 hp_val = max(0, min(hp_val, max_hp if max_hp else hp_val))
@@ -1584,15 +1588,44 @@ class BattleSession(TurnManager, MessagingMixin, WatcherManager, ActionQueue, St
                     mon.status = status_val or ""
 
                 if hasattr(mon, "save"):
+                    synced.append(mon)
+
+        self._save_synced_pokemon(synced)
+
+    @staticmethod
+    def _save_synced_pokemon(mons: List[Any]) -> None:
+        """Write synced HP and status with one ``bulk_update`` per model.
+
+        Rows are saved one at a time if the bulk write fails.
+        """
+
+        by_model: Dict[type, List[Any]] = {}
+        for mon in mons:
+            by_model.setdefault(type(mon), []).append(mon)
+
+        for model, rows in by_model.items():
+            fields = ["current_hp", "status"]
+            meta = getattr(model, "_meta", None)
+            if meta is not None:
+                concrete = {field.name for field in meta.concrete_fields}
+                fields = [field for field in fields if field in concrete]
+            manager = getattr(model, "objects", None)
+            if fields and manager is not None and hasattr(manager, "bulk_update"):
+                try:
+                    manager.bulk_update(rows, fields)
+                    continue
+                except Exception:
+                    log_warn("Bulk party sync failed; saving rows individually", exc_info=True)
+            for mon in rows:
+                try:
+                    mon.save(update_fields=fields or None)
+                except Exception:
                     try:
-                        mon.save(update_fields=["current_hp", "status"])
-                    except Exception:
-                        try:
-                            mon.save()
-                        except Exception as err:
-                            log_warn("Failed to persist synced Pokemon state", exc_info=True)
-                            if "PYTEST_CURRENT_TEST" in __import__("os").environ:
-                                raise
+                        mon.save()
+                    except Exception as err:
+                        log_warn("Failed to persist synced Pokemon state", exc_info=True)
+                        if "PYTEST_CURRENT_TEST" in __import__("os").environ:
+                            raise
 
     def end(self) -> None:
         """End the battle and clean up."""
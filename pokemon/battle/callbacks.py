@@ -3,12 +3,34 @@
 from __future__ import annotations
 
 import inspect
+import sys
+import weakref
+from collections import Counter
 from typing import Any, Iterable
 
 from utils.safe_import import safe_import
 
 from .registry import CALLBACK_REGISTRY
 
+#: Modules searched when an effect holder stores a raw callback string.
+EFFECT_CALLBACK_MODULES = (
+	"pokemon.dex.functions.moves_funcs",
+	"pokemon.dex.functions.conditions_funcs",
+	"pokemon.dex.functions.abilities_funcs",
+	"pokemon.dex.functions.items_funcs",
+)
+
+# Callback modules used by each dex table, mirroring ``pokemon.dex.entities``.
+_DEX_CALLBACK_MODULES = {
+	"MOVEDEX": ("pokemon.dex.functions.moves_funcs",),
+	"ABILITYDEX": ("pokemon.dex.functions.abilities_funcs",),
+	"ITEMDEX": ("pokemon.dex.functions.items_funcs",),
+	"CONDITIONDEX": ("pokemon.dex.functions.conditions_funcs", "pokemon.dex.functions.moves_funcs"),
+}
+
+# (callback string, module paths) -> module path that resolved it
+_MODULE_RESOLUTIONS: dict[tuple[str, tuple[str, ...]], str] = {}
+
 
 def _resolve_callback(cb_name, registry: Any):
 	"""Return a callable referenced by ``cb_name`` from ``registry``.
@@ -41,31 +63,83 @@ def resolve_callback_from_modules(
 	if not cb_name:
 		return None
 	if isinstance(module_paths, str):
-		module_paths = [module_paths]
-	for module_path in module_paths:
+		paths = (module_paths,)
+	else:
+		paths = tuple(module_paths)
+	key = (cb_name, paths) if isinstance(cb_name, str) else None
+	if key is not None:
+		# Only successful lookups are remembered; the registry re-validates
+		# the cached class so reloaded modules resolve afresh.
+		winner = _MODULE_RESOLUTIONS.get(key)
+		registry = sys.modules.get(winner) if winner else None
+		if registry is not None:
+			callback = _resolve_callback(cb_name, registry)
+			if callable(callback):
+				return callback
+	for module_path in paths:
 		try:
 			registry = safe_import(module_path)
 		except Exception:
 			continue
 		callback = _resolve_callback(cb_name, registry)
 		if callable(callback):
+			if key is not None:
+				_MODULE_RESOLUTIONS[key] = module_path
 			return callback
 	return CALLBACK_REGISTRY.resolve_compat(cb_name)
 
 
-def invoke_callback(callback, *args, **kwargs):
-	"""Call ``callback`` with permissive legacy arity fallback."""
+def clear_callback_cache() -> None:
+	"""Drop every memoized callback resolution.
+
+	Call this after reloading ``pokemon.dex.functions`` modules in-process.
+	"""
+
+	_MODULE_RESOLUTIONS.clear()
+	CALLBACK_REGISTRY.clear_resolved()
+
+
+def _iter_callback_strings(data: Any):
+	"""Yield ``Class.method`` strings stored under hook keys in ``data``."""
+
+	if isinstance(data, dict):
+		for key, value in data.items():
+			if isinstance(value, str):
+				if isinstance(key, str) and (key.startswith("on") or key.endswith("Callback")) and "." in value:
+					yield value
+			elif isinstance(value, (dict, list, tuple)):
+				yield from _iter_callback_strings(value)
+	elif isinstance(data, (list, tuple)):
+		for value in data:
+			yield from _iter_callback_strings(value)
 
-	if not callable(callback):
-		return None
+
+def warm_callback_cache(dex: Any = None) -> int:
+	"""Pre-resolve every callback string referenced by the dex tables.
+
+	Returns the number of references that resolved to a callable.
+	"""
+
+	if dex is None:
+		dex = safe_import("pokemon.dex")
+	resolved = 0
+	for table_name, module_paths in _DEX_CALLBACK_MODULES.items():
+		table = getattr(dex, table_name, None) or {}
+		for entry in table.values():
+			raw = getattr(entry, "raw", entry)
+			for cb_name in _iter_callback_strings(raw):
+				if callable(resolve_callback_from_modules(cb_name, module_paths)):
+					resolved += 1
+				resolve_callback_from_modules(cb_name, EFFECT_CALLBACK_MODULES)
+	return resolved
+
+
+def _legacy_attempts(callback, args: tuple[Any, ...], kwargs: dict[str, Any], sig) -> list[tuple[tuple[Any, ...], dict[str, Any]]]:
+	"""Return the ordered argument layouts tried by :func:`invoke_callback`."""
 
 	attempts: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
 	if kwargs:
 		attempts.append((args, kwargs))
-		try:
-			sig = inspect.signature(getattr(callback, "func", callback))
-		except (TypeError, ValueError):
-			sig = None
 		if sig is not None:
 			params = sig.parameters.values()
 			if any(param.kind == inspect.Parameter.VAR_KEYWORD for param in params):
@@ -85,9 +159,69 @@ def invoke_callback(callback, *args, **kwargs):
 			attempts.append((args[:idx], {}))
 	else:
 		attempts.append((tuple(), {}))
+	return attempts
+
+
+_NO_SIGNATURE = object()
+# callable (or underlying function of a bound method) -> {(bound, nargs, kwarg names): plan}
+_ADAPTERS: "weakref.WeakKeyDictionary[Any, dict[tuple[bool, int, tuple[str, ...]], Any]]" = weakref.WeakKeyDictionary()
+#: Callables that still needed exception-driven retries, keyed by qualified name.
+LEGACY_FALLBACKS: Counter[str] = Counter()
+
+
+def _callback_signature(callback):
+	try:
+		return inspect.signature(getattr(callback, "func", callback))
+	except (TypeError, ValueError):
+		return None
 
+
+def _compile_plan(callback, nargs: int, names: tuple[str, ...]):
+	"""Return ``(index, nargs, kwarg names)`` for the first layout that binds.
+
+	The legacy attempt order is replayed against the signature with
+	placeholder values, so the adapter picks exactly the layout the
+	exception-driven loop would have reached first.
+	"""
+
+	sig = _callback_signature(callback)
+	if sig is None:
+		return _NO_SIGNATURE
+	placeholder_args = (None,) * nargs
+	placeholder_kwargs = dict.fromkeys(names)
+	for index, (call_args, call_kwargs) in enumerate(_legacy_attempts(callback, placeholder_args, placeholder_kwargs, sig)):
+		try:
+			sig.bind(*call_args, **call_kwargs)
+		except TypeError:
+			continue
+		return index, len(call_args), tuple(call_kwargs)
+	return _NO_SIGNATURE
+
+
+def _adapter_plan(callback, nargs: int, names: tuple[str, ...]):
+	owner = getattr(callback, "__func__", None)
+	bound = owner is not None
+	key_obj = owner if bound else callback
+	try:
+		plans = _ADAPTERS.get(key_obj)
+		if plans is None:
+			plans = _ADAPTERS[key_obj] = {}
+	except TypeError:  # unhashable or not weak-referenceable
+		return _compile_plan(callback, nargs, names)
+	key = (bound, nargs, names)
+	plan = plans.get(key)
+	if plan is None:
+		plan = plans[key] = _compile_plan(callback, nargs, names)
+	return plan
+
+
+def _invoke_legacy(callback, args, kwargs, start: int = 0):
+	"""Try each legacy argument layout from ``start`` until one succeeds."""
+
+	LEGACY_FALLBACKS[getattr(callback, "__qualname__", None) or repr(callback)] += 1
+	attempts = _legacy_attempts(callback, args, kwargs, _callback_signature(callback) if kwargs else None)
 	last_error: Exception | None = None
-	for call_args, call_kwargs in attempts:
+	for call_args, call_kwargs in attempts[start:]:
 		try:
 			return callback(*call_args, **call_kwargs)
 		except TypeError as err:
@@ -97,3 +231,38 @@ def invoke_callback(callback, *args, **kwargs):
 	if last_error is not None:
 		raise last_error
 	return callback()
+
+
+def legacy_fallback_counts() -> dict[str, int]:
+	"""Return how often each callback needed the legacy retry path."""
+
+	return dict(LEGACY_FALLBACKS)
+
+
+def invoke_callback(callback, *args, **kwargs):
+	"""Call ``callback`` with permissive legacy arity fallback.
+
+	The accepted argument layout is compiled once per callable and argument
+	shape, so repeat calls skip signature introspection.  Callables without
+	an introspectable signature, or whose body raises ``TypeError``, fall
+	back to the legacy retry loop and are counted in
+	:data:`LEGACY_FALLBACKS`.
+	"""
+
+	if not callable(callback):
+		return None
+
+	names = tuple(kwargs)
+	plan = _adapter_plan(callback, len(args), names)
+	if plan is _NO_SIGNATURE:
+		return _invoke_legacy(callback, args, kwargs)
+	index, nargs, call_names = plan
+	call_args = args if nargs == len(args) else args[:nargs]
+	if call_names == names:
+		call_kwargs = kwargs
+	else:
+		call_kwargs = {key: kwargs[key] for key in call_names}
+	try:
+		return callback(*call_args, **call_kwargs)
+	except TypeError:
+		return _invoke_legacy(callback, args, kwargs, index + 1)
@@ -2,9 +2,10 @@ import logging
 import random
 from dataclasses import dataclass, field
 from math import floor
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from ._shared import _normalize_key
+from .moveindex import move_resolver, record_for_move
 from utils.safe_import import safe_import
 
 """Damage calculation helpers and convenience wrappers.
@@ -47,7 +48,7 @@ else:  # pragma: no cover - runtime placeholders
     Pokemon = Any  # type: ignore[assignment]
 
 try:  # pragma: no cover - allow running as a standalone module in tests
-    from pokemon.battle.callbacks import _resolve_callback
+    from pokemon.battle.callbacks import _resolve_callback, resolve_callback_from_modules
 except Exception:  # pragma: no cover
 
     def _resolve_callback(cb_name, registry):
@@ -61,6 +62,18 @@ except Exception:  # pragma: no cover
 
         return cb_name if callable(cb_name) else None
 
+    def resolve_callback_from_modules(cb_name, module_paths):
+        """Uncached fallback resolving ``Class.method`` from the first module."""
+
+        if callable(cb_name) or not isinstance(cb_name, str):
+            return cb_name if callable(cb_name) else None
+        import importlib
+
+        module_path = module_paths if isinstance(module_paths, str) else module_paths[0]
+        cls_name, func_name = cb_name.split(".", 1)
+        cls = getattr(importlib.import_module(module_path), cls_name, None)
+        return getattr(cls(), func_name, None) if cls else None
+
 
 def _resolve_holder_callback(holder, hook: str, registry=None):
     """Return a callable hook from a dex entity or plain handler object."""
@@ -277,66 +290,25 @@ def _report_dict_issue(reason: str, move_name: Optional[str], move_key: Optional
     _notify_admins(details)
 
 
-def _unique_candidates(values: Iterable[Optional[str]]) -> List[str]:
-    """Return an ordered list of unique, truthy candidate keys."""
-
-    seen: set[str] = set()
-    candidates: List[str] = []
-    for value in values:
-        if not value:
-            continue
-        candidate = str(value)
-        if candidate not in seen:
-            seen.add(candidate)
-            candidates.append(candidate)
-    return candidates
-
-
 def _get_movedex_entry(move_name: Optional[str], move_key: Optional[str]):
     """Locate a move entry in ``MOVEDEX`` regardless of key casing.
 
     The packaged dex normalizes keys to lowercase, but legacy datasets and
-    ad-hoc dictionaries occasionally retain TitleCase identifiers.  To keep
-    damage calculation resilient we try a collection of normalized forms
-    before falling back to a case-insensitive scan of the mapping.
+    ad-hoc dictionaries occasionally retain TitleCase identifiers.  The
+    shared :func:`~pokemon.battle.moveindex.move_resolver` indexes every key
+    under its exact, lowercase and normalized forms, so the explicit key is
+    tried first and the display name second.
     """
 
     movedex = _current_movedex()
     if not movedex:
         return None
 
-    raw_name = str(move_name or "")
-    stripped = raw_name.replace(" ", "")
-    normalized = _normalize_key(raw_name)
-    title_compact = stripped.title() if stripped else ""
-    capitalized = stripped.capitalize() if stripped else ""
-
-    for candidate in _unique_candidates(
-        (
-            move_key,
-            normalized,
-            raw_name,
-            stripped,
-            stripped.lower(),
-            raw_name.lower(),
-            raw_name.title(),
-            title_compact,
-            capitalized,
-        )
-    ):
-        entry = movedex.get(candidate)
-        if entry is not None:
-            return entry
-
-    if not raw_name:
-        return None
-
-    lower_name = raw_name.lower()
-    for key, entry in movedex.items():
-        key_str = str(key)
-        if key_str.lower() == lower_name or _normalize_key(key_str) == normalized:
-            return entry
-    return None
+    resolver = move_resolver(movedex)
+    entry = resolver.get(move_key) if move_key else None
+    if entry is None and move_name:
+        entry = resolver.get(str(move_name))
+    return entry
 
 
 def percent_check(chance: float, rng: Optional[random.Random] = None) -> bool:
@@ -433,12 +405,7 @@ def stab_multiplier(attacker: Pokemon, move: Move) -> float:
         cb = ability.raw.get("onModifySTAB") if hasattr(ability, "raw") else None
         if isinstance(cb, str):
             try:
-                from pokemon.dex.functions import abilities_funcs
-
-                cls_name, func_name = cb.split(".", 1)
-                cls = getattr(abilities_funcs, cls_name, None)
-                if cls:
-                    cb = getattr(cls(), func_name, None)
+                cb = resolve_callback_from_modules(cb, "pokemon.dex.functions.abilities_funcs")
             except Exception:
                 cb = None
         elif not callable(cb):
@@ -518,9 +485,10 @@ def damage_calc(
     rng = rng or getattr(battle, "rng", random)
 
     # Handle multihit distribution
+    record = record_for_move(move)
     numhits = 1
-    multihit = move.raw.get("multihit") if getattr(move, "raw", None) else None
-    if isinstance(multihit, list):
+    multihit = record.multihit
+    if isinstance(multihit, tuple):
         population, weights = zip(*MULTIHITCOUNT.items())
         numhits = rng.choices(population, weights)[0]
     elif multihit is not None:
@@ -1047,9 +1015,7 @@ def damage_calc(
             dmg = floor(dmg * eff)
 
             # Critical hit
-            crit_ratio = 0
-            if getattr(move, "raw", None):
-                crit_ratio = int(move.raw.get("critRatio", 0))
+            crit_ratio = record.crit_ratio
             ability = getattr(attacker, "ability", None)
             if ability and hasattr(ability, "call"):
                 try:
@@ -1114,8 +1080,8 @@ def damage_calc(
         if getattr(move, "raw", None):
             status = move.raw.get("status")
             chance = move.raw.get("statusChance", 100)
-            secondary = move.raw.get("secondary")
-            if secondary and isinstance(secondary, dict):
+            secondary = record.secondary
+            if secondary:
                 status = secondary.get("status", status)
                 chance = secondary.get("chance", chance)
             if status and percent_check(chance / 100.0, rng=rng):
@@ -1158,6 +1124,127 @@ def damage_calc(
         ]
     return result
 
+@dataclass(frozen=True)
+class DamageEstimate:
+    """Damage range of one move against one target, before crits."""
+
+    min_damage: int = 0
+    max_damage: int = 0
+    hits: float = 1.0
+    stab: float = 1.0
+    effectiveness: float = 1.0
+
+    @property
+    def expected(self) -> float:
+        """Average damage over all rolls and expected hit counts."""
+
+        return (self.min_damage + self.max_damage) / 2 * self.hits
+
+    def ko_chance(self, hp: float) -> float:
+        """Return the share of damage rolls that deal at least ``hp``."""
+
+        low = self.min_damage * self.hits
+        high = self.max_damage * self.hits
+        if hp <= low:
+            return 1.0
+        if hp > high:
+            return 0.0
+        return (high - hp + 1) / (high - low + 1)
+
+
+def _expected_hits(multihit: Any) -> float:
+    if isinstance(multihit, tuple):
+        low, high = multihit[0], multihit[-1]
+        counts = {hits: weight for hits, weight in MULTIHITCOUNT.items() if low <= hits <= high}
+        if counts:
+            return sum(hits * weight for hits, weight in counts.items()) / sum(counts.values())
+        return (low + high) / 2
+    if isinstance(multihit, (int, float)) and multihit > 0:
+        return float(multihit)
+    return 1.0
+
+
+def estimate_damage(
+    attacker: Pokemon,
+    target: Pokemon,
+    move: Move,
+    battle=None,
+    *,
+    spread: bool = False,
+) -> Optional[DamageEstimate]:
+    """Return the damage range ``move`` would deal without running it.
+
+    This mirrors the arithmetic of :func:`damage_calc` (base formula, 85-100%
+    roll, weather, STAB, type chart, burn and spread modifiers) but runs no
+    accuracy, crit or status rolls, dispatches no battle events and never
+    mutates either Pokémon or ``move``.  Moves whose damage comes from a
+    ``damageCallback`` cannot be estimated this way and return ``None``.
+    """
+
+    record = record_for_move(move)
+    raw = record.raw
+    category = getattr(move, "category", None) or record.category or "Physical"
+    if str(category).lower() == "status":
+        return DamageEstimate()
+    if raw.get("damageCallback") or callable(getattr(move, "damageCallback", None)):
+        return None
+
+    level = getattr(attacker, "level", None)
+    if level is None:
+        level = getattr(attacker, "num", 1)
+    effectiveness = type_effectiveness(target, move)
+    hits = _expected_hits(record.multihit)
+
+    raw_damage = raw.get("damage")
+    if raw_damage == "level" or isinstance(raw_damage, (int, float)):
+        fixed = int(level or 1) if raw_damage == "level" else int(raw_damage)
+        fixed = fixed if effectiveness else 0
+        return DamageEstimate(fixed, fixed, hits, 1.0, effectiveness)
+
+    power = getattr(move, "power", None) or record.base_power
+    if not isinstance(power, (int, float)) or power <= 0:
+        return DamageEstimate(effectiveness=effectiveness)
+
+    try:  # pragma: no cover - allows testing with minimal stubs
+        from pokemon.battle.utils import get_modified_stat
+    except Exception:
+
+        def get_modified_stat(pokemon, stat: str) -> int:  # type: ignore
+            return getattr(getattr(pokemon, "base_stats", None), stat, 0)
+
+    physical = category == "Physical"
+    atk = get_modified_stat(attacker, "attack" if physical else "special_attack")
+    defense = get_modified_stat(target, "defense" if physical else "special_defense")
+    if physical and getattr(attacker, "status", None) == "brn":
+        atk = floor(atk * 0.5)
+    atk, defense = max(1, atk), max(1, defense)
+    base = floor(floor(floor(((2 * level) / 5) + 2) * power * atk / defense) / 50) + 2
+
+    weather_mult = None
+    field = getattr(battle, "field", None) if battle is not None else None
+    weather_handler = getattr(field, "weather_handler", None) if field else None
+    weather_cb = getattr(weather_handler, "onWeatherModifyDamage", None)
+    if callable(weather_cb):
+        try:
+            weather_mult = weather_cb(move)
+        except Exception:
+            weather_mult = None
+    stab = stab_multiplier(attacker, move)
+
+    def _roll(rand_mod: float) -> int:
+        if not effectiveness:
+            return 0
+        dmg = max(1, floor(base * rand_mod))
+        if isinstance(weather_mult, (int, float)):
+            dmg = floor(dmg * weather_mult)
+        dmg = floor(floor(dmg * stab) * effectiveness)
+        if spread:
+            dmg = int(dmg * 0.75)
+        return max(1, dmg)
+
+    return DamageEstimate(_roll(0.85), _roll(1.0), hits, stab, effectiveness)
+
+
 # ----------------------------------------------------------------------
 # Convenience wrappers for the battle engine
 # ----------------------------------------------------------------------
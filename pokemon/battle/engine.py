@@ -134,6 +134,7 @@ from .battledata import (
     _normalize_reveal_viewer,
     _pokemon_reveal_key,
 )
+from .moveindex import MoveRecord, compiled_move_record, move_id, record_for_move, resolve_move
 from .ai_profiles import AIDebugTrace, attach_ai_debug_trace, build_battle_ai_context
 from .ai_scoring import (
     candidate_band_for_context,
@@ -210,7 +211,7 @@ BattleActions = actions_mod.BattleActions
 ConditionHelpers = conditions_mod.ConditionHelpers
 TurnProcessor = turns_mod.TurnProcessor
 
-from .callbacks import _resolve_callback, invoke_callback, resolve_callback_from_modules
+from .callbacks import EFFECT_CALLBACK_MODULES, _resolve_callback, invoke_callback, resolve_callback_from_modules
 
 battle_logger = logging.getLogger("battle")
 try:
@@ -306,6 +307,146 @@ def _effect_key(effect) -> str:
     return _normalize_key(str(value)).lower()
 
 
+_CLASS_HOOK_NAMES: Dict[type, Optional[frozenset[str]]] = {}
+_EVENT_HOOK_PREFIXES = ("onSource", "onAlly", "onFoe", "onAny", "on")
+
+
+def _class_hook_names(cls: type) -> Optional[frozenset[str]]:
+    """Return the ``on*`` attribute names declared on ``cls``.
+
+    ``None`` is returned for classes that resolve attributes dynamically via
+    ``__getattr__`` because their hooks cannot be enumerated up front.
+    """
+
+    try:
+        return _CLASS_HOOK_NAMES[cls]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+    if any("__getattr__" in vars(base) for base in cls.__mro__ if base is not object):
+        names = None
+    else:
+        names = frozenset(name for name in dir(cls) if name.startswith("on"))
+    _CLASS_HOOK_NAMES[cls] = names
+    return names
+
+
+def _holder_hook_names(holder) -> Optional[frozenset[str]]:
+    """Return the event hooks ``holder`` can answer, or ``None`` when unknown.
+
+    Holders exposing a custom ``call`` dispatcher are treated as wildcards
+    unless they advertise their hooks through an ``event_hooks`` attribute,
+    as the dex :class:`~pokemon.dex.entities.Ability`, ``Item`` and
+    ``Condition`` entities do.
+    """
+
+    if holder is None:
+        return frozenset()
+    if hasattr(holder, "call"):
+        hooks = getattr(holder, "event_hooks", None)
+        if isinstance(hooks, (set, frozenset)):
+            return frozenset(hooks)
+        return None
+    class_names = _class_hook_names(type(holder))
+    if class_names is None:
+        return None
+    names = set(class_names)
+    instance_attrs = getattr(holder, "__dict__", None)
+    if isinstance(instance_attrs, dict):
+        names.update(name for name in instance_attrs if isinstance(name, str) and name.startswith("on"))
+    raw = getattr(holder, "raw", None)
+    if isinstance(raw, dict):
+        names.update(name for name, value in raw.items() if value and isinstance(name, str) and name.startswith("on"))
+    return frozenset(names)
+
+
+def _relation_hooks(eventid: str, relation: Optional[str]) -> frozenset[str]:
+    """Return every hook name :meth:`Battle.runEvent` may probe for ``relation``."""
+
+    if relation == "source":
+        hooks = {f"onSource{eventid}"}
+    elif relation == "ally":
+        hooks = {f"onAlly{eventid}"}
+        if eventid == "RedirectTarget":
+            hooks.add(f"onFoe{eventid}")
+    elif relation == "foe":
+        hooks = {f"onFoe{eventid}"}
+    else:
+        hooks = {f"on{eventid}"}
+    hooks.add(f"onAny{eventid}")
+    return frozenset(hooks)
+
+
+class _EventHandlerIndex:
+    """Precompiled subscriber lookup used by :meth:`Battle.runEvent`.
+
+    The index is built from every effect holder present in the battle and is
+    valid for a single effect fingerprint.  It answers "does anything listen
+    to this event?" with a set lookup and memoizes the filtered, dispatch
+    ordered holder list for each ``(event, target, source)`` combination.
+    """
+
+    __slots__ = ("fingerprint", "events", "wildcard", "active_ids", "_scoped")
+
+    def __init__(self, fingerprint: tuple, hook_names: set[str], wildcard: bool, active_ids: frozenset[int]) -> None:
+        self.fingerprint = fingerprint
+        self.wildcard = wildcard
+        self.active_ids = active_ids
+        events: set[str] = set()
+        for name in hook_names:
+            events.add(name[2:])
+            for prefix in _EVENT_HOOK_PREFIXES:
+                if name.startswith(prefix):
+                    events.add(name[len(prefix):])
+                    break
+        self.events = frozenset(events)
+        self._scoped: Dict[tuple[int, int], tuple[Any, Any, list, Dict[str, list]]] = {}
+
+    def _is_tracked(self, pokemon) -> bool:
+        return pokemon is None or id(pokemon) in self.active_ids
+
+    def has_no_subscribers(self, eventid: str, target=None) -> bool:
+        """Return ``True`` when no holder can possibly answer ``eventid``."""
+
+        if self.wildcard or eventid in self.events:
+            return False
+        return self._is_tracked(target)
+
+    def holders_for(self, battle: "Battle", eventid: str, target=None, source=None) -> list:
+        """Return holders subscribed to ``eventid`` in dispatch order."""
+
+        scoped_key = (id(target), id(source))
+        scoped = self._scoped.get(scoped_key)
+        if scoped is None or scoped[0] is not target or scoped[1] is not source:
+            entries = [
+                (holder, state, owner, _holder_hook_names(holder[1] if isinstance(holder, tuple) else holder))
+                for holder, state, owner in battle._event_scoped_holders(target=target, source=source)
+            ]
+            scoped = (target, source, entries, {})
+            # Benched or switching targets are not covered by the fingerprint,
+            # so their holder lists are rebuilt on every call.
+            if self._is_tracked(target):
+                self._scoped[scoped_key] = scoped
+        by_event = scoped[3]
+        cached = by_event.get(eventid)
+        if cached is not None:
+            return cached
+        relevant: Dict[Optional[str], frozenset[str]] = {}
+        filtered = []
+        for holder, state, owner, names in scoped[2]:
+            relation = holder[0] if isinstance(holder, tuple) else None
+            if names is not None:
+                hooks = relevant.get(relation)
+                if hooks is None:
+                    hooks = relevant[relation] = _relation_hooks(eventid, relation)
+                if names.isdisjoint(hooks):
+                    continue
+            filtered.append((holder, state, owner))
+        by_event[eventid] = filtered
+        return filtered
+
+
 REVEAL_ON_ENTRY_ABILITIES = {
     "drizzle",
     "drought",
@@ -699,6 +840,7 @@ def _select_ai_action(
         target=opponent.active[0],
         movedex=MOVEDEX,
         raw_getter=get_raw,
+        battle=battle,
     )
     selected = choose_weighted_ai_move(scored_moves, rng=battle.rng, context=ai_context)
     if selected is None:
@@ -913,6 +1055,21 @@ class BattleMove:
             raw_category = self.raw.get("category") if isinstance(self.raw, dict) else None
             self.category = raw_category or ("Status" if not self.power else "Physical")
 
+    @property
+    def record(self) -> MoveRecord:
+        """Return the compiled :class:`MoveRecord` for this move's ``raw`` data.
+
+        The record is cached until ``raw`` is replaced; callbacks that change
+        move data assign a new ``raw`` mapping rather than editing it in place.
+        """
+        raw = self.raw
+        cached = self.__dict__.get("_record")
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        record = compiled_move_record(self.key, raw, MOVEDEX)
+        self.__dict__["_record"] = (raw, record)
+        return record
+
     def execute(self, user, target, battle: "Battle") -> None:
         """Execute this move's effect.
 
@@ -925,11 +1082,8 @@ class BattleMove:
         """
 
         DEFAULT_TEXT = _get_default_text()
-        raw_flags = self.raw.get("flags", {}) if self.raw else {}
-        bypasses_substitute = bool(
-            (self.raw.get("bypassSub") if self.raw else None)
-            or raw_flags.get("bypasssub")
-        )
+        record = self.record
+        bypasses_substitute = record.bypass_sub
 
         if battle and hasattr(battle, "log_action"):
             default_messages = DEFAULT_TEXT.get("default", {})
@@ -959,8 +1113,8 @@ class BattleMove:
                 return
 
         # Default behaviour for moves without custom handlers
-        move_category = self.raw.get("category") if self.raw else ""
-        category = str(move_category).lower()
+        move_category = record.category
+        category = move_category.lower()
         result = None
         if category != "status":
             # Expose the canonical category for ability hooks that expect it as
@@ -977,12 +1131,12 @@ class BattleMove:
             if boosts:
                 from pokemon.utils.boosts import apply_boost
 
-                affected = user if is_self_target(self.raw.get("target")) else target
+                affected = user if record.self_target else target
                 if affected is not None:
                     apply_boost(affected, boosts)
 
         # Apply draining effects (e.g. Absorb)
-        drain = self.raw.get("drain") if self.raw else None
+        drain = self.record.drain
         if drain and result is not None:
             damage = 0
             if hasattr(result, "debug"):
@@ -1030,7 +1184,7 @@ class BattleMove:
         heal = self.raw.get("heal") if self.raw else None
         if heal:
             frac = heal[0] / heal[1] if isinstance(heal, (list, tuple)) else 0
-            heal_target = user if is_self_target(self.raw.get("target")) else target
+            heal_target = user if self.record.self_target else target
             if heal_target is not None:
                 max_hp = getattr(heal_target, "max_hp", getattr(heal_target, "hp", 1))
                 amount = max(1, int(max_hp * frac)) if frac else max_hp
@@ -1070,7 +1224,7 @@ class BattleMove:
         slot_cond = self.raw.get("slotCondition") if self.raw else None
         if slot_cond and battle:
             condition = self.raw.get("condition", {})
-            slot_target = user if is_self_target(self.raw.get("target")) else target
+            slot_target = user if self.record.self_target else target
             if slot_target is not None:
                 battle.add_slot_condition(slot_target, slot_cond, condition, source=user)
 
@@ -1082,7 +1236,7 @@ class BattleMove:
         if boosts and category != "status":
             from pokemon.utils.boosts import apply_boost
 
-            affected = user if is_self_target(self.raw.get("target")) else target
+            affected = user if self.record.self_target else target
             if affected:
                 apply_boost(affected, boosts)
 
@@ -1097,14 +1251,14 @@ class BattleMove:
                     cb(user, target)
                 except Exception:
                     cb(target)
-            affected = user if is_self_target(self.raw.get("target")) else target
+            affected = user if self.record.self_target else target
             if affected and hasattr(affected, "volatiles"):
                 affected.volatiles.setdefault(volatile, True)
 
         # Apply major status conditions inflicted by this move
         status = self.raw.get("status") if self.raw else None
         if status:
-            affected = user if is_self_target(self.raw.get("target")) else target
+            affected = user if self.record.self_target else target
             if affected is not None:
                 if (
                     affected is not user
@@ -1126,11 +1280,7 @@ class BattleMove:
                 invoke_callback(cb, user, target, battle=battle)
 
         # Apply secondary effects such as additional boosts or status changes
-        secondaries: List[Dict[str, Any]] = []
-        sec = self.raw.get("secondary") if self.raw else None
-        if sec:
-            secondaries.append(sec)
-        secondaries.extend(self.raw.get("secondaries", [])) if self.raw else None
+        secondaries: List[Dict[str, Any]] = list(self.record.secondaries)
         if secondaries:
             from pokemon.battle.damage import percent_check
             from pokemon.utils.boosts import apply_boost
@@ -1472,6 +1622,9 @@ class RewardService:
 class Battle(TurnProcessor, ConditionHelpers, BattleActions):
     """Main battle controller for one or more sides."""
 
+    #: Dispatch :meth:`runEvent` through the precompiled handler index.
+    event_index_enabled: bool = True
+
     def __init__(
         self,
         battle_type: BattleType,
@@ -1503,6 +1656,7 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
         self.turn_count = 0
         self.battle_over = False
         self.dispatcher = EventDispatcher(allow_arity_fallback=False)
+        self._event_index: Optional[_EventHandlerIndex] = None
         from .battledata import Field
 
         self.field = Field()
@@ -1903,13 +2057,7 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
             if cb_name:
                 callback = resolve_callback_from_modules(
                     cb_name,
-                    fallback_modules
-                    or [
-                        "pokemon.dex.functions.moves_funcs",
-                        "pokemon.dex.functions.conditions_funcs",
-                        "pokemon.dex.functions.abilities_funcs",
-                        "pokemon.dex.functions.items_funcs",
-                    ],
+                    fallback_modules or EFFECT_CALLBACK_MODULES,
                 )
                 if callable(callback):
                     return invoke_callback(callback, *call_args, **call_kwargs)
@@ -2128,6 +2276,97 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
                     add_holder(self._holder_item(pokemon), getattr(pokemon, "item_state", None), pokemon)
         return holders
 
+    def _invalidate_event_index(self) -> None:
+        """Discard the precompiled :class:`_EventHandlerIndex`.
+
+        Only needed when a change is invisible to the effect fingerprint,
+        such as swapping the ``_lookup_effect`` resolver.
+        """
+
+        self._event_index = None
+
+    def _event_index_fingerprint(self) -> tuple:
+        """Return a flat identity snapshot of every effect-bearing slot.
+
+        Dex callbacks mutate ``volatiles``, ``status``, items and side
+        conditions in place in hundreds of places, so the index is keyed by
+        this snapshot rather than by explicit invalidation calls.  Only
+        identities are recorded, which keeps the walk far cheaper than
+        resolving and probing every holder (see
+        ``tools/benchmarks/run_event_index.py``).
+        """
+
+        field_obj = getattr(self, "field", None)
+        parts: list[Any] = [
+            id(field_obj),
+            getattr(field_obj, "weather", None),
+            getattr(field_obj, "terrain", None),
+            id(getattr(field_obj, "weather_handler", None)),
+            id(getattr(field_obj, "weather_state", None)),
+            id(getattr(field_obj, "terrain_handler", None)),
+            id(getattr(field_obj, "terrain_state", None)),
+        ]
+        append = parts.append
+        for name, state in getattr(field_obj, "pseudo_weather", {}).items():
+            append(name)
+            append(id(state))
+        for part in self.participants:
+            side = getattr(part, "side", None)
+            append(id(side))
+            for name, state in getattr(side, "conditions", {}).items():
+                append(name)
+                append(id(state))
+            for slot, bucket in getattr(side, "slot_conditions", {}).items():
+                append(slot)
+                for name, state in bucket.items():
+                    append(name)
+                    append(id(state))
+            for pokemon in getattr(part, "active", []):
+                append(id(pokemon))
+                if pokemon is None:
+                    continue
+                append(id(getattr(pokemon, "status", None)))
+                append(id(getattr(pokemon, "status_state", None)))
+                append(id(getattr(pokemon, "ability", None)))
+                append(id(getattr(pokemon, "ability_state", None)))
+                append(id(getattr(pokemon, "item", None)))
+                append(id(getattr(pokemon, "held_item", None)))
+                append(id(getattr(pokemon, "item_state", None)))
+                for name, state in getattr(pokemon, "volatiles", {}).items():
+                    append(name)
+                    append(id(state))
+                append(None)
+        return tuple(parts)
+
+    def _event_handler_index(self) -> _EventHandlerIndex:
+        """Return the handler index for the current effect state, rebuilding if stale."""
+
+        index = getattr(self, "_event_index", None)
+        if index is not None and index.fingerprint == self._event_index_fingerprint():
+            return index
+        hook_names: set[str] = set()
+        wildcard = False
+        active: list[Any] = [
+            pokemon for part in self.participants for pokemon in getattr(part, "active", []) if pokemon is not None
+        ]
+        holders = [holder for holder, _, _ in self._event_scoped_holders()]
+        holders.extend(active)
+        for holder in holders:
+            names = _holder_hook_names(holder[1] if isinstance(holder, tuple) else holder)
+            if names is None:
+                wildcard = True
+                break
+            hook_names.update(names)
+        # Building holders may coerce held items, so fingerprint afterwards.
+        index = _EventHandlerIndex(
+            self._event_index_fingerprint(),
+            hook_names,
+            wildcard,
+            frozenset(id(pokemon) for pokemon in active),
+        )
+        self._event_index = index
+        return index
+
     def singleEvent(
         self,
         eventid: str,
@@ -2192,7 +2431,14 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
         elif eventid == "TryAddVolatile":
             relay_kw_name = "status"
             relay_positional = False
-        for holder, state, owner in self._event_scoped_holders(target=target, source=source):
+        if self.event_index_enabled:
+            index = self._event_handler_index()
+            if index.has_no_subscribers(eventid, target):
+                return True if relayVar is None else relay
+            holders = index.holders_for(self, eventid, target=target, source=source)
+        else:
+            holders = self._event_scoped_holders(target=target, source=source)
+        for holder, state, owner in holders:
             relation = None
             actual_holder = holder
             if isinstance(holder, tuple):
@@ -3160,7 +3406,7 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
             return None
         if hasattr(move_ref, "name"):
             return move_ref
-        move_key = str(getattr(move_ref, "id", move_ref) or "").lower()
+        move_key = move_id(str(getattr(move_ref, "id", move_ref) or ""))
         if not move_key:
             return None
         slots = getattr(pokemon, "activemoveslot_set", None)
@@ -3171,12 +3417,11 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
                 slot_iter = slots
             for slot in slot_iter:
                 slot_move = getattr(slot, "move", None)
-                key = _normalize_key(getattr(slot_move, "name", ""))
-                if key == move_key:
+                if move_id(str(getattr(slot_move, "name", "") or "")) == move_key:
                     return slot_move
         for move in getattr(pokemon, "moves", []):
-            key = getattr(move, "key", None) or _normalize_key(getattr(move, "name", ""))
-            if str(key).lower() == move_key:
+            key = getattr(move, "key", None) or getattr(move, "name", "")
+            if move_id(str(key or "")) == move_key:
                 return move
         return None
 
@@ -3960,8 +4205,7 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
         key = getattr(action.move, "key", None)
         if not key and getattr(action.move, "name", None):
             key = _normalize_key(action.move.name)
-        ensure_movedex_aliases(MOVEDEX)
-        dex_move = MOVEDEX.get(key) if key else None
+        dex_move = resolve_move(key, MOVEDEX) if key else None
         dex_raw = get_raw(dex_move) if dex_move else {}
         if not dex_move or not dex_raw:
             try:
@@ -3976,8 +4220,7 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
                 if MOVEDEX is not source:
                     MOVEDEX.clear()
                     MOVEDEX.update(source)
-                    ensure_movedex_aliases(MOVEDEX)
-                dex_move = MOVEDEX.get(key) if key else None
+                dex_move = resolve_move(key, MOVEDEX) if key else None
                 dex_raw = get_raw(dex_move) if dex_move else {}
             except Exception:
                 dex_move = None
@@ -4012,7 +4255,7 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
             if getattr(action.move, "category", None) is None:
                 action.move.category = raw.get("category", getattr(dex_move, "category", None))
             if action.move.priority == 0:
-                action.move.priority = int(raw.get("priority", 0))
+                action.move.priority = record_for_move(action.move).priority
 
             for attr in (
                 "onHit",
@@ -4105,7 +4348,7 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
             opponents = self.opponents_of(action.actor)
             target_part = opponents[0] if opponents else None
         target = None
-        if is_self_target(action.move.raw.get("target")):
+        if record_for_move(action.move).self_target:
             target_part = action.actor
             target = user
         elif target_part and target_part.active:
@@ -4178,7 +4421,7 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
                 # Determine the target of the stolen move
                 snatch_target = (
                     snatcher
-                    if is_self_target(action.move.raw.get("target"))
+                    if record_for_move(action.move).self_target
                     else target
                 )
                 action.move.execute(snatcher, snatch_target, self)
@@ -4370,7 +4613,7 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
                     target.tempvals["took_damage"] = True
                 except Exception:
                     pass
-                drain = action.move.raw.get("drain")
+                drain = record_for_move(action.move).drain
                 if drain:
                     frac = drain[0] / drain[1]
                     heal_amt = max(1, int(dmg * frac))
@@ -4438,7 +4681,7 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
             start_user_boosts != end_user_boosts
             or start_target_boosts != end_target_boosts
         )
-        target_self = is_self_target(action.move.raw.get("target"))
+        target_self = record_for_move(action.move).self_target
         user_name = getattr(user, "name", "Pokemon")
         target_name = "itself" if target_self else getattr(target, "name", "Pokemon")
         if dmg > 0:
@@ -4562,7 +4805,7 @@ class Battle(TurnProcessor, ConditionHelpers, BattleActions):
         except Exception:
             pass
 
-        if action.move.raw.get("target") in {"allAdjacent", "allAdjacentFoes"}:
+        if record_for_move(action.move).spread:
             extra = []
             if target_part and target_part.active:
                 for t in target_part.active:
@@ -132,8 +132,7 @@ class BattleHandler:
 			# rebuild live logic from stored room data if needed
 			if not inst.logic:
 				storage = BattleDataWrapper(inst.room, inst.battle_id)
-				data = storage.get("data")
-				state = storage.get("state")
+				data, state = storage.load()
 				if data is not None or state is not None or storage.get("logic") is not None:
 					from .battleinstance import BattleLogic
 
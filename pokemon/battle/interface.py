@@ -260,48 +260,41 @@ def render_interfaces(captain_a, captain_b, state, *, waiting_on=None, style: st
 	return iface_a, iface_b, iface_w
 
 
+def _render_for(frames: dict, session, target, viewer_team, waiting_on) -> str:
+        """Return ``target``'s interface, reusing an identical frame from ``frames``."""
+
+        style = get_battle_ui_style(target)
+        width = get_battle_ui_width(target)
+        key = (viewer_team, style, width)
+        frame = frames.get(key)
+        if frame is None:
+                frame = frames[key] = display_battle_interface(
+                        session.captainA,
+                        session.captainB,
+                        session.state,
+                        viewer_team=viewer_team,
+                        waiting_on=waiting_on,
+                        style=style,
+                        total_width=width,
+                )
+        return frame
+
+
 def broadcast_interfaces(session, *, waiting_on=None) -> None:
-        """Render and send interfaces for ``session`` to all participants."""
+        """Render and send interfaces for ``session`` to all participants.
+
+        The state cannot change while a broadcast is in progress, so frames
+        are rendered once per ``(viewer_team, style, width)`` and shared by
+        every viewer with the same combination.
+        """
 
+        frames: dict = {}
         for t in getattr(session, "teamA", []):
-                session._msg_to(
-                        t,
-                        display_battle_interface(
-                                session.captainA,
-                                session.captainB,
-                                session.state,
-                                viewer_team="A",
-                                waiting_on=waiting_on,
-                                style=get_battle_ui_style(t),
-                                total_width=get_battle_ui_width(t),
-                        ),
-                )
+                session._msg_to(t, _render_for(frames, session, t, "A", waiting_on))
         for t in getattr(session, "teamB", []):
-                session._msg_to(
-                        t,
-                        display_battle_interface(
-                                session.captainA,
-                                session.captainB,
-                                session.state,
-                                viewer_team="B",
-                                waiting_on=waiting_on,
-                                style=get_battle_ui_style(t),
-                                total_width=get_battle_ui_width(t),
-                        ),
-                )
+                session._msg_to(t, _render_for(frames, session, t, "B", waiting_on))
         for w in getattr(session, "observers", []):
-                session._msg_to(
-                        w,
-                        display_battle_interface(
-                                session.captainA,
-                                session.captainB,
-                                session.state,
-                                viewer_team=None,
-                                waiting_on=waiting_on,
-                                style=get_battle_ui_style(w),
-                                total_width=get_battle_ui_width(w),
-                        ),
-                )
+                session._msg_to(w, _render_for(frames, session, w, None, waiting_on))
 
 
 def send_interface_to(session, target, *, waiting_on=None) -> None:
@@ -0,0 +1,295 @@
+"""Interned move-id resolution shared by the battle hot paths.
+
+Turn ordering, damage calculation, AI scoring and the engine all turn a move
+name into a ``MOVEDEX`` entry.  Each used to normalize the name and probe the
+dex with several candidate keys on every call.  :class:`MoveResolver` instead
+indexes every key of a move dex once under its exact, lowercase and
+normalized forms, memoizes each looked-up name, and keeps a small
+:class:`MoveRecord` of typed per-move data.
+
+:func:`move_resolver` returns the shared resolver for a mapping and rebuilds
+it when the mapping's keys change.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+from ._shared import _normalize_key, ensure_movedex_aliases
+
+_MAX_RESOLVERS = 32
+
+
+@lru_cache(maxsize=4096)
+def move_id(name: Any) -> str:
+    """Return the lowercase normalized id for ``name`` (``"Ice Beam"`` -> ``"icebeam"``)."""
+
+    return _normalize_key(name).lower()
+
+
+_SELF_TARGETS = frozenset({"self", "adjacentAlly", "adjacentAllyOrSelf", "ally"})
+_SPREAD_TARGETS = frozenset({"allAdjacent", "allAdjacentFoes"})
+
+
+def _int(value: Any, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class MoveRecord:
+    """Immutable, typed view of one move's dex data.
+
+    Records are compiled once per dex entry and attached to battle moves
+    (see ``BattleMove.record``) so hot paths read attributes instead of
+    probing ``move.raw``.  ``raw`` keeps the mapping the record was compiled
+    from; it is not copied.
+    """
+
+    __slots__ = (
+        "key",
+        "entry",
+        "raw",
+        "name",
+        "priority",
+        "base_power",
+        "accuracy",
+        "category",
+        "move_type",
+        "target",
+        "flags",
+        "crit_ratio",
+        "multihit",
+        "drain",
+        "secondary",
+        "secondaries",
+        "bypass_sub",
+        "contact",
+        "sound",
+        "punch",
+        "protectable",
+        "spread",
+        "self_target",
+    )
+
+    key: str
+    entry: Any
+    raw: Mapping[str, Any]
+    name: str
+    priority: int
+    base_power: int
+    accuracy: int | float | bool
+    category: str
+    move_type: Optional[str]
+    target: str
+    flags: frozenset
+    crit_ratio: int
+    multihit: int | tuple | None
+    drain: tuple | None
+    secondary: Optional[Mapping[str, Any]]
+    secondaries: tuple
+    bypass_sub: bool
+    contact: bool
+    sound: bool
+    punch: bool
+    protectable: bool
+    spread: bool
+    self_target: bool
+
+    def __init__(self, raw: Optional[Mapping[str, Any]] = None, key: str = "", entry: Any = None):
+        raw = raw if isinstance(raw, Mapping) else {}
+        raw_flags = raw.get("flags")
+        flags = (
+            frozenset(flag for flag, value in raw_flags.items() if value)
+            if isinstance(raw_flags, Mapping)
+            else frozenset()
+        )
+        target = str(raw.get("target") or "normal")
+        multihit = raw.get("multihit")
+        drain = raw.get("drain")
+        secondary = raw.get("secondary") or None
+        secondaries = ((secondary,) if secondary else ()) + tuple(raw.get("secondaries") or ())
+        accuracy = raw.get("accuracy")
+        values = {
+            "key": key,
+            "entry": entry,
+            "raw": raw,
+            "name": str(raw.get("name") or getattr(entry, "name", None) or key),
+            "priority": _int(raw.get("priority")),
+            "base_power": _int(raw.get("basePower")),
+            "accuracy": 100 if accuracy is None else accuracy,
+            "category": str(raw.get("category") or ""),
+            "move_type": raw.get("type"),
+            "target": target,
+            "flags": flags,
+            "crit_ratio": _int(raw.get("critRatio")),
+            "multihit": tuple(multihit) if isinstance(multihit, (list, tuple)) else multihit,
+            "drain": tuple(drain) if isinstance(drain, (list, tuple)) else drain,
+            "secondary": secondary if isinstance(secondary, Mapping) else None,
+            "secondaries": secondaries,
+            "bypass_sub": bool(raw.get("bypassSub")) or "bypasssub" in flags,
+            "contact": "contact" in flags,
+            "sound": "sound" in flags,
+            "punch": "punch" in flags,
+            "protectable": "protect" in flags,
+            "spread": target in _SPREAD_TARGETS,
+            "self_target": target in _SELF_TARGETS,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_entry(cls, key: str, entry: Any) -> "MoveRecord":
+        raw = getattr(entry, "raw", None)
+        if not isinstance(raw, Mapping):
+            raw = entry if isinstance(entry, Mapping) else {}
+        return cls(raw, key=key, entry=entry)
+
+    def __reduce__(self):
+        return (type(self), (self.raw, self.key, self.entry))
+
+    def __copy__(self) -> "MoveRecord":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "MoveRecord":
+        return self
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"<MoveRecord {self.key or self.name!r} priority={self.priority} target={self.target}>"
+
+
+class MoveResolver:
+    """Resolve move names of any spelling to entries of one move dex."""
+
+    def __init__(self, movedex: Mapping[str, Any]):
+        self.movedex = movedex
+        self.signature = _signature(movedex)
+        index: dict[str, str] = {}
+        keys = [str(key) for key in movedex.keys()]
+        for key in keys:
+            index[key] = key
+        for key in keys:
+            index.setdefault(key.lower(), key)
+            index.setdefault(_normalize_key(key), key)
+        self._index = index
+        self._memo: dict[Any, Optional[str]] = {}
+        self._records: dict[str, MoveRecord] = {}
+
+    def key_for(self, name: Any) -> Optional[str]:
+        """Return the dex key ``name`` resolves to, or ``None``."""
+
+        try:
+            return self._memo[name]
+        except KeyError:
+            pass
+        except TypeError:
+            return None
+        index = self._index
+        text = str(name or "")
+        key = None
+        if text:
+            key = index.get(text) or index.get(text.lower()) or index.get(_normalize_key(text))
+        self._memo[name] = key
+        return key
+
+    def get(self, name: Any) -> Any:
+        """Return the dex entry for ``name`` or ``None``."""
+
+        key = self.key_for(name)
+        return self.movedex.get(key) if key is not None else None
+
+    def record(self, name: Any) -> Optional[MoveRecord]:
+        """Return the cached :class:`MoveRecord` for ``name`` or ``None``."""
+
+        key = self.key_for(name)
+        if key is None:
+            return None
+        entry = self.movedex.get(key)
+        if entry is None:
+            return None
+        record = self._records.get(key)
+        if record is None or record.entry is not entry:
+            record = self._records[key] = MoveRecord.from_entry(key, entry)
+        return record
+
+
+def record_for_move(move: Any) -> MoveRecord:
+    """Return ``move.record`` or compile one from ``move.raw`` for plain move objects."""
+
+    record = getattr(move, "record", None)
+    if isinstance(record, MoveRecord):
+        return record
+    return MoveRecord(getattr(move, "raw", None), key=str(getattr(move, "key", None) or ""))
+
+
+_RESOLVERS: dict[int, MoveResolver] = {}
+
+
+def _signature(movedex: Mapping[str, Any]) -> tuple:
+    return (getattr(movedex, "_version", None), len(movedex))
+
+
+def move_resolver(movedex: Optional[Mapping[str, Any]] = None) -> MoveResolver:
+    """Return the shared resolver for ``movedex`` (the global dex by default)."""
+
+    if movedex is None:
+        try:
+            from pokemon.dex import MOVEDEX as movedex
+        except Exception:  # pragma: no cover - dex may be unavailable in tests
+            movedex = {}
+    resolver = _RESOLVERS.get(id(movedex))
+    if resolver is not None and resolver.movedex is movedex and resolver.signature == _signature(movedex):
+        return resolver
+    ensure_movedex_aliases(movedex)
+    if len(_RESOLVERS) >= _MAX_RESOLVERS:
+        _RESOLVERS.clear()
+    resolver = _RESOLVERS[id(movedex)] = MoveResolver(movedex)
+    return resolver
+
+
+def resolve_move(name: Any, movedex: Optional[Mapping[str, Any]] = None) -> Any:
+    """Return the ``movedex`` entry for ``name`` in any spelling."""
+
+    return move_resolver(movedex).get(name)
+
+
+def move_record(name: Any, movedex: Optional[Mapping[str, Any]] = None) -> Optional[MoveRecord]:
+    """Return the precomputed :class:`MoveRecord` for ``name``."""
+
+    return move_resolver(movedex).record(name)
+
+
+def compiled_move_record(
+    key: Any, raw: Optional[Mapping[str, Any]], movedex: Optional[Mapping[str, Any]] = None
+) -> MoveRecord:
+    """Return a record for a move with ``raw`` data.
+
+    The dex entry's shared record is reused when ``raw`` is that entry's data
+    (or an equal copy of it); moves whose data was merged or edited get a
+    private record.
+    """
+
+    shared = move_record(key, movedex) if key else None
+    if shared is not None and (shared.raw is raw or shared.raw == raw):
+        return shared
+    return MoveRecord(raw, key=str(key or ""))
+
+
+__all__ = [
+    "MoveRecord",
+    "MoveResolver",
+    "compiled_move_record",
+    "move_id",
+    "move_record",
+    "move_resolver",
+    "record_for_move",
+    "resolve_move",
+]
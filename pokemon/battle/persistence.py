@@ -55,5 +55,14 @@ class StatePersistenceMixin:
 				state.pop(k, None)
 		return state
 
+	def _record_persisted(self, **parts: Any) -> None:
+		"""Journal ``parts`` on the battle storage, writing them whole if it cannot."""
+		record = getattr(self.storage, "record", None)
+		if callable(record):
+			record(**parts)
+			return
+		for part, value in parts.items():
+			self.storage.set(part, value)
+
 
 __all__ = ["StatePersistenceMixin", "DEFAULT_FLAGS"]
@@ -96,10 +96,21 @@ def create_battle_pokemon(
 	is_wild: bool = False,
 	template_key: str = "",
 	move_names: list[str] | None = None,
+	seed: int | None = None,
+	persist: bool = True,
 ) -> Pokemon:
-	"""Return a ``Pokemon`` battle object for the given species/level."""
+	"""Return a ``Pokemon`` battle object for the given species/level.
 
-	inst = generate_pokemon(species, level=level)
+	``seed`` makes the generated IVs, nature and ability reproducible.  With
+	``persist=False`` no encounter row is written, which offline simulations
+	use to build thousands of throwaway Pokémon.
+	"""
+
+	inst = (
+		generate_pokemon(species, level=level)
+		if seed is None
+		else generate_pokemon(species, level=level, seed=seed)
+	)
 	move_names = list(move_names or getattr(inst, "moves", []) or ["Flail"])
 	moves = [Move(name=m) for m in move_names]
 
@@ -108,22 +119,26 @@ def create_battle_pokemon(
 	nature = getattr(inst, "nature", "Hardy")
 	max_hp = getattr(inst.stats, "hp", level)
 
-	try:
-		encounter = create_encounter_pokemon(
-			species=inst.species.name,
-			level=inst.level,
-			source_kind="wild" if is_wild else "npc",
-			gender=getattr(inst, "gender", "N"),
-			nature=nature,
-			ability=getattr(inst, "ability", ""),
-			ivs=ivs_list,
-			evs=evs_list,
-			current_hp=max_hp,
-			move_names=move_names,
-			npc_trainer=trainer if not is_wild else None,
-			template_key=template_key,
-		)
-	except Exception:
+	encounter = None
+	if persist:
+		try:
+			encounter = create_encounter_pokemon(
+				species=inst.species.name,
+				level=inst.level,
+				source_kind="wild" if is_wild else "npc",
+				gender=getattr(inst, "gender", "N"),
+				nature=nature,
+				ability=getattr(inst, "ability", ""),
+				ivs=ivs_list,
+				evs=evs_list,
+				current_hp=max_hp,
+				move_names=move_names,
+				npc_trainer=trainer if not is_wild else None,
+				template_key=template_key,
+			)
+		except Exception:
+			encounter = None
+	if encounter is None:
 		encounter = SimpleNamespace(current_hp=max_hp, held_item="", encounter_id=None)
 
 	return Pokemon(
@@ -94,6 +94,8 @@ class CallbackRegistry:
 
     def __init__(self) -> None:
         self._callbacks: Dict[str, Callback] = {}
+        # (reference, id(registry)) -> (registry, class, resolved callable)
+        self._resolved: Dict[tuple[str, int], tuple[Any, Any, Callback | None]] = {}
 
     def register(self, key: str, callback: Any, *, registry: Any = None) -> Callback | None:
         """Register a callback under ``key``.
@@ -131,6 +133,11 @@ class CallbackRegistry:
                 registered[key] = resolved
         return registered
 
+    def clear_resolved(self) -> None:
+        """Forget memoized string resolutions, e.g. after a hot reload."""
+
+        self._resolved.clear()
+
     def resolve_compat(self, callback: Any, *, registry: Any = None) -> Callback | Any | None:
         """Compatibility resolver for call sites not yet migrated."""
 
@@ -147,15 +154,25 @@ class CallbackRegistry:
         if not isinstance(callback, str):
             return None
 
+        target_registry = registry or self._default_registry()
+        if target_registry is None:
+            return None
+
+        # Resolutions are memoized per registry module.  A hit is only
+        # trusted while the module still exposes the same class, so reloads
+        # and monkeypatched handler classes resolve afresh.
+        key = (callback, id(target_registry))
+        cached = self._resolved.get(key)
+        if cached is not None and cached[0] is target_registry:
+            class_name = callback.split(".", 1)[0]
+            if getattr(target_registry, class_name, None) is cached[1]:
+                return cached[2]
+
         try:
             reference = CallbackReference.parse(callback)
         except ValueError:
             return None
 
-        target_registry = registry or self._default_registry()
-        if target_registry is None:
-            return None
-
         cls = getattr(target_registry, reference.class_name, None)
         if cls is None:
             return None
@@ -164,7 +181,9 @@ class CallbackRegistry:
         except Exception:
             obj = cls
         method = getattr(obj, reference.method_name, None)
-        return method if callable(method) else None
+        method = method if callable(method) else None
+        self._resolved[key] = (target_registry, cls, method)
+        return method
 
     @staticmethod
     def _default_registry() -> Any:
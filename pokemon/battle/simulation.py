@@ -0,0 +1,270 @@
+"""Headless battle simulation for balance testing.
+
+:func:`simulate_battle` builds a :class:`Battle` from two teams of
+:class:`~pokemon.battle.tests.outcome_harness.PokemonSpec` (species, level,
+moves and optional ability/item), lets the AI pick every action for both
+sides and runs turns until one side loses.  Pokémon come from
+:func:`~pokemon.battle.pokemon_factory.create_battle_pokemon` without
+writing encounter rows, the battle log is discarded and every random roll
+(including callbacks that still use the :mod:`random` module) is drawn from
+generators seeded per battle, so a seed always replays the same battle.
+
+:func:`simulate_batch` runs many seeds, optionally fanned out across a
+:class:`~concurrent.futures.ProcessPoolExecutor`, and returns a
+:class:`BatchReport` with win rates, average turns and throughput.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence
+
+from .engine import Battle, BattleParticipant, BattleType
+from .pokemon_factory import create_battle_pokemon
+from .tests.outcome_harness import PokemonSpec
+
+DEFAULT_MAX_TURNS = 200
+SIDES = ("A", "B")
+_BATTLE_LOGGER = logging.getLogger("battle")
+
+
+class HeadlessBattle(Battle):
+    """Battle that skips message formatting and logging."""
+
+    def log_action(self, message: str) -> None:
+        return None
+
+    def _format_default_message(self, key, replacements, fallback=None):
+        return None
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """Outcome of one simulated battle."""
+
+    seed: int
+    winner: Optional[str]
+    turns: int
+    truncated: bool = False
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    """Aggregated outcome of a batch of simulated battles."""
+
+    battles: int
+    wins: dict[str, int]
+    draws: int
+    truncated: int
+    total_turns: int
+    elapsed: float
+
+    def win_rate(self, side: str) -> float:
+        return self.wins.get(side, 0) / self.battles if self.battles else 0.0
+
+    @property
+    def average_turns(self) -> float:
+        return self.total_turns / self.battles if self.battles else 0.0
+
+    @property
+    def battles_per_second(self) -> float:
+        return self.battles / self.elapsed if self.elapsed > 0 else 0.0
+
+    def format(self) -> str:
+        lines = [f"Battles: {self.battles}"]
+        for side in SIDES:
+            lines.append(f"  {side} wins: {self.wins.get(side, 0)} ({self.win_rate(side):.1%})")
+        lines.append(f"  Draws: {self.draws} (turn limit: {self.truncated})")
+        lines.append(f"Average turns: {self.average_turns:.2f}")
+        lines.append(f"Battles/second: {self.battles_per_second:.1f}")
+        return "\n".join(lines)
+
+    @classmethod
+    def from_results(cls, results: Sequence[SimulationResult], elapsed: float) -> "BatchReport":
+        wins = {side: 0 for side in SIDES}
+        for result in results:
+            if result.winner in wins:
+                wins[result.winner] += 1
+        return cls(
+            battles=len(results),
+            wins=wins,
+            draws=sum(1 for result in results if result.winner is None),
+            truncated=sum(1 for result in results if result.truncated),
+            total_turns=sum(result.turns for result in results),
+            elapsed=elapsed,
+        )
+
+
+@contextmanager
+def quiet_battle_logs() -> Iterator[None]:
+    """Silence the ``battle`` logger for the duration of a simulation."""
+
+    previous = _BATTLE_LOGGER.disabled
+    _BATTLE_LOGGER.disabled = True
+    try:
+        yield
+    finally:
+        _BATTLE_LOGGER.disabled = previous
+
+
+@contextmanager
+def seeded_global_random(seed: int) -> Iterator[None]:
+    """Seed the :mod:`random` module for callbacks that bypass ``battle.rng``."""
+
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+def _move_name(move) -> str:
+    return str(getattr(move, "name", move))
+
+
+def build_team(specs: Sequence[PokemonSpec], rng: random.Random) -> list:
+    """Return battle Pokémon for ``specs`` with seeded IVs, nature and ability."""
+
+    team = []
+    for spec in specs:
+        pokemon = create_battle_pokemon(
+            spec.name,
+            spec.level,
+            move_names=[_move_name(move) for move in spec.moves] or None,
+            seed=rng.getrandbits(32),
+            persist=False,
+        )
+        if spec.ability:
+            pokemon.ability = spec.ability
+        if spec.item:
+            pokemon.item = spec.item
+        if spec.status:
+            pokemon.status = spec.status
+        for key, value in spec.extra.items():
+            setattr(pokemon, key, value)
+        team.append(pokemon)
+    return team
+
+
+def build_simulated_battle(
+    team_a: Sequence[PokemonSpec],
+    team_b: Sequence[PokemonSpec],
+    *,
+    seed: int = 0,
+    battle_type: BattleType = BattleType.TRAINER,
+    profiles: Sequence[Optional[str]] = (None, None),
+) -> HeadlessBattle:
+    """Return a started AI-vs-AI battle for one seed."""
+
+    rng = random.Random(seed)
+    participants = []
+    for side, specs, profile in zip(SIDES, (team_a, team_b), profiles):
+        participant = BattleParticipant(side, build_team(specs, rng), is_ai=True)
+        if profile:
+            participant.ai_profile = profile
+        participants.append(participant)
+    battle = HeadlessBattle(battle_type, participants, rng=random.Random(rng.getrandbits(64)))
+    battle.award_xp = False
+    battle.award_txp = False
+    battle.start_battle()
+    return battle
+
+
+def simulate_battle(
+    team_a: Sequence[PokemonSpec],
+    team_b: Sequence[PokemonSpec],
+    *,
+    seed: int = 0,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    battle_type: BattleType = BattleType.TRAINER,
+    profiles: Sequence[Optional[str]] = (None, None),
+) -> SimulationResult:
+    """Run one battle to completion and return its outcome.
+
+    Battles still running after ``max_turns`` are scored as truncated draws.
+    """
+
+    with quiet_battle_logs(), seeded_global_random(seed):
+        battle = build_simulated_battle(
+            team_a, team_b, seed=seed, battle_type=battle_type, profiles=profiles
+        )
+        while not battle.battle_over and battle.turn_count < max_turns:
+            battle.run_turn()
+        winner = battle.check_victory() if battle.battle_over else None
+    return SimulationResult(
+        seed=seed,
+        winner=getattr(winner, "name", None),
+        turns=battle.turn_count,
+        truncated=not battle.battle_over,
+    )
+
+
+def _simulate_seeds(team_a, team_b, seeds, max_turns, battle_type, profiles) -> list[SimulationResult]:
+    return [
+        simulate_battle(
+            team_a,
+            team_b,
+            seed=seed,
+            max_turns=max_turns,
+            battle_type=battle_type,
+            profiles=profiles,
+        )
+        for seed in seeds
+    ]
+
+
+def simulate_batch(
+    team_a: Sequence[PokemonSpec],
+    team_b: Sequence[PokemonSpec],
+    *,
+    battles: int = 100,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    battle_type: BattleType = BattleType.TRAINER,
+    profiles: Sequence[Optional[str]] = (None, None),
+) -> BatchReport:
+    """Simulate ``battles`` seeded battles and aggregate the outcomes.
+
+    Battle ``i`` uses seed ``seed + i``, so a report is reproducible for any
+    worker count.  ``workers`` defaults to the CPU count; ``workers=1`` runs
+    in this process.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    seeds = list(range(seed, seed + battles))
+    args = (tuple(team_a), tuple(team_b))
+    options = (max_turns, battle_type, tuple(profiles))
+    start = time.perf_counter()
+    if workers <= 1 or battles <= 1:
+        results = _simulate_seeds(*args, seeds, *options)
+    else:
+        size = chunk_size or max(1, -(-battles // (workers * 4)))
+        chunks = [seeds[index : index + size] for index in range(0, battles, size)]
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_simulate_seeds, *args, chunk, *options) for chunk in chunks]
+            for future in futures:
+                results.extend(future.result())
+    return BatchReport.from_results(results, time.perf_counter() - start)
+
+
+__all__ = [
+    "BatchReport",
+    "HeadlessBattle",
+    "SimulationResult",
+    "build_simulated_battle",
+    "build_team",
+    "quiet_battle_logs",
+    "seeded_global_random",
+    "simulate_batch",
+    "simulate_battle",
+]
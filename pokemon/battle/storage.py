@@ -1,31 +1,188 @@
-"""Utility for storing per-battle data on rooms."""
+"""Battle persistence on room attributes."""
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Mapping, MutableSequence, MutableSet
+from typing import Any, Dict, List, Tuple
+
+# Parts written as a checkpoint plus a journal of per-turn deltas.
+JOURNALED_PARTS = ("data", "state")
+# Journal entries kept before they are folded into a fresh checkpoint.
+JOURNAL_COMPACT_EVERY = 10
+
+
+def plain(value: Any) -> Any:
+	"""Return ``value`` with attribute containers turned into builtins."""
+	if isinstance(value, Mapping):
+		return {key: plain(val) for key, val in value.items()}
+	if isinstance(value, MutableSequence):
+		return [plain(val) for val in value]
+	if isinstance(value, tuple):
+		return tuple(plain(val) for val in value)
+	if isinstance(value, MutableSet):
+		return {plain(val) for val in value}
+	return value
+
+
+def diff(old: Any, new: Any, path: Tuple = ()) -> List[Tuple]:
+	"""Return the operations turning ``old`` into ``new``.
+
+	Dicts are compared key by key and equal-length lists index by index, so
+	a changed HP value or PP count is recorded as a single ``(path, value)``
+	operation; removed keys are recorded as ``(path,)``.
+	"""
+	ops: List[Tuple] = []
+	if isinstance(old, dict) and isinstance(new, dict):
+		for key, value in new.items():
+			if key in old:
+				ops.extend(diff(old[key], value, path + (key,)))
+			else:
+				ops.append((path + (key,), value))
+		ops.extend((path + (key,),) for key in old if key not in new)
+	elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+		for index, (before, after) in enumerate(zip(old, new)):
+			ops.extend(diff(before, after, path + (index,)))
+	elif type(old) is not type(new) or old != new:
+		ops.append((path, new))
+	return ops
+
+
+def apply_diff(doc: Any, ops) -> Any:
+	"""Apply ``ops`` from :func:`diff` to ``doc`` in place and return it."""
+	for op in ops:
+		path = tuple(op[0])
+		if not path:
+			doc = copy.deepcopy(op[1])
+			continue
+		target = doc
+		for key in path[:-1]:
+			target = target[key]
+		if len(op) > 1:
+			target[path[-1]] = copy.deepcopy(op[1])
+		else:
+			del target[path[-1]]
+	return doc
+
 
 class BattleDataWrapper:
-	"""Helper to read and write battle data parts on a room."""
+	"""Helper to read and write battle data parts on a room.
+
+	The ``data`` and ``state`` parts are persisted as a checkpoint plus an
+	append-only journal: :meth:`record` writes only the changes since the
+	previous write as a new ``journal_<n>`` attribute and folds the journal
+	into a fresh checkpoint every :data:`JOURNAL_COMPACT_EVERY` entries.
+	:meth:`load` replays the journal over the checkpoint.
+	"""
 
 	def __init__(self, room, battle_id: int) -> None:
 		self.room = room
 		self.battle_id = battle_id
+		self._shadow: Dict[str, Any] = {}
+		self._journal_length: int | None = None
 
 	def _key(self, part: str) -> str:
 		return f"battle_{self.battle_id}_{part}"
 
 	def get(self, part: str, default=None):
-		"""Return the stored value for ``part`` or ``default``."""
+		"""Return the stored value for ``part`` or ``default``.
+
+		Journaled parts with pending entries are returned replayed.
+		"""
+		if part in JOURNALED_PARTS and self.journal_length():
+			value = self.load()[JOURNALED_PARTS.index(part)]
+			return default if value is None else value
+		return self._get(part, default)
+
+	def _get(self, part: str, default=None):
 		return getattr(self.room.db, self._key(part), default)
 
 	def set(self, part: str, value) -> None:
 		"""Store ``value`` for ``part`` on the room."""
+		if part in JOURNALED_PARTS:
+			self.checkpoint(**{part: value})
+			return
 		setattr(self.room.db, self._key(part), value)
 
 	def delete(self, part: str) -> None:
 		"""Remove stored ``part`` if present."""
+		if part in JOURNALED_PARTS:
+			self._shadow.pop(part, None)
+			self._clear_journal()
 		key = self._key(part)
 		if hasattr(self.room.db, key):
 			delattr(self.room.db, key)
 
+	# ------------------------------------------------------------------
+	# Journal
+	# ------------------------------------------------------------------
+	@staticmethod
+	def _entry(index: int) -> str:
+		return f"journal_{index}"
+
+	def journal_length(self) -> int:
+		"""Return the number of journal entries above the checkpoint."""
+		if self._journal_length is None:
+			length = 0
+			while self._get(self._entry(length + 1)) is not None:
+				length += 1
+			self._journal_length = length
+		return self._journal_length
+
+	def _clear_journal(self) -> None:
+		for index in range(1, self.journal_length() + 1):
+			key = self._key(self._entry(index))
+			if hasattr(self.room.db, key):
+				delattr(self.room.db, key)
+		self._journal_length = 0
+
+	def checkpoint(self, **parts) -> None:
+		"""Write ``parts`` in full and fold any pending journal into them.
+
+		Journaled parts not given are rewritten from their last recorded
+		value when journal entries are pending, since those entries are
+		dropped with the rest of the journal.
+		"""
+		if self.journal_length():
+			for part, value in self._shadow.items():
+				parts.setdefault(part, value)
+		for part, value in parts.items():
+			setattr(self.room.db, self._key(part), value)
+			self._shadow[part] = plain(value)
+		self._clear_journal()
+
+	def record(self, **parts) -> None:
+		"""Journal the changes in ``parts`` since they were last written."""
+		if any(part not in self._shadow for part in parts):
+			self.checkpoint(**parts)
+			return
+		changes = {}
+		for part, value in parts.items():
+			ops = diff(self._shadow[part], value)
+			if ops:
+				changes[part] = ops
+		if not changes:
+			return
+		if self.journal_length() >= JOURNAL_COMPACT_EVERY:
+			self.checkpoint(**parts)
+			return
+		self._journal_length = self.journal_length() + 1
+		setattr(self.room.db, self._key(self._entry(self._journal_length)), changes)
+		for part, ops in changes.items():
+			self._shadow[part] = apply_diff(self._shadow[part], ops)
+
+	def load(self) -> Tuple[Any, Any]:
+		"""Return the ``data`` and ``state`` parts with the journal replayed."""
+		values = {part: plain(self._get(part)) for part in JOURNALED_PARTS}
+		for index in range(1, self.journal_length() + 1):
+			changes = self._get(self._entry(index)) or {}
+			for part, ops in changes.items():
+				if values.get(part) is not None:
+					values[part] = apply_diff(values[part], ops)
+		self._shadow = {
+			part: copy.deepcopy(value) for part, value in values.items() if value is not None
+		}
+		return values["data"], values["state"]
+
 
-__all__ = ["BattleDataWrapper"]
+__all__ = ["BattleDataWrapper", "JOURNAL_COMPACT_EVERY", "apply_diff", "diff", "plain"]
@@ -27,3 +27,53 @@ def test_registry_rejects_invalid_string_reference():
 
     assert cb is None
     assert registry.get("bad") is None
+
+
+def test_registry_memoizes_compat_resolution_until_class_changes():
+    registry = CallbackRegistry()
+
+    first = registry.resolve_compat("Demo.run", registry=_StubCallbacks)
+    assert registry.resolve_compat("Demo.run", registry=_StubCallbacks) is first
+
+    original = _StubCallbacks.Demo
+
+    class Replacement:
+        def run(self):
+            return "patched"
+
+    _StubCallbacks.Demo = Replacement
+    try:
+        assert registry.resolve_compat("Demo.run", registry=_StubCallbacks)() == "patched"
+    finally:
+        _StubCallbacks.Demo = original
+
+    registry.clear_resolved()
+    assert registry.resolve_compat("Demo.run", registry=_StubCallbacks) is not first
+
+
+def test_module_resolution_cache_and_dex_warm_up(monkeypatch):
+    import sys
+    import types
+
+    from pokemon.battle import callbacks
+
+    module = types.ModuleType("fusion_test_callbacks")
+    module.Demo = _StubCallbacks.Demo
+    monkeypatch.setitem(sys.modules, "fusion_test_callbacks", module)
+    callbacks.clear_callback_cache()
+
+    first = callbacks.resolve_callback_from_modules("Demo.run", "fusion_test_callbacks")
+    assert first() == "ok"
+    assert callbacks.resolve_callback_from_modules("Demo.run", ["fusion_test_callbacks"]) is first
+
+    replacement = types.ModuleType("fusion_test_callbacks")
+    monkeypatch.setitem(sys.modules, "fusion_test_callbacks", replacement)
+    assert not callable(callbacks.resolve_callback_from_modules("Demo.run", "fusion_test_callbacks"))
+
+    replacement.Demo = _StubCallbacks.Demo
+    monkeypatch.setattr(callbacks, "_DEX_CALLBACK_MODULES", {"MOVEDEX": ("fusion_test_callbacks",)})
+    dex = types.SimpleNamespace(
+        MOVEDEX={"demo": types.SimpleNamespace(raw={"onHit": "Demo.run", "condition": {"onStart": "Demo.run"}})}
+    )
+    assert callbacks.warm_callback_cache(dex) == 2
+    callbacks.clear_callback_cache()
@@ -0,0 +1,197 @@
+"""Tests for the precompiled ``runEvent`` handler index."""
+
+from __future__ import annotations
+
+from .helpers import build_battle, load_modules
+
+
+class _Probe:
+    """Effect holder recording which probe hooks were invoked."""
+
+    def __init__(self):
+        self.calls = []
+
+    def onProbe(self, target, source, effect, **kwargs):
+        self.calls.append("onProbe")
+
+    def onSourceProbe(self, target, source, effect, **kwargs):
+        self.calls.append("onSourceProbe")
+
+    def onFoeProbe(self, target, source, effect, **kwargs):
+        self.calls.append("onFoeProbe")
+
+    def onAnyProbe(self, *args, **kwargs):
+        self.calls.append("onAnyProbe")
+
+
+class _ProbeItem(_Probe):
+    raw = {}
+
+
+class _DynamicHolder:
+    """Holder answering every hook through ``__getattr__``."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        if not name.startswith("on"):
+            raise AttributeError(name)
+
+        def hook(*args, **kwargs):
+            self.calls.append(name)
+
+        return hook
+
+
+def _count_holder_walks(battle):
+    calls = []
+    original = battle._event_scoped_holders
+
+    def counted(*args, **kwargs):
+        calls.append(kwargs)
+        return original(*args, **kwargs)
+
+    battle._event_scoped_holders = counted
+    return calls
+
+
+def test_no_subscriber_events_return_without_walking_holders():
+    battle, attacker, defender = build_battle()
+    battle.runEvent("Probe", defender, attacker)
+    walks = _count_holder_walks(battle)
+
+    assert battle.runEvent("Probe", defender, attacker) is True
+    assert battle.runEvent("Probe", defender, attacker, None, 42) == 42
+    assert battle.runEvent("Probe") is True
+    assert walks == []
+
+
+def test_disabled_index_matches_indexed_results():
+    battle, attacker, defender = build_battle()
+    indexed = (battle.runEvent("Probe", defender, attacker), battle.runEvent("Probe", defender, attacker, None, 7))
+    battle.event_index_enabled = False
+    legacy = (battle.runEvent("Probe", defender, attacker), battle.runEvent("Probe", defender, attacker, None, 7))
+
+    assert indexed == legacy == (True, 7)
+
+
+def test_add_and_remove_volatile_refresh_index():
+    battle, attacker, defender = build_battle()
+    probe = _Probe()
+    battle._volatile_handler = lambda name: probe if name == "probe" else None
+    battle.runEvent("Probe", defender, attacker)
+
+    assert battle.add_volatile(defender, "probe")
+    battle.runEvent("Probe", defender, attacker)
+    assert probe.calls == ["onProbe", "onAnyProbe"]
+
+    assert battle.remove_volatile(defender, "probe")
+    battle.runEvent("Probe", defender, attacker)
+    assert probe.calls == ["onProbe", "onAnyProbe"]
+
+
+def test_in_place_callback_mutation_refreshes_index():
+    battle, attacker, defender = build_battle()
+    probe = _Probe()
+    battle._volatile_handler = lambda name: probe if name == "probe" else None
+    battle.runEvent("Probe", defender, attacker)
+
+    defender.volatiles["probe"] = {"id": "probe"}
+    battle.runEvent("Probe", defender, attacker)
+    assert probe.calls == ["onProbe", "onAnyProbe"]
+
+    defender.volatiles.pop("probe")
+    battle.runEvent("Probe", defender, attacker)
+    assert probe.calls == ["onProbe", "onAnyProbe"]
+
+
+def test_set_ability_and_set_item_refresh_index():
+    battle, attacker, defender = build_battle()
+    ability = _Probe()
+    item = _ProbeItem()
+    battle.runEvent("Probe", defender, attacker)
+
+    battle.set_ability(defender, ability)
+    battle.runEvent("Probe", defender, attacker)
+    assert ability.calls == ["onProbe", "onAnyProbe"]
+
+    assert battle.set_item(attacker, item)
+    battle.runEvent("Probe", defender, attacker)
+    assert item.calls == ["onSourceProbe", "onAnyProbe"]
+
+
+def test_side_and_slot_conditions_refresh_index():
+    battle, attacker, defender = build_battle()
+    probe = _Probe()
+    battle._lookup_effect = lambda name: probe if name == "probe" else None
+    battle._invalidate_event_index()
+    battle.runEvent("Probe", defender, attacker)
+
+    assert battle.add_side_condition(battle.participants[1], "probe", {})
+    battle.runEvent("Probe", defender, attacker)
+    assert probe.calls == ["onProbe", "onAnyProbe"]
+
+    assert battle.remove_side_condition(battle.participants[1], "probe")
+    assert battle.add_slot_condition(defender, "probe", {})
+    battle.runEvent("Probe", defender, attacker)
+    assert probe.calls == ["onProbe", "onAnyProbe"] * 2
+
+    assert battle.remove_slot_condition(defender, "probe")
+    battle.runEvent("Probe", defender, attacker)
+    assert probe.calls == ["onProbe", "onAnyProbe"] * 2
+
+
+def test_relation_hooks_are_filtered_per_holder():
+    modules = load_modules()
+    Pokemon = modules["Pokemon"]
+    Battle = modules["Battle"]
+    BattleParticipant = modules["BattleParticipant"]
+    BattleType = modules["BattleType"]
+
+    lead = Pokemon("Lead", level=50, hp=200, max_hp=200)
+    partner = Pokemon("Partner", level=50, hp=200, max_hp=200)
+    foe = Pokemon("Foe", level=50, hp=200, max_hp=200)
+    allies = BattleParticipant("P1", [lead, partner])
+    allies.active = [lead, partner]
+    foes = BattleParticipant("P2", [foe])
+    foes.active = [foe]
+    battle = Battle(BattleType.WILD, [allies, foes])
+
+    partner_probe = _Probe()
+    foe_probe = _Probe()
+    partner.ability = partner_probe
+    foe.ability = foe_probe
+
+    battle.runEvent("Probe", lead, None)
+    assert partner_probe.calls == ["onAnyProbe"]
+    assert foe_probe.calls == ["onFoeProbe", "onAnyProbe"]
+
+    battle.runEvent("Probe", lead, foe)
+    assert foe_probe.calls == ["onFoeProbe", "onAnyProbe", "onSourceProbe", "onAnyProbe"]
+
+
+def test_dynamic_getattr_holders_are_always_dispatched():
+    battle, attacker, defender = build_battle()
+    holder = _DynamicHolder()
+    battle.set_ability(defender, holder)
+    holder.calls.clear()
+
+    battle.runEvent("Anything", defender, attacker)
+
+    assert "onAnything" in holder.calls
+
+
+def test_benched_target_effects_are_not_cached():
+    battle, attacker, defender = build_battle()
+    modules = load_modules()
+    bench = modules["Pokemon"]("Bench", level=50, hp=200, max_hp=200)
+    battle.participants[1].pokemons.append(bench)
+    probe = _Probe()
+    battle._pokemon_status_handler = lambda pokemon: probe if getattr(pokemon, "status", None) == "probe" else None
+
+    battle.runEvent("Probe", bench, attacker)
+    bench.status = "probe"
+    battle.runEvent("Probe", bench, attacker)
+
+    assert probe.calls == ["onProbe", "onAnyProbe"]
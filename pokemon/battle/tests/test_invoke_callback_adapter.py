@@ -0,0 +1,89 @@
+"""Tests for the compiled argument adapters behind ``invoke_callback``."""
+
+from __future__ import annotations
+
+from pokemon.battle import callbacks
+from pokemon.battle.callbacks import invoke_callback
+
+
+class _Handler:
+    def two_args(self, target, source):
+        return (target, source)
+
+    def keyword_battle(self, target, battle=None):
+        return (target, battle)
+
+    def any_keywords(self, target, **kwargs):
+        return (target, sorted(kwargs))
+
+    def raises_type_error(self, target, source=None):
+        if source is not None:
+            raise TypeError("body failure")
+        return target
+
+
+def test_adapter_trims_positional_and_keyword_arguments():
+    handler = _Handler()
+
+    assert invoke_callback(handler.two_args, 1, 2, 3, battle="b") == (1, 2)
+    assert invoke_callback(handler.keyword_battle, 1, battle="b", effect_state={}) == (1, "b")
+    assert invoke_callback(handler.any_keywords, 1, battle="b", effect_state={}) == (1, ["battle", "effect_state"])
+
+
+def test_adapter_is_compiled_once_per_callable_and_shape(monkeypatch):
+    handler = _Handler()
+    compiled = []
+    original = callbacks._compile_plan
+
+    def counting(*args, **kwargs):
+        compiled.append(args[1:])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(callbacks, "_compile_plan", counting)
+    for _ in range(3):
+        invoke_callback(handler.keyword_battle, 1, battle="b")
+        invoke_callback(_Handler().keyword_battle, 1, battle="b")
+
+    assert compiled == [(1, ("battle",))]
+
+
+def test_type_errors_from_callback_bodies_use_legacy_retries():
+    callbacks.LEGACY_FALLBACKS.clear()
+    handler = _Handler()
+
+    assert invoke_callback(handler.raises_type_error, "target", "source") == "target"
+    assert callbacks.legacy_fallback_counts() == {"_Handler.raises_type_error": 1}
+
+
+def test_callables_without_signatures_are_counted_as_legacy():
+    callbacks.LEGACY_FALLBACKS.clear()
+
+    assert invoke_callback(max, 3, 5) == 5
+    assert callbacks.legacy_fallback_counts() == {"max": 1}
+
+
+def test_adapter_matches_legacy_layouts():
+    def none():
+        return ()
+
+    def one(a):
+        return (a,)
+
+    def kw_only(a, *, battle=None):
+        return (a, battle)
+
+    def varargs(*args, effect_state=None):
+        return (args, effect_state)
+
+    shapes = [((), {}), ((1,), {}), ((1, 2, 3), {}), ((1, 2), {"battle": "b"}), ((), {"battle": "b", "effect_state": 5})]
+    for func in (none, one, kw_only, varargs):
+        for args, kwargs in shapes:
+            try:
+                expected = callbacks._invoke_legacy(func, args, dict(kwargs))
+            except TypeError:
+                expected = TypeError
+            try:
+                actual = invoke_callback(func, *args, **kwargs)
+            except TypeError:
+                actual = TypeError
+            assert actual == expected, (func.__name__, args, kwargs)
@@ -10,6 +10,7 @@ maintain.
 from __future__ import annotations
 
 import traceback
+from contextlib import nullcontext
 
 from utils.safe_import import safe_import
 
@@ -75,6 +76,14 @@ class TurnManager:
 		turn_no = self._turn_number(upcoming=upcoming)
 		self.notify(format_turn_banner(turn_no, closing=not upcoming))
 
+	def _watcher_turn_batch(self):
+		"""Return a context coalescing watcher notifications for one turn."""
+
+		batch = getattr(self, "watcher_batch", None)
+		if callable(batch):
+			return batch()
+		return nullcontext()
+
 	def _render_interfaces(self) -> None:
 		"""Render and broadcast battle interfaces to participants and watchers."""
 
@@ -85,14 +94,13 @@ class TurnManager:
 				log_warn("Failed to display battle interface", exc_info=True)
 
 	def _persist_turn_state(self) -> None:
-		"""Persist the current turn's data and state to backing storage."""
+		"""Journal the changes to the turn's data and state in backing storage."""
 
 		if getattr(self, "storage", None):
 			try:
-				self.storage.set("data", self.logic.data.to_dict())
-				self.storage.set(
-					"state",
-					self._compact_state_for_persist(self.logic.state.to_dict()),
+				self._record_persisted(
+					data=self.logic.data.to_dict(),
+					state=self._compact_state_for_persist(self.logic.state.to_dict()),
 				)
 			except Exception:
 				log_warn("Failed to persist battle state", exc_info=True)
@@ -215,75 +223,76 @@ class TurnManager:
 			except Exception:
 				pass
 		self._set_player_control(False)
-		self._notify_turn_banner(upcoming=True)
 		battle_finished = False
-		try:
-			self.battle.run_turn()
-		except Exception:
-			err_txt = traceback.format_exc()
-			self.turn_state["error"] = err_txt
-			if callable(debug_hook):
-				try:
-					debug_hook(event="turn_error", error=err_txt)
-				except Exception:
-					pass
-			log_err(
-				f"Error while running turn for battle {self.battle_id}:\n{err_txt}",
-				exc_info=False,
-			)
-			self.notify(f"Battle error:\n{err_txt}")
-		else:
-			self._sync_active_battle_state()
-			battle = self.battle
-			roster_size = 0
-			winner = None
-			if battle and getattr(battle, "participants", None):
-				try:
-					roster_size = sum(len(getattr(part, "pokemons", [])) for part in battle.participants)
-				except Exception:
-					roster_size = 0
-			if battle:
-				try:
-					if hasattr(battle, "check_win_conditions"):
-						winner = battle.check_win_conditions()
-						battle_finished = getattr(battle, "battle_over", False) or bool(winner)
-					else:
-						battle_finished = getattr(battle, "battle_over", False)
-				except Exception:
-					log_warn("Failed to evaluate battle win conditions", exc_info=True)
-					battle_finished = getattr(battle, "battle_over", False)
-				if roster_size <= 0 and not winner:
-					battle_finished = False
-			log_info(f"Finished turn {getattr(self.battle, 'turn_count', '?')} for battle {self.battle_id}")
-			self.turn_state.pop("error", None)
-			if self.state:
-				# Keep the battle state in sync with the engine's turn counter so
-				# interfaces relying on ``state.turn`` reflect the current turn.
-				self.state.turn = getattr(self.battle, "turn_count", self.state.turn)
-			if self.data and getattr(self.data, "battle", None):
-				self.data.battle.turn = getattr(self.battle, "turn_count", self.data.battle.turn)
-			self._notify_turn_banner()
-			if callable(debug_hook):
-				try:
-					debug_hook(event="turn_finished")
-				except Exception:
-					pass
-			if battle_finished:
-				result_hook = getattr(self, "_handle_battle_result", None)
-				if callable(result_hook):
+		winner = None
+		with self._watcher_turn_batch():
+			self._notify_turn_banner(upcoming=True)
+			try:
+				self.battle.run_turn()
+			except Exception:
+				err_txt = traceback.format_exc()
+				self.turn_state["error"] = err_txt
+				if callable(debug_hook):
+					try:
+						debug_hook(event="turn_error", error=err_txt)
+					except Exception:
+						pass
+				log_err(
+					f"Error while running turn for battle {self.battle_id}:\n{err_txt}",
+					exc_info=False,
+				)
+				self.notify(f"Battle error:\n{err_txt}")
+			else:
+				self._sync_active_battle_state()
+				battle = self.battle
+				roster_size = 0
+				if battle and getattr(battle, "participants", None):
+					try:
+						roster_size = sum(len(getattr(part, "pokemons", [])) for part in battle.participants)
+					except Exception:
+						roster_size = 0
+				if battle:
 					try:
-						result_hook(winner)
+						if hasattr(battle, "check_win_conditions"):
+							winner = battle.check_win_conditions()
+							battle_finished = getattr(battle, "battle_over", False) or bool(winner)
+						else:
+							battle_finished = getattr(battle, "battle_over", False)
 					except Exception:
-						log_warn("Failed to apply battle result hook", exc_info=True)
-				if hasattr(self, "end"):
+						log_warn("Failed to evaluate battle win conditions", exc_info=True)
+						battle_finished = getattr(battle, "battle_over", False)
+					if roster_size <= 0 and not winner:
+						battle_finished = False
+				log_info(f"Finished turn {getattr(self.battle, 'turn_count', '?')} for battle {self.battle_id}")
+				self.turn_state.pop("error", None)
+				if self.state:
+					# Keep the battle state in sync with the engine's turn counter so
+					# interfaces relying on ``state.turn`` reflect the current turn.
+					self.state.turn = getattr(self.battle, "turn_count", self.state.turn)
+				if self.data and getattr(self.data, "battle", None):
+					self.data.battle.turn = getattr(self.battle, "turn_count", self.data.battle.turn)
+				self._notify_turn_banner()
+				if callable(debug_hook):
 					try:
-						self.end()  # type: ignore[misc]
+						debug_hook(event="turn_finished")
 					except Exception:
-						log_err(
-							f"Failed to finalize battle {self.battle_id}",
-							exc_info=True,
-						)
-					return
+						pass
+		if battle_finished:
+			result_hook = getattr(self, "_handle_battle_result", None)
+			if callable(result_hook):
+				try:
+					result_hook(winner)
+				except Exception:
+					log_warn("Failed to apply battle result hook", exc_info=True)
+			if hasattr(self, "end"):
+				try:
+					self.end()  # type: ignore[misc]
+				except Exception:
+					log_err(
+						f"Failed to finalize battle {self.battle_id}",
+						exc_info=True,
+					)
+				return
 
 		if self.state:
 			self.state.declare.clear()
@@ -18,6 +18,7 @@ try:
                 get_raw,
                 reset_tempvals,
         )
+        from .moveindex import move_record
 except Exception:  # pragma: no cover - fallback when helper unavailable
 
         def _normalize_key(name: str) -> str:  # type: ignore[misc]
@@ -33,6 +34,9 @@ except Exception:  # pragma: no cover - fallback when helper unavailable
                 if hasattr(pokemon, "tempvals"):
                         pokemon.tempvals = {}
 
+        def move_record(name, movedex=None):  # type: ignore[misc]
+                return None
+
 ensure_movedex_aliases(MOVEDEX)
 from .battledata import TurnInit
 from .random_source import RandomSource, resolve_rng
@@ -54,10 +58,8 @@ class _Priority:
 		elif turndata.recharge is not None:
 			self.priority = 6
 		elif turndata.attack:
-			ensure_movedex_aliases(MOVEDEX)
-			move_entry = MOVEDEX.get(_normalize_key(turndata.attack.move))
-			raw = get_raw(move_entry)
-			self.priority = raw.get("priority", 0) if raw else 0
+			record = move_record(turndata.attack.move, MOVEDEX)
+			self.priority = record.priority if record else 0
 		else:
 			self.priority = 0
 
@@ -8,6 +8,7 @@ from typing import Any, List, Mapping, Optional, cast
 from utils.safe_import import safe_import
 
 from ._shared import _normalize_key
+from .moveindex import move_record
 from .actions import Action, ActionType
 from .contracts import BattleContextProtocol, CombatPokemonProtocol, ParticipantAdapter, ParticipantProtocol
 from .random_source import resolve_rng
@@ -347,13 +348,15 @@ class TurnProcessor:
 				cb = getattr(move, "priorityChargeCallback", None)
 				if cb is None:
 					move_key = getattr(move, "key", None) or _normalize_key(getattr(move, "name", ""))
-					entry = MOVEDEX.get(move_key)
-					raw = getattr(entry, "raw", None) or getattr(move, "raw", {})
+					record = move_record(move_key, MOVEDEX)
+					raw = (record.raw if record else None) or getattr(move, "raw", {})
 					cb_name = raw.get("priorityChargeCallback") if isinstance(raw, dict) else None
-					try:
-						from pokemon.dex.functions.moves_funcs import __dict__ as moves_registry
-					except Exception:
-						moves_registry = None
+					moves_registry = None
+					if cb_name:
+						try:
+							from pokemon.dex.functions.moves_funcs import __dict__ as moves_registry
+						except Exception:
+							moves_registry = None
 					if cb_name and moves_registry:
 						from .callbacks import _resolve_callback
 						cb = _resolve_callback(cb_name, registry=safe_import("pokemon.dex.functions.moves_funcs"))
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Optional, Union, Iterable
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from .compat import log_info, search_object
 from .state import BattleState
@@ -35,7 +36,86 @@ def remove_watcher(state: BattleState, watcher) -> None:
                 state.watchers.discard(getattr(watcher, "id", 0))
 
 
-def notify_watchers(state: Union[BattleState, dict], message: str, room=None) -> None:
+class WatcherCache:
+        """Resolved watcher objects for one battle session.
+
+        Resolving ``#id`` references and reading ``battle_ignore_notify`` hits
+        the database, so both are done once per watcher and kept until the
+        watcher joins, leaves or :meth:`refresh` is called.  While a batch is
+        open, messages are queued per watcher and sent as one block by
+        :meth:`flush`.
+        """
+
+        def __init__(self) -> None:
+                # watcher id -> (object or None, ignore flag)
+                self._entries: Dict[int, tuple[Any, bool]] = {}
+                self._batch_depth = 0
+                self._pending: Dict[int, tuple[Any, List[str]]] = {}
+
+        def _entry(self, wid: int) -> tuple[Any, bool]:
+                entry = self._entries.get(wid)
+                if entry is None:
+                        objs = search_object(f"#{wid}")
+                        watcher = objs[0] if objs else None
+                        ignore = bool(watcher.attributes.get("battle_ignore_notify")) if watcher is not None else False
+                        entry = self._entries[wid] = (watcher, ignore)
+                return entry
+
+        def add(self, watcher) -> None:
+                """Cache ``watcher`` directly, skipping the database lookup."""
+
+                wid = getattr(watcher, "id", None)
+                if wid is None:
+                        return
+                attributes = getattr(watcher, "attributes", None)
+                ignore = bool(attributes.get("battle_ignore_notify")) if attributes is not None else False
+                self._entries[wid] = (watcher, ignore)
+
+        def discard(self, wid: int) -> None:
+                self._entries.pop(wid, None)
+
+        def refresh(self, wid: Optional[int] = None) -> None:
+                """Forget cached data for ``wid`` or for every watcher."""
+
+                if wid is None:
+                        self._entries.clear()
+                else:
+                        self._entries.pop(wid, None)
+
+        def send(self, watcher_ids: Iterable[int], message: str, room=None) -> None:
+                """Deliver ``message`` to every cached watcher in ``room``."""
+
+                for wid in list(watcher_ids):
+                        watcher, ignore = self._entry(wid)
+                        if watcher is None or ignore:
+                                continue
+                        if room and watcher.location != room:
+                                continue
+                        if self._batch_depth:
+                                self._pending.setdefault(wid, (watcher, []))[1].append(message)
+                        else:
+                                watcher.msg(message)
+
+        def begin_batch(self) -> None:
+                self._batch_depth += 1
+
+        def flush(self) -> None:
+                """Close one batch level, sending queued messages at the outermost."""
+
+                self._batch_depth = max(0, self._batch_depth - 1)
+                if self._batch_depth:
+                        return
+                pending, self._pending = self._pending, {}
+                for watcher, messages in pending.values():
+                        watcher.msg("\n".join(messages))
+
+
+def notify_watchers(
+        state: Union[BattleState, dict],
+        message: str,
+        room=None,
+        cache: Optional[WatcherCache] = None,
+) -> None:
         """Send ``message`` to all registered watchers.
 
         Parameters
@@ -50,6 +130,9 @@ def notify_watchers(state: Union[BattleState, dict], message: str, room=None) ->
             Optional room; if given only watchers currently in this room are
             notified.  This mirrors the behaviour of the original game where
             spectators must remain in the battle room to receive updates.
+        cache:
+            Optional :class:`WatcherCache` used to resolve watcher objects
+            without a database lookup per message.
         """
 
         watchers: Optional[Iterable[int]]
@@ -59,6 +142,9 @@ def notify_watchers(state: Union[BattleState, dict], message: str, room=None) ->
                 watchers = getattr(state, "watchers", None)
         if not watchers:
                 return
+        if cache is not None:
+                cache.send(watchers, message, room=room)
+                return
         for wid in list(watchers):
                 objs = search_object(f"#{wid}")
                 if not objs:
@@ -117,6 +203,9 @@ class WatcherManager:
                         self.watchers.add(wid)
                         if hasattr(self, "ndb") and hasattr(self.ndb, "watchers_live"):
                                 self.ndb.watchers_live.add(wid)
+                cache = self._watcher_cache()
+                if cache is not None:
+                        cache.add(watcher)
                 watcher.ndb.battle_instance = self
                 if hasattr(watcher, "db"):
                         watcher.db.battle_id = getattr(self, "battle_id", None)
@@ -131,12 +220,53 @@ class WatcherManager:
                         self.watchers.discard(wid)
                         if hasattr(self, "ndb") and hasattr(self.ndb, "watchers_live"):
                                 self.ndb.watchers_live.discard(wid)
+                        cache = self._watcher_cache()
+                        if cache is not None:
+                                cache.discard(wid)
                 log_info(f"Watcher {getattr(watcher, 'key', watcher)} removed")
 
+        def _watcher_cache(self) -> Optional[WatcherCache]:
+                """Return the session's :class:`WatcherCache`, creating it on ``ndb``."""
+
+                ndb = getattr(self, "ndb", None)
+                if ndb is None:
+                        return None
+                cache = getattr(ndb, "watcher_cache", None)
+                if cache is None:
+                        cache = WatcherCache()
+                        ndb.watcher_cache = cache
+                return cache
+
+        def refresh_watchers(self, watcher=None) -> None:
+                """Drop cached watcher data, e.g. after a watcher changes location."""
+
+                cache = self._watcher_cache()
+                if cache is not None:
+                        cache.refresh(getattr(watcher, "id", watcher) if watcher is not None else None)
+
+        @contextmanager
+        def watcher_batch(self):
+                """Coalesce every notification sent inside the block per watcher."""
+
+                cache = self._watcher_cache()
+                if cache is None:
+                        yield
+                        return
+                cache.begin_batch()
+                try:
+                        yield
+                finally:
+                        cache.flush()
+
         def notify(self, message: str) -> None:
                 if not getattr(self, "state", None):
                         return
-                notify_watchers(self.state, message, room=getattr(self, "room", None))
+                notify_watchers(
+                        self.state,
+                        message,
+                        room=getattr(self, "room", None),
+                        cache=self._watcher_cache(),
+                )
                 log_info(f"Notified watchers: {message}")
 
         # ------------------------------------------------------------
@@ -166,5 +296,6 @@ __all__ = [
         "remove_watcher",
         "notify_watchers",
         "normalize_watchers",
+        "WatcherCache",
         "WatcherManager",
 ]
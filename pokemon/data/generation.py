@@ -5,7 +5,7 @@ import random
 from typing import Dict, List, Optional
 
 from ..dex import POKEDEX, MOVEDEX
-from .learnsets.learnsets import LEARNSETS
+from .learnsets.store import get_learnset_store
 from ..dex.entities import Stats, Pokemon as SpeciesPokemon
 
 
@@ -17,31 +17,6 @@ POKEDEX_LOOKUP = {name.lower(): mon for name, mon in POKEDEX.items()}
 POKEDEX_LOOKUP.update({mon.name.lower(): mon for mon in POKEDEX.values()})
 
 
-# Preprocess learnset level-up data at import time to avoid repeated parsing.
-# The resulting structure maps ``species -> level -> {move: generation}``.
-LEVEL_UP_LEARNSETS: Dict[str, Dict[int, Dict[str, int]]] = {}
-
-for _name, _data in LEARNSETS.items():
-    _learnset = _data.get("learnset", {})
-    level_map: Dict[int, Dict[str, int]] = {}
-    for _move, _codes in _learnset.items():
-        for _code in _codes:
-            if "L" not in _code:
-                continue
-            gen_part, level_part = _code.split("L", 1)
-            if not gen_part.isdigit() or not level_part.isdigit():
-                continue
-            gen = int(gen_part)
-            lvl = int(level_part)
-            moves_at_level = level_map.setdefault(lvl, {})
-            # Keep the highest generation for a given move/level pair
-            existing_gen = moves_at_level.get(_move)
-            if existing_gen is None or gen > existing_gen:
-                moves_at_level[_move] = gen
-    if level_map:
-        LEVEL_UP_LEARNSETS[_name] = level_map
-
-
 @dataclass
 class PokemonInstance:
     """A generated Pokémon with stats, moves and other metadata."""
@@ -121,22 +96,19 @@ def get_gender(
 def get_valid_moves(species_name: str, level: int) -> List[str]:
     """Return a list of moves learnable at or below the given level."""
     key = species_name.lower()
-    level_map = LEVEL_UP_LEARNSETS.get(key)
-    if not level_map:
+    store = get_learnset_store()
+    entries = store.level_up_positions(key, level)
+    if not entries:
         return []
 
-    entries: List[tuple[int, int, str]] = []
-    for lvl, moves in level_map.items():
-        if lvl > level:
-            continue
-        for move, gen in moves.items():
-            entries.append((gen, lvl, move))
-
-    entries.sort(key=lambda x: (-x[0], -x[1]))
+    # Newest generation first, then highest level, then learnset order.
+    entries.sort(key=lambda x: (-x[2], -x[0], x[1]))
     moves: List[str] = []
-    for _, _, mv in entries:
-        if mv not in moves:
-            moves.append(mv)
+    seen = set()
+    for _, pos, _ in entries:
+        if pos not in seen:
+            seen.add(pos)
+            moves.append(store.move_at(key, pos))
     return moves
 
 
@@ -193,16 +165,13 @@ def choose_wild_moves(
 
     types = [t.lower() for t in species.types]
 
-    level_map = LEVEL_UP_LEARNSETS.get(key, {})
-    if not level_map:
+    store = get_learnset_store()
+    if not store.level_up_positions(key):
         return ["Struggle"]
 
     move_to_level: Dict[str, int] = {}
-    for lvl in sorted(level_map):
-        if lvl > level:
-            break
-        for move in level_map[lvl]:
-            move_to_level[move] = lvl
+    for lvl, mv, _gen in store.level_up(key, level):
+        move_to_level[mv] = lvl
 
     if not move_to_level:
         return ["Struggle"]
@@ -243,13 +212,7 @@ def choose_wild_moves(
                 break
 
     if allow_special and rng.random() < 0.05:
-        special_pool: List[str] = []
-        learnset = LEARNSETS.get(key, {}).get("learnset", {})
-        for move, codes in learnset.items():
-            for code in codes:
-                if code.endswith("M") or code.endswith("E"):
-                    special_pool.append(move)
-                    break
+        special_pool = store.moves_from(key, "ME")
         if special_pool:
             special_move = rng.choice(special_pool)
             if special_move not in moves:
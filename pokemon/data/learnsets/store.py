@@ -0,0 +1,265 @@
+"""Compact, indexed learnset store.
+
+``learnsets.py`` is a direct dump of Showdown's learnset table: every species
+maps move ids to lists of source codes such as ``"9L15"`` or ``"8M"``.  Most
+callers only ask a few questions of it (which moves can this species learn by
+level-up at or below level N, which moves does it get from TMs or eggs), so
+the store compiles the table once into:
+
+* a single tuple of interned move ids shared by every species,
+* per species, the move ids in learnset order with a bitmask of the source
+  letters each move is learnable through, and
+* per species, level-up entries sorted by level so level queries bisect.
+
+``tools/data_generation/learnsets/ts_to_py.py`` writes the compiled store to
+``learnsets_index.pickle`` next to ``learnsets.py``; when that file is missing
+or was written for a different ``learnsets.py`` the store is compiled from
+``LEARNSETS`` on first use.
+"""
+
+from __future__ import annotations
+
+import pickle
+import re
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+SOURCE_PATH = Path(__file__).resolve().parent / "learnsets.py"
+INDEX_PATH = SOURCE_PATH.with_name("learnsets_index.pickle")
+INDEX_VERSION = 1
+
+CODE_RE = re.compile(r"^(?P<gen>\d+)(?P<type>[A-Z])(?P<data>.*)$")
+
+# Source letters used in learnset codes and their bit in a move's source mask.
+SOURCE_BITS: Dict[str, int] = {letter: 1 << idx for idx, letter in enumerate("LMTESDVR")}
+
+
+def source_stamp(path: Path = SOURCE_PATH) -> Optional[Tuple[int, int]]:
+    """Return ``(size, mtime_ns)`` of the learnset source, if it exists."""
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class SpeciesLearnset:
+    """Compiled learnset for one species."""
+
+    __slots__ = ("moves", "sources", "levels", "level_moves", "level_gens", "level_primary")
+
+    def __init__(self) -> None:
+        # Move ids (indexes into the store's move table) in learnset order and
+        # the source bitmask for each.
+        self.moves = array("H")
+        self.sources = array("H")
+        # Level-up entries sorted by (level, learnset position).  Each entry
+        # stores the move's position in ``moves``, the newest generation that
+        # teaches it at that level, and whether it is the entry from the
+        # newest generation's level-up code for the move.
+        self.levels = array("B")
+        self.level_moves = array("H")
+        self.level_gens = array("B")
+        self.level_primary = array("B")
+
+
+class LearnsetStore:
+    """Read-only learnset queries over a compiled learnset table."""
+
+    def __init__(self, moves: Iterable[str], species: Mapping[str, SpeciesLearnset]) -> None:
+        self.moves: Tuple[str, ...] = tuple(moves)
+        self.species: Dict[str, SpeciesLearnset] = dict(species)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_learnsets(cls, learnsets: Mapping[str, Mapping]) -> "LearnsetStore":
+        """Compile a Showdown-style ``LEARNSETS`` mapping."""
+
+        move_ids: Dict[str, int] = {}
+        species: Dict[str, SpeciesLearnset] = {}
+        for name, data in learnsets.items():
+            compiled = SpeciesLearnset()
+            entries: Dict[Tuple[int, int], int] = {}
+            primary: Dict[int, Tuple[int, int]] = {}
+            for pos, (move, codes) in enumerate((data.get("learnset") or {}).items()):
+                compiled.moves.append(move_ids.setdefault(move, len(move_ids)))
+                mask = 0
+                for code in codes:
+                    match = CODE_RE.match(code)
+                    if not match:
+                        continue
+                    letter = match.group("type")
+                    mask |= SOURCE_BITS.get(letter, 0)
+                    if letter != "L":
+                        continue
+                    gen = int(match.group("gen"))
+                    level_part = match.group("data")
+                    best = primary.get(pos)
+                    if best is None or gen > best[0]:
+                        primary[pos] = (gen, int(level_part or 0))
+                    if not level_part.isdigit():
+                        continue
+                    key = (int(level_part), pos)
+                    if gen > entries.get(key, -1):
+                        entries[key] = gen
+                compiled.sources.append(mask)
+            for pos, (gen, level) in primary.items():
+                entries.setdefault((level, pos), gen)
+            for (level, pos), gen in sorted(entries.items()):
+                compiled.levels.append(level)
+                compiled.level_moves.append(pos)
+                compiled.level_gens.append(gen)
+                best = primary.get(pos)
+                compiled.level_primary.append(1 if best is not None and best[1] == level else 0)
+            species[name] = compiled
+        moves = sorted(move_ids, key=move_ids.__getitem__)
+        return cls(moves, species)
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> Optional["LearnsetStore"]:
+        """Return the store pickled at ``path`` or ``None`` if unusable."""
+
+        try:
+            with open(path, "rb") as handle:
+                payload = pickle.load(handle)
+        except Exception:
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+            return None
+        if payload.get("source") != source_stamp():
+            return None
+        return cls(payload["moves"], payload["species"])
+
+    def save(self, path: Path = INDEX_PATH) -> None:
+        """Pickle the compiled store to ``path``."""
+
+        with open(path, "wb") as handle:
+            pickle.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "source": source_stamp(),
+                    "moves": self.moves,
+                    "species": self.species,
+                },
+                handle,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def __contains__(self, species: object) -> bool:
+        return species in self.species
+
+    def species_names(self) -> List[str]:
+        """Return every species key with learnset data."""
+
+        return list(self.species)
+
+    def level_up(self, species: str, max_level: Optional[int] = None) -> List[Tuple[int, str, int]]:
+        """Return ``(level, move, generation)`` level-up entries for ``species``.
+
+        Entries are ordered by level, then learnset order, and stop at
+        ``max_level`` when given.
+        """
+
+        compiled = self.species.get(species)
+        if compiled is None:
+            return []
+        end = len(compiled.levels) if max_level is None else bisect_right(compiled.levels, max_level)
+        moves, table = compiled.moves, self.moves
+        return [
+            (compiled.levels[idx], table[moves[compiled.level_moves[idx]]], compiled.level_gens[idx])
+            for idx in range(end)
+        ]
+
+    def level_up_positions(self, species: str, max_level: Optional[int] = None) -> List[Tuple[int, int, int]]:
+        """Like :meth:`level_up` but with each move's learnset position."""
+
+        compiled = self.species.get(species)
+        if compiled is None:
+            return []
+        end = len(compiled.levels) if max_level is None else bisect_right(compiled.levels, max_level)
+        return [(compiled.levels[idx], compiled.level_moves[idx], compiled.level_gens[idx]) for idx in range(end)]
+
+    def level_up_moves(self, species: str, max_level: Optional[int] = None) -> List[Tuple[int, str]]:
+        """Return ``(level, move)`` pairs from each move's newest level-up code.
+
+        This is the ``"level-up"`` list of :meth:`moveset`, cut off at
+        ``max_level``, without building the rest of the moveset.
+        """
+
+        compiled = self.species.get(species)
+        if compiled is None:
+            return []
+        end = len(compiled.levels) if max_level is None else bisect_right(compiled.levels, max_level)
+        moves, table = compiled.moves, self.moves
+        return [
+            (compiled.levels[idx], table[moves[compiled.level_moves[idx]]])
+            for idx in range(end)
+            if compiled.level_primary[idx]
+        ]
+
+    def move_at(self, species: str, position: int) -> str:
+        """Return the move at ``position`` in ``species``' learnset."""
+
+        return self.moves[self.species[species].moves[position]]
+
+    def moves_from(self, species: str, letters: str) -> List[str]:
+        """Return moves learnable through any of the source ``letters``, in learnset order."""
+
+        compiled = self.species.get(species)
+        if compiled is None:
+            return []
+        mask = 0
+        for letter in letters:
+            mask |= SOURCE_BITS[letter]
+        table = self.moves
+        return [table[move] for move, sources in zip(compiled.moves, compiled.sources) if sources & mask]
+
+    def moveset(self, species: str) -> Optional[Dict[str, list]]:
+        """Return the categorized moveset used by the dex commands.
+
+        Level-up moves use the level from the newest generation's code; other
+        categories list every move learnable through that source.
+        """
+
+        compiled = self.species.get(species)
+        if compiled is None:
+            return None
+        moveset: Dict[str, list] = {"level-up": self.level_up_moves(species)}
+        for category, letter in (
+            ("machine", "M"),
+            ("tutor", "T"),
+            ("egg", "E"),
+            ("event", "S"),
+            ("dream", "D"),
+            ("virtual", "V"),
+        ):
+            moveset[category] = sorted(self.moves_from(species, letter))
+        return moveset
+
+
+_STORE: Optional[LearnsetStore] = None
+
+
+def get_learnset_store() -> LearnsetStore:
+    """Return the process-wide learnset store, loading it on first use."""
+
+    global _STORE
+    if _STORE is None:
+        store = LearnsetStore.load()
+        if store is None:
+            from .learnsets import LEARNSETS
+
+            store = LearnsetStore.from_learnsets(LEARNSETS)
+        _STORE = store
+    return _STORE
+
+
+__all__ = ["LearnsetStore", "SpeciesLearnset", "SOURCE_BITS", "get_learnset_store"]
@@ -15,6 +15,7 @@ from .entities import (
 	load_movedex,
 	load_pokedex,
 )
+from .snapshot import load_dex_tables
 
 BASE_PATH = Path(__file__).resolve().parents[2]
 
@@ -26,27 +27,47 @@ ABILITYDEX_PATH = BASE_PATH / "pokemon" / "dex" / "abilities" / "abilitiesdex.py
 ITEMDEX_PATH = BASE_PATH / "pokemon" / "dex" / "items" / "itemsdex.py"
 CONDITIONDEX_PATH = BASE_PATH / "pokemon" / "dex" / "conditions.py"
 
-try:
-	ABILITYDEX = load_abilitydex(ABILITYDEX_PATH)
-except Exception:
-	ABILITYDEX = {}
 
-POKEDEX = load_pokedex(POKEDEX_PATH, ABILITYDEX)
+def build_dex_tables() -> dict:
+	"""Construct every dex table from the generated source modules."""
+	try:
+		abilitydex = load_abilitydex(ABILITYDEX_PATH)
+	except Exception:
+		abilitydex = {}
 
-try:
-	MOVEDEX = load_movedex(MOVEDEX_PATH)
-except Exception:
-	MOVEDEX = {}
+	pokedex = load_pokedex(POKEDEX_PATH, abilitydex)
 
-try:
-	ITEMDEX = load_itemdex(ITEMDEX_PATH)
-except Exception:
-	ITEMDEX = {}
+	try:
+		movedex = load_movedex(MOVEDEX_PATH)
+	except Exception:
+		movedex = {}
 
-try:
-	CONDITIONDEX = load_conditiondex(CONDITIONDEX_PATH)
-except Exception:
-	CONDITIONDEX = {}
+	try:
+		itemdex = load_itemdex(ITEMDEX_PATH)
+	except Exception:
+		itemdex = {}
+
+	try:
+		conditiondex = load_conditiondex(CONDITIONDEX_PATH)
+	except Exception:
+		conditiondex = {}
+
+	return {
+		"ABILITYDEX": abilitydex,
+		"POKEDEX": pokedex,
+		"MOVEDEX": movedex,
+		"ITEMDEX": itemdex,
+		"CONDITIONDEX": conditiondex,
+	}
+
+
+_tables = load_dex_tables(build_dex_tables)
+ABILITYDEX = _tables["ABILITYDEX"]
+POKEDEX = _tables["POKEDEX"]
+MOVEDEX = _tables["MOVEDEX"]
+ITEMDEX = _tables["ITEMDEX"]
+CONDITIONDEX = _tables["CONDITIONDEX"]
+del _tables
 
 __all__ = [
 	"Ability",
@@ -59,4 +80,5 @@ __all__ = [
 	"ITEMDEX",
 	"CONDITIONDEX",
 	"BABY_SPECIES",
+	"build_dex_tables",
 ]
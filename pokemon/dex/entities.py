@@ -3,9 +3,11 @@ import importlib.util
 import json
 import re
 import sys
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 BASE_PATH = Path(__file__).resolve().parents[2]
 
@@ -63,8 +65,27 @@ def _invoke_raw_callback(
 	return None
 
 
+class _RawEventHooks:
+	"""Mixin advertising which ``on*`` callbacks a raw dex entry defines."""
+
+	@property
+	def event_hooks(self) -> frozenset:
+		"""Hook names this entry can answer through :meth:`call`.
+
+		Computed once per ``raw`` mapping; assigning a new ``raw`` recomputes it.
+		"""
+		cached = self.__dict__.get("_event_hooks")
+		if cached is None or cached[0] is not self.raw:
+			hooks = frozenset(
+				key for key, value in self.raw.items() if value and isinstance(key, str) and key.startswith("on")
+			)
+			cached = (self.raw, hooks)
+			self.__dict__["_event_hooks"] = cached
+		return cached[1]
+
+
 @dataclass
-class Ability:
+class Ability(_RawEventHooks):
 	name: str
 	num: int
 	rating: Optional[float] = None
@@ -118,7 +139,7 @@ class Move:
 
 
 @dataclass
-class Item:
+class Item(_RawEventHooks):
 	name: str
 	num: int
 	spritenum: Optional[int] = None
@@ -175,7 +196,7 @@ class Item:
 
 
 @dataclass
-class Condition:
+class Condition(_RawEventHooks):
 	name: str
 	effect_type: Optional[str] = None
 	duration: Optional[int] = None
@@ -382,12 +403,115 @@ class Pokemon:
 		)
 
 
+class _Pending:
+	"""Raw dex entry waiting to be turned into an entity."""
+
+	__slots__ = ("name", "data", "entity")
+
+	def __init__(self, name: str, data: Dict[str, Any]):
+		self.name = name
+		self.data = data
+		self.entity = None
+
+
+class LazyDex(MutableMapping):
+	"""Dex mapping that builds entity objects on first access.
+
+	Entries are stored as raw data and passed to ``factory(name, data)`` the
+	first time they are read; the result replaces the raw entry.  Aliases
+	added with :meth:`add_aliases` share the pending entry, so every key for
+	the same entry returns the same object.
+	"""
+
+	def __init__(
+		self,
+		entries: Iterable[Tuple[str, str, Dict[str, Any]]] = (),
+		factory: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+	):
+		self._factory = factory
+		self._data: Dict[str, Any] = {key: _Pending(name, data) for key, name, data in entries}
+		self._aliased: Dict[Callable[[str], str], int] = {}
+		self._alias_sources: Dict[str, Any] = {}
+		self._version = 0
+
+	def _materialize(self, key: str, value: Any) -> Any:
+		entity = value.entity
+		if entity is None:
+			entity = value.entity = self._factory(value.name, value.data)
+		self._data[key] = entity
+		return entity
+
+	def __getitem__(self, key: str) -> Any:
+		value = self._data[key]
+		if type(value) is _Pending:
+			return self._materialize(key, value)
+		return value
+
+	def get(self, key: str, default: Any = None) -> Any:
+		value = self._data.get(key, default)
+		if type(value) is _Pending:
+			return self._materialize(key, value)
+		return value
+
+	def __setitem__(self, key: str, value: Any) -> None:
+		self._data[key] = value
+		self._version += 1
+
+	def __delitem__(self, key: str) -> None:
+		del self._data[key]
+		self._version += 1
+
+	def __contains__(self, key: object) -> bool:
+		return key in self._data
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(self._data)
+
+	def __len__(self) -> int:
+		return len(self._data)
+
+	def __repr__(self) -> str:
+		built = sum(1 for value in self._data.values() if type(value) is not _Pending)
+		return f"<LazyDex {built}/{len(self._data)} built>"
+
+	def clear(self) -> None:
+		self._data.clear()
+		self._version += 1
+
+	def add_aliases(self, keyfunc: Callable[[str], str]) -> None:
+		"""Register ``keyfunc(name)`` as an extra key for every entry.
+
+		Pending entries are aliased without being built.  An alias is only
+		written once per entry, so later explicit assignments to that key are
+		kept.  Repeated calls are free until the mapping changes.
+		"""
+		if self._aliased.get(keyfunc) == self._version:
+			return
+		for key, value in list(self._data.items()):
+			if type(value) is _Pending:
+				name = value.name
+			else:
+				name = getattr(value, "id", None) or getattr(value, "name", None) or key
+			alias = keyfunc(name)
+			if not alias or alias == key:
+				continue
+			source = self._alias_sources.get(alias)
+			if source is value or (type(source) is _Pending and source.entity is value):
+				continue
+			existing = self._data.get(alias)
+			if existing is not value and not (type(value) is _Pending and existing is value.entity is not None):
+				self._data[alias] = value
+			self._alias_sources[alias] = value
+		self._version += 1
+		self._aliased[keyfunc] = self._version
+
+
 def _load_json(path: Path) -> Dict[str, Any]:
 	with open(path, "r") as f:
 		return json.load(f)
 
 
-def load_pokedex(path: Path, abilitydex: Optional[Dict[str, Ability]] = None) -> Dict[str, Pokemon]:
+def load_pokedex(path: Path, abilitydex: Optional[Dict[str, Ability]] = None) -> LazyDex:
 	"""Load pokemon data from a Python or JSON file."""
 	if path.suffix == ".py":
 		# support nested paths like pokemon/dex/pokedex.py
@@ -405,10 +529,13 @@ def load_pokedex(path: Path, abilitydex: Optional[Dict[str, Ability]] = None) ->
 		data = getattr(mod, "pokedex")
 	else:
 		data = _load_json(path)
-	return {name: Pokemon.from_dict(details.get("name", name), details, abilitydex) for name, details in data.items()}
+	return LazyDex(
+		((name, details.get("name", name), details) for name, details in data.items()),
+		partial(Pokemon.from_dict, abilitydex=abilitydex),
+	)
 
 
-def load_movedex(path: Path) -> Dict[str, Move]:
+def load_movedex(path: Path) -> LazyDex:
 	"""Load move data from a Python or JSON file."""
 	if path.suffix == ".py":
 		# support nested paths like pokemon/dex/abilities/abilitiesdex.py
@@ -427,10 +554,10 @@ def load_movedex(path: Path) -> Dict[str, Move]:
 	else:
 		data = _load_json(path)
 	# Store entries keyed by lowercase names for case-insensitive lookup
-	return {name.lower(): Move.from_dict(name, details) for name, details in data.items()}
+	return LazyDex(((name.lower(), name, details) for name, details in data.items()), Move.from_dict)
 
 
-def load_abilitydex(path: Path) -> Dict[str, Ability]:
+def load_abilitydex(path: Path) -> LazyDex:
 	"""Load ability data from a Python or JSON file."""
 	if path.suffix == ".py":
 		rel_parts = path.with_suffix("").parts
@@ -453,10 +580,19 @@ def load_abilitydex(path: Path) -> Dict[str, Ability]:
 			# Ensure abilities that only modify incoming damage are treated as
 			# defensive by giving them a harmless ``onDamage`` entry.
 			details.setdefault("onDamage", None)
-	return {name: Ability.from_dict(name, details) for name, details in data.items()}
+	return LazyDex(((name, name, details) for name, details in data.items()), Ability.from_dict)
+
 
+def _item_with_price(name: str, data: Dict[str, Any], price_map: Dict[str, int]) -> Item:
+	"""Build an :class:`Item`, applying its shop price from ``price_map``."""
+	item = Item.from_dict(name, data)
+	key = re.sub(r"\W+", "", item.name).lower()
+	if key in price_map:
+		item.price = price_map[key]
+	return item
 
-def load_itemdex(path: Path) -> Dict[str, Item]:
+
+def load_itemdex(path: Path) -> LazyDex:
 	"""Load item data from a Python or JSON file."""
 	if path.suffix == ".py":
 		rel_parts = path.with_suffix("").parts
@@ -474,27 +610,24 @@ def load_itemdex(path: Path) -> Dict[str, Item]:
 	else:
 		data = _load_json(path)
 
-	items = {name: Item.from_dict(name, details) for name, details in data.items()}
-
+	price_map: Dict[str, int] = {}
 	price_path = BASE_PATH / "pokemon" / "data" / "item_prices.csv"
 	if price_path.exists():
 		with open(price_path) as f:
 			reader = csv.DictReader(f)
-			price_map = {}
 			for row in reader:
 				key = re.sub(r"\W+", "", row.get("identifier", "")).lower()
 				cost = row.get("cost")
 				if cost:
 					price_map[key] = int(cost)
-		for item in items.values():
-			key = re.sub(r"\W+", "", item.name).lower()
-			if key in price_map:
-				item.price = price_map[key]
 
-	return items
+	return LazyDex(
+		((name, name, details) for name, details in data.items()),
+		partial(_item_with_price, price_map=price_map),
+	)
 
 
-def load_conditiondex(path: Path) -> Dict[str, Condition]:
+def load_conditiondex(path: Path) -> LazyDex:
 	"""Load condition data from a Python or JSON file."""
 	if path.suffix == ".py":
 		rel_parts = path.with_suffix("").parts
@@ -511,4 +644,4 @@ def load_conditiondex(path: Path) -> Dict[str, Condition]:
 		data = getattr(mod, "py_dict")
 	else:
 		data = _load_json(path)
-	return {name: Condition.from_dict(name, details) for name, details in data.items()}
+	return LazyDex(((name, name, details) for name, details in data.items()), Condition.from_dict)
@@ -421,7 +421,7 @@ class Beatup:
 			allies = [ally for ally in party if getattr(ally, "hp", 0) > 0]
 			move.allies = allies
 			if isinstance(getattr(move, "raw", None), dict):
-				move.raw["multihit"] = len(allies)
+				move.raw = dict(move.raw, multihit=len(allies))
 			current = allies[0] if allies else user
 			base_atk = getattr(getattr(current, "base_stats", None), "atk", 0)
 			return 5 + (base_atk // 10)
@@ -436,7 +436,7 @@ class Beatup:
 		allies = [ally for ally in party if getattr(ally, "hp", 0) > 0]
 		move.allies = allies
 		if isinstance(getattr(move, "raw", None), dict):
-			move.raw["multihit"] = len(allies)
+			move.raw = dict(move.raw, multihit=len(allies))
 
 
 class Belch:
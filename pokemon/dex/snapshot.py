@@ -0,0 +1,129 @@
+"""Pickled snapshot of the dex tables.
+
+Building the dex means exec'ing the generated data modules, which dominates
+``pokemon.dex`` import time.  The snapshot stores the loaded tables (raw
+entries plus the factories that turn them into entities on first use)
+together with a fingerprint of every source file that feeds them.  :func:`load_dex_tables` returns the snapshot
+when the fingerprint still matches and rebuilds (and rewrites) it otherwise.
+
+Set ``PF2_DEX_SNAPSHOT=0`` to always build from source, or run
+``python -m pokemon.dex.snapshot`` to rebuild the snapshot ahead of time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Bump when the snapshot layout or the table construction changes in a way
+# the source fingerprint cannot see.
+SNAPSHOT_VERSION = 2
+
+DEX_DIR = Path(__file__).resolve().parent
+SNAPSHOT_PATH = DEX_DIR / "__snapshot__" / "dex.pickle"
+TABLE_NAMES = ("ABILITYDEX", "POKEDEX", "MOVEDEX", "ITEMDEX", "CONDITIONDEX")
+
+
+def snapshot_enabled() -> bool:
+	"""Return ``False`` when ``PF2_DEX_SNAPSHOT`` disables the snapshot."""
+	return os.environ.get("PF2_DEX_SNAPSHOT", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def source_paths() -> List[Path]:
+	"""Return every file whose contents feed the dex tables."""
+	paths = sorted((DEX_DIR / "pokedex").glob("*.py"))
+	paths += [
+		DEX_DIR / "moves" / "movesdex.py",
+		DEX_DIR / "abilities" / "abilitiesdex.py",
+		DEX_DIR / "items" / "itemsdex.py",
+		DEX_DIR / "conditions.py",
+		DEX_DIR / "entities.py",
+		DEX_DIR / "baby_species.py",
+		DEX_DIR.parent / "data" / "item_prices.csv",
+	]
+	return paths
+
+
+def source_fingerprint(paths: Optional[Iterable[Path]] = None) -> str:
+	"""Return a digest of the snapshot version, interpreter and source files."""
+	digest = hashlib.blake2b(digest_size=16)
+	digest.update(f"{SNAPSHOT_VERSION}:{sys.version_info[0]}.{sys.version_info[1]}".encode())
+	for path in paths if paths is not None else source_paths():
+		digest.update(str(path.name).encode())
+		try:
+			digest.update(path.read_bytes())
+		except OSError:
+			digest.update(b"<missing>")
+	return digest.hexdigest()
+
+
+def read_snapshot(fingerprint: str, path: Path = SNAPSHOT_PATH) -> Optional[Dict[str, Any]]:
+	"""Return the tables stored at ``path`` if they match ``fingerprint``."""
+	try:
+		with open(path, "rb") as handle:
+			payload = pickle.load(handle)
+	except Exception:
+		return None
+	if not isinstance(payload, dict) or payload.get("fingerprint") != fingerprint:
+		return None
+	tables = payload.get("tables")
+	if not isinstance(tables, dict) or any(name not in tables for name in TABLE_NAMES):
+		return None
+	return tables
+
+
+def write_snapshot(fingerprint: str, tables: Dict[str, Any], path: Path = SNAPSHOT_PATH) -> bool:
+	"""Atomically write ``tables`` to ``path``; return ``False`` on failure."""
+	try:
+		path.parent.mkdir(parents=True, exist_ok=True)
+		fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".dex-", suffix=".tmp")
+		try:
+			with os.fdopen(fd, "wb") as handle:
+				pickle.dump(
+					{"fingerprint": fingerprint, "tables": tables},
+					handle,
+					protocol=pickle.HIGHEST_PROTOCOL,
+				)
+			os.replace(tmp_name, path)
+		except BaseException:
+			os.unlink(tmp_name)
+			raise
+	except Exception:
+		return False
+	return True
+
+
+def load_dex_tables(build: Callable[[], Dict[str, Any]], path: Path = SNAPSHOT_PATH) -> Dict[str, Any]:
+	"""Return the dex tables from the snapshot, rebuilding it when stale.
+
+	``build`` constructs the tables from source.  All tables are pickled
+	together so references between them, such as the ability table used to
+	build each Pokémon, stay shared after loading.
+	"""
+	if not snapshot_enabled():
+		return build()
+	fingerprint = source_fingerprint()
+	tables = read_snapshot(fingerprint, path)
+	if tables is None:
+		tables = build()
+		write_snapshot(fingerprint, tables, path)
+	return tables
+
+
+def rebuild_snapshot(path: Path = SNAPSHOT_PATH) -> Path:
+	"""Build the dex from source and write a fresh snapshot to ``path``."""
+	from pokemon import dex
+
+	tables = dex.build_dex_tables()
+	if not write_snapshot(source_fingerprint(), tables, path):
+		raise OSError(f"Could not write dex snapshot to {path}")
+	return path
+
+
+if __name__ == "__main__":
+	print(f"Wrote {rebuild_snapshot()}")
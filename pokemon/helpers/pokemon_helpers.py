@@ -1,16 +1,26 @@
 """Helper functions for working with Pokémon stats.
 
-Historically this module cached calculated stats on the Pokémon instance to
-avoid repeated heavy calculations.  The caching mechanism proved unreliable
-and has been disabled for now.  All helpers now recompute stats on each call
-and ``refresh_stats`` simply returns freshly calculated values without storing
-them.  Support for caching can be reintroduced later if needed.
+Historically this module cached calculated stats on the Pokémon instance,
+which relied on every caller invalidating the cache after a change and proved
+unreliable.  Stats are now memoized in a bounded LRU cache keyed by the
+inputs that determine them (species, level, IVs, EVs and nature), so a
+changed Pokémon simply produces a different key and never needs explicit
+invalidation.  ``refresh_stats`` still returns freshly looked-up values
+without storing them on the Pokémon.
 """
 
+from functools import lru_cache
+
 from pokemon.data.generation import generate_pokemon
 from pokemon.services.move_management import initialize_generated_moveset, learn_level_up_moves
 from pokemon.utils.boosts import STAT_KEY_MAP
 
+# Order used when turning IV/EV mappings into hashable cache keys.
+STAT_ORDER = ("hp", "attack", "defense", "special_attack", "special_defense", "speed")
+
+# Number of distinct (species, level, ivs, evs, nature) results kept.
+STAT_CACHE_SIZE = 4096
+
 
 def _resolve_pokemon(pokemon):
         """Return a Pokémon model when given an identifier.
@@ -32,13 +42,57 @@ def _resolve_pokemon(pokemon):
         return pokemon
 
 
+@lru_cache(maxsize=STAT_CACHE_SIZE)
+def _cached_stats(calc, species, level, ivs, evs, nature):
+        """Return ``calc``'s stats for the given key as a tuple of items.
+
+        ``calc`` is part of the key so a replaced stat calculator never
+        serves results computed by another one.
+        """
+
+        stats = calc(species, level, dict(zip(STAT_ORDER, ivs)), dict(zip(STAT_ORDER, evs)), nature)
+        return tuple(stats.items())
+
+
+def _stat_values(values):
+        """Return ``values`` as a tuple in :data:`STAT_ORDER`."""
+
+        if isinstance(values, dict):
+                values = {STAT_KEY_MAP.get(k, k): v for k, v in values.items()}
+                return tuple(values.get(stat, 0) for stat in STAT_ORDER)
+        return tuple(values[:6])
+
+
+def stat_cache_info():
+        """Return hit/miss counters and occupancy of the stat cache."""
+
+        info = _cached_stats.cache_info()
+        return {
+                "hits": info.hits,
+                "misses": info.misses,
+                "size": info.currsize,
+                "maxsize": info.maxsize,
+        }
+
+
+def clear_stat_cache():
+        """Drop every memoized stat result and reset the counters."""
+
+        _cached_stats.cache_clear()
+
+
 def calculate_stats(species, level, ivs, evs, nature):
         """Return calculated stats, falling back to generated data if needed."""
 
         try:  # pragma: no cover - heavy Django dependency
                 from pokemon.models.stats import calculate_stats as _calc
 
-                return _calc(species, level, ivs, evs, nature)
+                key = (_calc, species, level, _stat_values(ivs), _stat_values(evs), nature)
+                try:
+                        hash(key)
+                except TypeError:
+                        return _calc(species, level, ivs, evs, nature)
+                return dict(_cached_stats(*key))
         except Exception:
                 inst = generate_pokemon(species, level=level)
                 return {
@@ -51,6 +105,17 @@ def calculate_stats(species, level, ivs, evs, nature):
                 }
 
 
+def _stat_inputs(pokemon):
+        """Return ``(species, level, ivs, evs, nature)`` for ``pokemon``."""
+
+        ivs = _stat_values(getattr(pokemon, "ivs", [0, 0, 0, 0, 0, 0]))
+        evs = _stat_values(getattr(pokemon, "evs", [0, 0, 0, 0, 0, 0]))
+        nature = getattr(pokemon, "nature", "Hardy")
+        species = getattr(pokemon, "species", getattr(pokemon, "name", ""))
+        level = getattr(pokemon, "level", 1)
+        return species, level, ivs, evs, nature
+
+
 def _calculate_from_data(pokemon):
         """Return freshly calculated stats based on stored attributes."""
 
@@ -58,36 +123,14 @@ def _calculate_from_data(pokemon):
         if pokemon is None:
                 return {}
 
-        ivs_attr = getattr(pokemon, "ivs", [0, 0, 0, 0, 0, 0])
-        evs_attr = getattr(pokemon, "evs", [0, 0, 0, 0, 0, 0])
-        if isinstance(ivs_attr, dict):
-                ivs = {STAT_KEY_MAP.get(k, k): v for k, v in ivs_attr.items()}
-                ivs = {stat: ivs.get(stat, 0) for stat in STAT_KEY_MAP.values()}
-        else:
-                ivs = {
-                        "hp": ivs_attr[0],
-                        "attack": ivs_attr[1],
-                        "defense": ivs_attr[2],
-                        "special_attack": ivs_attr[3],
-                        "special_defense": ivs_attr[4],
-                        "speed": ivs_attr[5],
-                }
-        if isinstance(evs_attr, dict):
-                evs = {STAT_KEY_MAP.get(k, k): v for k, v in evs_attr.items()}
-                evs = {stat: evs.get(stat, 0) for stat in STAT_KEY_MAP.values()}
-        else:
-                evs = {
-                        "hp": evs_attr[0],
-                        "attack": evs_attr[1],
-                        "defense": evs_attr[2],
-                        "special_attack": evs_attr[3],
-                        "special_defense": evs_attr[4],
-                        "speed": evs_attr[5],
-                }
-        nature = getattr(pokemon, "nature", "Hardy")
-        species = getattr(pokemon, "species", getattr(pokemon, "name", ""))
-        level = getattr(pokemon, "level", 1)
-        return calculate_stats(species, level, ivs, evs, nature)
+        species, level, ivs, evs, nature = _stat_inputs(pokemon)
+        return calculate_stats(
+                species,
+                level,
+                dict(zip(STAT_ORDER, ivs)),
+                dict(zip(STAT_ORDER, evs)),
+                nature,
+        )
 
 
 def _get_stats_from_data(pokemon):
@@ -120,6 +163,44 @@ def refresh_stats(pokemon):
         return _calculate_from_data(pokemon)
 
 
+def get_stats_batch(pokemons):
+        """Return calculated stats for each Pokémon in ``pokemons``.
+
+        Intended for whole parties or boxes: identifiers are resolved with a
+        single query instead of one per Pokémon, and Pokémon sharing the same
+        stat inputs hit the stat cache.  The result lists one stats dict per
+        entry, in order, with an empty dict for entries that could not be
+        resolved.
+        """
+
+        pokemons = list(pokemons)
+        pokemons = [mon.decode() if isinstance(mon, bytes) else mon for mon in pokemons]
+        ids = [mon for mon in pokemons if isinstance(mon, str)]
+        resolved = {}
+        if ids:
+                try:  # pragma: no cover - database access optional in tests
+                        from pokemon.models.core import OwnedPokemon
+
+                        for mon in OwnedPokemon.objects.filter(unique_id__in=ids):
+                                resolved[str(mon.unique_id)] = mon
+                except Exception:  # pragma: no cover - fallback when models unavailable
+                        pass
+
+        results = []
+        for mon in pokemons:
+                if isinstance(mon, str):
+                        mon = resolved.get(mon)
+                if mon is None:
+                        results.append({})
+                        continue
+                cache = getattr(mon, "_cached_stats", None)
+                if cache is not None:
+                        results.append(cache)
+                        continue
+                results.append(_calculate_from_data(mon))
+        return results
+
+
 def get_max_hp(pokemon) -> int:
 	"""Return the calculated maximum HP for ``pokemon``."""
 	stats = _get_stats_from_data(pokemon)
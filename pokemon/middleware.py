@@ -1,16 +1,17 @@
 # fusion2/pokemon/middleware.py
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
-from pokemon.data.learnsets.learnsets import LEARNSETS
+from pokemon.data.learnsets.store import get_learnset_store
 from pokemon.data.text import ITEMS_TEXT, MOVES_TEXT
 from pokemon.dex import ITEMDEX as itemdex
 from pokemon.dex import MOVEDEX as movedex
 from pokemon.dex import POKEDEX as pokedex
 
-# Cache for built movesets keyed by normalized Pokémon name
-MOVESET_CACHE = {}
+# Number of built movesets kept by ``get_moveset_by_name``.
+MOVESET_CACHE_SIZE = 256
 
 
 def _ensure_movedex():
@@ -388,27 +389,35 @@ def build_moveset(learnset):
 	return moveset
 
 
+@lru_cache(maxsize=MOVESET_CACHE_SIZE)
+def _cached_moveset(key):
+	return get_learnset_store().moveset(key)
+
+
 def get_moveset_by_name(name):
 	"""Return a moveset for the given Pokémon name.
 
-	The moveset is constructed once per species and cached for future
-	lookups to avoid repeatedly rebuilding the same data.
+	Movesets are built from the compiled learnset store and the most
+	recently used ones are cached.
 	"""
 
 	key = name.lower()
-	if key in MOVESET_CACHE:
-		return key, MOVESET_CACHE[key]
-
-	data = LEARNSETS.get(key)
-	if not data:
+	moveset = _cached_moveset(key)
+	if not moveset:
 		return None, None
-
-	learnset = data.get("learnset", {})
-	moveset = build_moveset(learnset)
-	MOVESET_CACHE[key] = moveset
 	return key, moveset
 
 
+def get_level_up_moves(name, max_level=None):
+	"""Return ``(level, move)`` level-up pairs for ``name`` up to ``max_level``.
+
+	Unlike :func:`get_moveset_by_name` this queries the learnset store
+	directly and does not build the other moveset categories.
+	"""
+
+	return get_learnset_store().level_up_moves(name.lower(), max_level)
+
+
 def format_moveset(name, moveset):
 	"""Format a moveset dictionary for display."""
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 """Utilities for experience, EV handling and stat calculation."""
 
+from bisect import bisect_right
 from typing import Dict, Iterable, List, Mapping, Sequence
 
 
@@ -42,7 +43,9 @@ STAT_EV_LIMIT = 252
 __all__ = [
 	"exp_for_level",
 	"level_for_exp",
+	"levels_for_exp",
 	"add_experience",
+	"add_experience_batch",
 	"add_evs",
 	"calculate_stats",
 	"distribute_experience",
@@ -67,10 +70,8 @@ def _normalize_growth_rate(rate: str | None) -> str:
         return str(rate or "medium_fast").strip().lower().replace("-", "_").replace(" ", "_")
 
 
-def exp_for_level(level: int, rate: str = "medium_fast") -> int:
-        """Return the experience required for the given level."""
-        level = max(1, min(level, 100))
-        match _normalize_growth_rate(rate):
+def _exp_formula(level, rate_key: str) -> int:
+        match rate_key:
                 case "fast":
                         return int(4 * level**3 / 5)
                 case "slow":
@@ -88,15 +89,39 @@ def exp_for_level(level: int, rate: str = "medium_fast") -> int:
                         return level**3
 
 
+# Experience thresholds for levels 1-100 keyed by growth rate as passed in.
+# Every table is strictly increasing, so level lookups bisect.
+_EXP_TABLES: Dict[str | None, tuple[int, ...]] = {}
+
+
+def _exp_table(rate: str | None) -> tuple[int, ...]:
+        table = _EXP_TABLES.get(rate)
+        if table is None:
+                key = _normalize_growth_rate(rate)
+                table = _EXP_TABLES.get(key)
+                if table is None:
+                        table = tuple(_exp_formula(level, key) for level in range(1, 101))
+                        _EXP_TABLES[key] = table
+                _EXP_TABLES[rate] = table
+        return table
+
+
+def exp_for_level(level: int, rate: str = "medium_fast") -> int:
+        """Return the experience required for the given level."""
+        level = max(1, min(level, 100))
+        if isinstance(level, int):
+                return _exp_table(rate)[level - 1]
+        return _exp_formula(level, _normalize_growth_rate(rate))
+
+
 def level_for_exp(exp: int, rate: str = "medium_fast") -> int:
 	"""Return the level for the given experience total."""
-	level = 1
-	for lvl in range(1, 101):
-		if exp >= exp_for_level(lvl, rate):
-			level = lvl
-		else:
-			break
-	return level
+	return max(1, bisect_right(_exp_table(rate), exp))
+
+
+def levels_for_exp(totals: Iterable[int], rates: Iterable[str | None]) -> List[int]:
+	"""Return the level for each experience total paired with its growth rate."""
+	return [max(1, bisect_right(_exp_table(rate), exp)) for exp, rate in zip(totals, rates)]
 
 
 def trainer_level_for_xp(txp: int) -> int:
@@ -168,51 +193,68 @@ def set_trainer_xp(player, amount: int) -> int:
         return total
 
 
+def _growth_rate_for(pokemon, rate: str | None = None) -> str:
+		"""Return the growth rate used to level ``pokemon``."""
+		if rate:
+				return rate
+		growth = getattr(pokemon, "growth_rate", None)
+		if growth:
+				return growth
+		name = getattr(pokemon, "species", getattr(pokemon, "name", None))
+		if name:
+				species = POKEDEX.get(name) or POKEDEX.get(str(name).lower()) or \
+						POKEDEX.get(str(name).capitalize())
+				if species:
+						return species.raw.get("growthRate", "medium_fast")
+		return "medium_fast"
+
+
 def add_experience(pokemon, amount: int, *, rate: str | None = None, caller=None) -> None:
 		"""Add experience to ``pokemon`` and update its level."""
-		if amount <= 0:
+		add_experience_batch([(pokemon, amount)], rate=rate, caller=caller)
+
+
+def add_experience_batch(awards: Iterable[tuple], *, rate: str | None = None, caller=None) -> None:
+		"""Add experience to several Pokémon and update their levels together.
+
+		``awards`` yields ``(pokemon, amount)`` pairs.  Experience totals are
+		credited first and the new levels computed in one pass before any
+		level-up moves are learned.
+		"""
+		pending = []
+		for pokemon, amount in awards:
+				if amount <= 0:
+						continue
+				prev_level = getattr(pokemon, "level", None)
+				if hasattr(pokemon, "total_exp"):
+						pokemon.total_exp = getattr(pokemon, "total_exp", 0) + amount
+						if not hasattr(pokemon, "level"):
+								continue
+						total = pokemon.total_exp
+				else:
+						pokemon.experience = getattr(pokemon, "experience", 0) + amount
+						total = pokemon.experience
+				pending.append((pokemon, prev_level, total, _growth_rate_for(pokemon, rate)))
+
+		if not pending:
 				return
+		levels = levels_for_exp([entry[2] for entry in pending], [entry[3] for entry in pending])
 
-		prev_level = getattr(pokemon, "level", None)
-
-		def _get_growth_rate(poke) -> str:
-				if rate:
-						return rate
-				growth = getattr(poke, "growth_rate", None)
-				if growth:
-						return growth
-				name = getattr(poke, "species", getattr(poke, "name", None))
-				if name:
-						species = POKEDEX.get(name) or POKEDEX.get(str(name).lower()) or \
-								POKEDEX.get(str(name).capitalize())
-						if species:
-								return species.raw.get("growthRate", "medium_fast")
-				return "medium_fast"
-
-		if hasattr(pokemon, "total_exp"):
-				pokemon.total_exp = getattr(pokemon, "total_exp", 0) + amount
-				growth = _get_growth_rate(pokemon)
-				if hasattr(pokemon, "level"):
-						pokemon.level = level_for_exp(pokemon.total_exp, growth)
-		else:
-				pokemon.experience = getattr(pokemon, "experience", 0) + amount
-				growth = _get_growth_rate(pokemon)
-				pokemon.level = level_for_exp(pokemon.experience, growth)
-
-		new_level = getattr(pokemon, "level", None)
-		if prev_level is not None and new_level and new_level > prev_level:
-				try:
-						learn_level_up_moves(pokemon, caller=caller, prompt=True)
-				except TypeError:
+		for (pokemon, prev_level, _total, _growth), new_level in zip(pending, levels):
+				pokemon.level = new_level
+				if prev_level is not None and new_level and new_level > prev_level:
 						try:
-								learn_level_up_moves(pokemon)
+								learn_level_up_moves(pokemon, caller=caller, prompt=True)
+						except TypeError:
+								try:
+										learn_level_up_moves(pokemon)
+								except Exception:
+										pass
 						except Exception:
 								pass
-				except Exception:
-						pass
 
-		if prev_level is not None and new_level != prev_level:
-				_invalidate_stat_cache(pokemon)
+				if prev_level is not None and new_level != prev_level:
+						_invalidate_stat_cache(pokemon)
 
 
 def add_evs(pokemon, gains: Mapping[str, int]) -> None:
@@ -387,10 +429,11 @@ def distribute_experience(pokemon_list, amount: int, ev_gains: Dict[str, int] |
 	remainder = amount % len(mons)
 	ev_gains = ev_gains or {}
 
-	for idx, mon in enumerate(mons):
-		gained = share + (1 if idx < remainder else 0)
-		gained = apply_item_exp_mod(mon, gained)
-		add_experience(mon, gained)
+	add_experience_batch(
+		(mon, apply_item_exp_mod(mon, share + (1 if idx < remainder else 0)))
+		for idx, mon in enumerate(mons)
+	)
+	for mon in mons:
 		if ev_gains:
 			add_evs(mon, apply_item_ev_mod(mon, ev_gains))
 		if hasattr(mon, "save"):
@@ -575,28 +618,9 @@ def award_experience_to_party(
         participant_messages: List[str] = []
         non_participant_messages: List[str] = []
 
-        if participant_mons:
-                share, remainder = divmod(amount, len(participant_mons))
-                for idx, mon in enumerate(participant_mons):
-                        gained = share + (1 if idx < remainder else 0)
-                        gained = apply_item_exp_mod(mon, gained)
-                        if gained:
-                                add_experience(mon, gained, caller=caller)
-                        if ev_gains:
-                                ev_payload = apply_item_ev_mod(mon, ev_gains)
-                                add_evs(mon, ev_payload)
-                        else:
-                                ev_payload = {}
-                        message = _format_reward_message(mon, gained, ev_payload)
-                        if message:
-                                participant_messages.append(message)
-                        if hasattr(mon, "save"):
-                                try:
-                                        mon.save()
-                                except Exception:
-                                        pass
-
         recipients = set(participant_mons)
+        extras: List = []
+        shared_gain = 0
         if share_enabled:
                 # Determine the base amount awarded to participants to derive
                 # the EXP Share payout for the rest of the party.
@@ -610,23 +634,49 @@ def award_experience_to_party(
                         for mon in mons
                         if mon not in recipients and not _is_fainted(mon)
                 ]
-                for mon in extras:
-                        gained = apply_item_exp_mod(mon, shared_gain)
-                        if gained:
-                                add_experience(mon, gained, caller=caller)
-                        if ev_gains:
-                                ev_payload = apply_item_ev_mod(mon, ev_gains)
-                                add_evs(mon, ev_payload)
-                        else:
-                                ev_payload = {}
-                        if gained or any(ev_payload.values()):
-                                message = _format_reward_message(mon, gained, ev_payload)
-                                if message:
-                                        non_participant_messages.append(message)
-                        if hasattr(mon, "save"):
-                                try:
-                                        mon.save()
-                                except Exception:
-                                        pass
+
+        # Credit the whole party's experience at once so level-ups are
+        # computed together.
+        gains: Dict = {}
+        if participant_mons:
+                share, remainder = divmod(amount, len(participant_mons))
+                for idx, mon in enumerate(participant_mons):
+                        gains[mon] = apply_item_exp_mod(mon, share + (1 if idx < remainder else 0))
+        for mon in extras:
+                gains[mon] = apply_item_exp_mod(mon, shared_gain)
+        add_experience_batch(gains.items(), caller=caller)
+
+        for mon in participant_mons:
+                gained = gains[mon]
+                if ev_gains:
+                        ev_payload = apply_item_ev_mod(mon, ev_gains)
+                        add_evs(mon, ev_payload)
+                else:
+                        ev_payload = {}
+                message = _format_reward_message(mon, gained, ev_payload)
+                if message:
+                        participant_messages.append(message)
+                if hasattr(mon, "save"):
+                        try:
+                                mon.save()
+                        except Exception:
+                                pass
+
+        for mon in extras:
+                gained = gains[mon]
+                if ev_gains:
+                        ev_payload = apply_item_ev_mod(mon, ev_gains)
+                        add_evs(mon, ev_payload)
+                else:
+                        ev_payload = {}
+                if gained or any(ev_payload.values()):
+                        message = _format_reward_message(mon, gained, ev_payload)
+                        if message:
+                                non_participant_messages.append(message)
+                if hasattr(mon, "save"):
+                        try:
+                                mon.save()
+                        except Exception:
+                                pass
 
         _notify_winner(player, caller, participant_messages + non_participant_messages)
@@ -1,9 +1,118 @@
-"""Persistence helpers for ephemeral battle encounters."""
+"""Pooled, battle-scoped encounter Pokémon.
+
+Wild and NPC encounter Pokémon used to be written as ``EncounterPokemon``
+rows on creation and deleted when the battle ended, so busy hunting rooms
+churned thousands of inserts and deletes and left orphan rows whenever a
+battle crashed.  :func:`create_encounter_pokemon` now returns a
+:class:`PooledEncounter` kept in a process-level pool for the battle's
+lifetime.  Rows are only written by :meth:`PooledEncounter.persist`, which
+:func:`persist_pooled_encounters` runs for the whole pool before a server
+stop or reload so restored battles can still resolve their references.
+:func:`sweep_stale_encounters` bulk-deletes rows (and pooled entries) left
+behind by battles that never cleaned up.
+"""
 
 from __future__ import annotations
 
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
 from pokemon.services.pokemon_refs import build_encounter_ref
 
+DEFAULT_STALE_AFTER = timedelta(hours=6)
+SWEEP_BATCH_SIZE = 500
+
+
+def _now() -> datetime:
+	try:
+		from django.utils import timezone
+
+		return timezone.now()
+	except Exception:  # pragma: no cover - lightweight tests without Django settings
+		return datetime.utcnow()
+
+
+def _zeros() -> list[int]:
+	return [0, 0, 0, 0, 0, 0]
+
+
+@dataclass(eq=False)
+class PooledEncounter:
+	"""In-memory stand-in for an ``EncounterPokemon`` row.
+
+	It carries the same fields, so battle setup and capture code read either
+	one the same way.
+	"""
+
+	species: str
+	level: int
+	source_kind: str
+	gender: str = ""
+	ability: str = ""
+	nature: str = ""
+	ivs: list[int] = field(default_factory=_zeros)
+	evs: list[int] = field(default_factory=_zeros)
+	held_item: str = ""
+	current_hp: int = 0
+	status: str = ""
+	move_names: list[str] = field(default_factory=list)
+	move_pp: list[int] = field(default_factory=list)
+	npc_trainer: Any = None
+	template_key: str = ""
+	encounter_id: uuid.UUID = field(default_factory=uuid.uuid4)
+	created_at: datetime = field(default_factory=_now)
+	row: Any = None
+
+	@property
+	def name(self) -> str:
+		return self.species
+
+	@property
+	def active_moves(self):
+		return list(self.move_names or [])
+
+	@property
+	def persisted(self) -> bool:
+		return self.row is not None
+
+	def persist(self):
+		"""Write (or refresh) the ``EncounterPokemon`` row for this encounter."""
+
+		from pokemon.models.core import EncounterPokemon
+
+		values = {
+			"species": self.species,
+			"level": self.level,
+			"source_kind": self.source_kind,
+			"gender": self.gender,
+			"ability": self.ability,
+			"nature": self.nature,
+			"ivs": list(self.ivs),
+			"evs": list(self.evs),
+			"held_item": self.held_item,
+			"current_hp": self.current_hp,
+			"status": self.status,
+			"move_names": list(self.move_names),
+			"move_pp": list(self.move_pp),
+			"npc_trainer": self.npc_trainer,
+			"template_key": self.template_key,
+		}
+		self.row, _ = EncounterPokemon.objects.update_or_create(encounter_id=self.encounter_id, defaults=values)
+		return self.row
+
+	def delete(self) -> None:
+		"""Drop this encounter from the pool and delete its row, if any."""
+
+		_POOL.pop(str(self.encounter_id), None)
+		if self.row is not None:
+			self.row.delete()
+			self.row = None
+
+
+_POOL: dict[str, PooledEncounter] = {}
+
 
 def create_encounter_pokemon(
 	*,
@@ -22,18 +131,19 @@ def create_encounter_pokemon(
 	move_pp: list[int] | None = None,
 	npc_trainer=None,
 	template_key: str = "",
+	persist: bool = False,
 ):
-	from pokemon.models.core import EncounterPokemon
+	"""Return a pooled encounter; ``persist=True`` also writes its row now."""
 
-	encounter = EncounterPokemon.objects.create(
+	encounter = PooledEncounter(
 		species=species,
 		level=level,
 		source_kind=source_kind,
 		gender=gender,
 		ability=ability,
 		nature=nature,
-		ivs=list(ivs or [0, 0, 0, 0, 0, 0]),
-		evs=list(evs or [0, 0, 0, 0, 0, 0]),
+		ivs=list(ivs or _zeros()),
+		evs=list(evs or _zeros()),
 		held_item=held_item,
 		current_hp=current_hp,
 		status=status,
@@ -42,16 +152,33 @@ def create_encounter_pokemon(
 		npc_trainer=npc_trainer,
 		template_key=template_key,
 	)
+	_POOL[str(encounter.encounter_id)] = encounter
+	if persist:
+		encounter.persist()
 	return encounter
 
 
+def pooled_encounter(identifier) -> PooledEncounter | None:
+	"""Return the pooled encounter with ``identifier`` (an id, not a ref)."""
+
+	return _POOL.get(str(identifier))
+
+
+def pooled_encounter_count() -> int:
+	return len(_POOL)
+
+
 def get_encounter_from_ref(model_id):
-	from pokemon.models.core import EncounterPokemon
 	from pokemon.services.pokemon_refs import parse_pokemon_ref
 
 	kind, identifier = parse_pokemon_ref(model_id)
 	if kind != "encounter" or not identifier:
 		return None
+	pooled = _POOL.get(identifier)
+	if pooled is not None:
+		return pooled
+	from pokemon.models.core import EncounterPokemon
+
 	return EncounterPokemon.objects.filter(encounter_id=identifier).first()
 
 
@@ -65,3 +192,47 @@ def delete_encounter_by_ref(model_id) -> bool:
 
 def encounter_ref(encounter) -> str | None:
 	return build_encounter_ref(getattr(encounter, "encounter_id", None))
+
+
+def persist_pooled_encounters() -> int:
+	"""Write a row for every pooled encounter that has none; return the count."""
+
+	written = 0
+	for encounter in list(_POOL.values()):
+		if not encounter.persisted:
+			encounter.persist()
+			written += 1
+	return written
+
+
+def sweep_stale_encounters(
+	*,
+	older_than: timedelta = DEFAULT_STALE_AFTER,
+	batch_size: int = SWEEP_BATCH_SIZE,
+	now: datetime | None = None,
+) -> int:
+	"""Delete encounters created before ``now - older_than``; return the count.
+
+	Pooled entries are dropped first, then rows are deleted oldest first in
+	``batch_size`` chunks walked along the ``created_at`` index.
+	"""
+
+	cutoff = (now or _now()) - older_than
+	removed = 0
+	for encounter in list(_POOL.values()):
+		if encounter.created_at < cutoff:
+			encounter.delete()
+			removed += 1
+
+	from pokemon.models.core import EncounterPokemon
+
+	stale = EncounterPokemon.objects.filter(created_at__lt=cutoff).order_by("created_at")
+	while True:
+		batch = list(stale.values_list("encounter_id", flat=True)[:batch_size])
+		if not batch:
+			break
+		EncounterPokemon.objects.filter(encounter_id__in=batch).delete()
+		removed += len(batch)
+		if len(batch) < batch_size:
+			break
+	return removed
@@ -208,19 +208,13 @@ def level_up_move_names_for_pokemon(pokemon) -> list[str]:
 	level = _pokemon_level(pokemon)
 
 	try:
-		from pokemon.middleware import get_moveset_by_name
+		from pokemon.middleware import get_level_up_moves
 
-		_, moveset = get_moveset_by_name(species)
+		level_moves = [(int(lvl), str(move)) for lvl, move in get_level_up_moves(species, level)]
 	except Exception:
-		moveset = None
-
-	if moveset:
-		level_moves = [
-			(int(lvl), str(move))
-			for lvl, move in moveset.get("level-up", [])
-			if int(lvl) <= level
-		]
-		level_moves.sort(key=lambda row: row[0])
+		level_moves = []
+
+	if level_moves:
 		moves: list[str] = []
 		seen: set[str] = set()
 		for _lvl, move in level_moves:
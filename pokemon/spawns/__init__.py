@@ -14,6 +14,7 @@ from .constants import (
     SpawnFrequency,
 )
 from .schema import (
+    IndexedSpawnChart,
     RotationBucket,
     SpawnChart,
     SpawnContext,
@@ -39,6 +40,13 @@ from .preview import (
     format_spawn_preview,
     parse_preview_band,
 )
+from .rollengine import (
+    BandRollTable,
+    compile_band_roll_table,
+    confidence_intervals,
+    roll_batch,
+    wilson_interval,
+)
 from .rolltest import (
     DEFAULT_ROLL_TEST_BAND,
     DEFAULT_ROLL_TEST_COUNT,
@@ -155,6 +163,11 @@ from .alpha_sync import (
     load_alpha_seed_charts,
     parse_alpha_seed_charts,
 )
+from .revision import (
+    SPAWN_CHART_REVISION_ATTR,
+    bump_spawn_chart_revision,
+    spawn_chart_revision,
+)
 from .adapters import (
     SpawnAdapterError,
     coerce_spawn_data_entries,
@@ -165,6 +178,12 @@ from .adapters import (
     spawn_chart_from_room,
     spawn_chart_from_spawn_table,
 )
+from .chart_cache import (
+    SPAWN_CHART_CACHE_ATTR,
+    cached_spawn_chart_for_room,
+    clear_cached_spawn_chart,
+    compile_spawn_chart,
+)
 
 __all__ = [
     "ACTIVE_COUNTS",
@@ -176,12 +195,14 @@ __all__ = [
     "SpawnBandDefinition",
     "SpawnAdapterError",
     "SpawnChart",
+    "IndexedSpawnChart",
     "SpawnContext",
     "SpawnEntry",
     "SpawnFrequency",
     "SpawnRollResult",
     "SpawnRollTestOptions",
     "SpawnRollTestResult",
+    "BandRollTable",
     "ComparableSpawnEntry",
     "SpawnCompareError",
     "SpawnComparison",
@@ -268,6 +289,10 @@ __all__ = [
     "parse_preview_band",
     "parse_rolltest_args",
     "run_spawn_roll_test",
+    "compile_band_roll_table",
+    "confidence_intervals",
+    "roll_batch",
+    "wilson_interval",
     "compare_room_spawns",
     "compare_spawn_entries",
     "comparable_entries_from_chart",
@@ -298,4 +323,11 @@ __all__ = [
     "spawn_chart_from_hunt_chart",
     "spawn_chart_from_room",
     "spawn_chart_from_spawn_table",
+    "SPAWN_CHART_REVISION_ATTR",
+    "bump_spawn_chart_revision",
+    "spawn_chart_revision",
+    "SPAWN_CHART_CACHE_ATTR",
+    "cached_spawn_chart_for_room",
+    "clear_cached_spawn_chart",
+    "compile_spawn_chart",
 ]
@@ -10,6 +10,7 @@ from typing import Any, Callable, Iterable
 
 from .adapters import SpawnAdapterError, coerce_spawn_data_entries, normalize_band, normalize_frequency
 from .preview import format_species_group
+from .revision import bump_spawn_chart_revision
 
 
 ALPHA_SEED_PATH = Path(__file__).resolve().parents[2] / "world" / "alpha_test_zone.ev"
@@ -182,6 +183,7 @@ def apply_alpha_spawn_seed_updates(
             )
         seed_entries = copy.deepcopy(seed_charts[room_diff.room_key])
         getattr(live_room, "db").hunt_chart = seed_entries
+        bump_spawn_chart_revision(live_room)
         updated_rooms.append(
             AlphaRoomApplyResult(
                 room_key=room_diff.room_key,
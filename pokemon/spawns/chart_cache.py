@@ -0,0 +1,62 @@
+"""Process-level cache of compiled room spawn charts.
+
+Converting ``room.db`` spawn data into a :class:`SpawnChart` and validating
+every entry is repeated by each preview, compare, roll test and rotation
+refresh.  :func:`cached_spawn_chart_for_room` instead keeps the validated,
+band-indexed :class:`IndexedSpawnChart` on ``room.ndb`` keyed by area key
+and only rebuilds it when the room's spawn chart revision (see
+:mod:`pokemon.spawns.revision`) moves on, which every writer of
+``hunt_chart``/``spawn_table`` does after an edit.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .adapters import _area_key_from_room, _safe_getattr, spawn_chart_from_room
+from .revision import spawn_chart_revision
+from .schema import IndexedSpawnChart, SpawnChart
+from .selection import validate_spawn_chart
+
+
+SPAWN_CHART_CACHE_ATTR = "compiled_spawn_charts"
+
+
+def compile_spawn_chart(chart: SpawnChart, revision: int = 0) -> IndexedSpawnChart:
+    """Validate ``chart`` once and return its indexed form."""
+
+    if isinstance(chart, IndexedSpawnChart) and chart.revision == revision:
+        return chart
+    validate_spawn_chart(chart)
+    return IndexedSpawnChart(area_key=chart.area_key, entries=list(chart.entries), revision=revision)
+
+
+def cached_spawn_chart_for_room(room: Any, area_key: Any = None) -> IndexedSpawnChart:
+    """Return ``room``'s compiled spawn chart, recompiling after edits.
+
+    Rooms without an ``ndb`` handler are compiled on every call.
+    """
+
+    resolved_area_key = _area_key_from_room(room, area_key=area_key)
+    revision = spawn_chart_revision(room)
+    ndb = _safe_getattr(room, "ndb")
+    cache = _safe_getattr(ndb, SPAWN_CHART_CACHE_ATTR)
+    compiled = cache.get(resolved_area_key) if isinstance(cache, dict) else None
+    if compiled is not None and compiled.revision == revision:
+        return compiled
+
+    compiled = compile_spawn_chart(spawn_chart_from_room(room, area_key=resolved_area_key), revision)
+    if ndb is not None:
+        if not isinstance(cache, dict):
+            cache = {}
+            setattr(ndb, SPAWN_CHART_CACHE_ATTR, cache)
+        cache[resolved_area_key] = compiled
+    return compiled
+
+
+def clear_cached_spawn_chart(room: Any) -> None:
+    """Drop every compiled chart cached on ``room``."""
+
+    ndb = _safe_getattr(room, "ndb")
+    if ndb is not None and _safe_getattr(ndb, SPAWN_CHART_CACHE_ATTR) is not None:
+        setattr(ndb, SPAWN_CHART_CACHE_ATTR, {})
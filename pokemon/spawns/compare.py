@@ -9,7 +9,8 @@ from typing import Any
 
 from utils.pokemon_config import TIERS as LIVE_TIERS
 
-from .adapters import SpawnAdapterError, coerce_spawn_data_entries, spawn_chart_from_room
+from .adapters import SpawnAdapterError, coerce_spawn_data_entries
+from .chart_cache import cached_spawn_chart_for_room
 from .preview import format_species_group
 from .schema import SpawnChart, SpawnEntry
 
@@ -49,7 +50,7 @@ class SpawnComparison:
 
 
 def compare_room_spawns(room: Any, band: int | None = None) -> SpawnComparison:
-    chart = spawn_chart_from_room(room)
+    chart = cached_spawn_chart_for_room(room)
     source = detect_spawn_source(room)
     live_entries = live_spawn_entries_from_room(room)
     new_entries = comparable_entries_from_chart(chart)
@@ -61,6 +61,7 @@ def run_profile_spawn_roll_test(
     count: int = DEFAULT_ROLL_TEST_COUNT,
     requested_count: Optional[int] = None,
     rng: Optional[random.Random] = None,
+    seed: Optional[int] = None,
     chart_resolver: Callable[[str], SpawnChart] = resolve_sample_area,
 ) -> SpawnRollTestResult:
     chart = chart_resolver(area_key)
@@ -70,6 +71,7 @@ def run_profile_spawn_roll_test(
         count=count,
         requested_count=requested_count,
         rng=rng,
+        seed=seed,
     )
 
 
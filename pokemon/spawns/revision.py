@@ -0,0 +1,33 @@
+"""Revision stamps for room spawn data.
+
+Compiled spawn charts are cached per process.  Every writer of a room's
+``hunt_chart`` or ``spawn_table`` bumps the room's revision so the caches
+know to recompile; readers compare the stamp instead of deserializing and
+diffing the chart itself.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+SPAWN_CHART_REVISION_ATTR = "spawn_chart_revision"
+
+
+def spawn_chart_revision(room: Any) -> int:
+    """Return the spawn chart revision stored on ``room`` (``0`` if unset)."""
+
+    db = getattr(room, "db", None)
+    try:
+        return int(getattr(db, SPAWN_CHART_REVISION_ATTR, 0) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def bump_spawn_chart_revision(room: Any) -> int:
+    """Advance and return ``room``'s spawn chart revision after an edit."""
+
+    revision = spawn_chart_revision(room) + 1
+    db = getattr(room, "db", None)
+    if db is not None:
+        setattr(db, SPAWN_CHART_REVISION_ATTR, revision)
+    return revision
@@ -0,0 +1,155 @@
+"""Batched spawn roll engine for large dry-run samples.
+
+:func:`roll_spawn` validates the chart and rescans its entries for every
+roll.  For roll tests the chart is instead validated once and compiled into
+a per-band table that folds the frequency roll, the frequency fallback
+chain and the uniform entry pick into one integer weight per entry, so each
+sample is a single weighted draw with the same distribution as the scalar
+path.  Samples are drawn in chunks with :meth:`random.Random.choices`; pass
+a seed for reproducible runs.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections import Counter
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Mapping, Optional
+
+from .constants import FREQUENCY_WEIGHTS, NORMAL_FREQUENCIES
+from .schema import SpawnChart
+from .selection import _FALLBACK_FREQUENCIES, get_band_definition, validate_spawn_chart
+
+
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_CONFIDENCE_Z = 1.96
+
+
+@dataclass(frozen=True)
+class BandRollTable:
+    """Compiled normal-roll distribution for one chart band."""
+
+    area_key: str
+    band: int
+    species: tuple[str, ...]
+    frequencies: tuple[str, ...]
+    cum_weights: tuple[int, ...]
+
+    @property
+    def total_weight(self) -> int:
+        return self.cum_weights[-1] if self.cum_weights else 0
+
+    def probabilities(self) -> dict[str, float]:
+        """Return the exact chance of rolling each species."""
+
+        result: dict[str, float] = {}
+        previous = 0
+        for species_id, cumulative in zip(self.species, self.cum_weights):
+            result[species_id] = result.get(species_id, 0.0) + (cumulative - previous) / self.total_weight
+            previous = cumulative
+        return result
+
+    def frequency_probabilities(self) -> dict[str, float]:
+        """Return the exact chance of each resolved frequency bucket."""
+
+        result: dict[str, float] = {}
+        previous = 0
+        for frequency, cumulative in zip(self.frequencies, self.cum_weights):
+            result[frequency] = result.get(frequency, 0.0) + (cumulative - previous) / self.total_weight
+            previous = cumulative
+        return result
+
+
+def compile_band_roll_table(chart: SpawnChart, band: int) -> Optional[BandRollTable]:
+    """Validate ``chart`` once and compile its ``band`` roll distribution.
+
+    Returns ``None`` when the band has no enabled normal entries.
+    """
+
+    validate_spawn_chart(chart)
+    get_band_definition(band)
+    buckets: dict[str, list] = {frequency: [] for frequency in NORMAL_FREQUENCIES}
+    for entry in chart.entries:
+        if entry.enabled and entry.band == band and entry.frequency in buckets:
+            buckets[entry.frequency].append(entry)
+
+    # Weight each resolved bucket by the frequency rolls that fall back to it.
+    bucket_weights: dict[str, int] = {}
+    weights = FREQUENCY_WEIGHTS[band]
+    for rolled in NORMAL_FREQUENCIES:
+        if weights[rolled] <= 0:
+            continue
+        resolved = next((f for f in _FALLBACK_FREQUENCIES[rolled] if buckets[f]), None)
+        if resolved is not None:
+            bucket_weights[resolved] = bucket_weights.get(resolved, 0) + weights[rolled]
+    if not bucket_weights:
+        return None
+
+    # Scale so every entry's share of its bucket is a whole number.
+    scale = math.lcm(*(len(buckets[frequency]) for frequency in bucket_weights))
+    species: list[str] = []
+    frequencies: list[str] = []
+    entry_weights: list[int] = []
+    for frequency, weight in bucket_weights.items():
+        share = weight * scale // len(buckets[frequency])
+        for entry in buckets[frequency]:
+            species.append(entry.species_id)
+            frequencies.append(entry.frequency)
+            entry_weights.append(share)
+    return BandRollTable(
+        area_key=chart.area_key,
+        band=band,
+        species=tuple(species),
+        frequencies=tuple(frequencies),
+        cum_weights=tuple(accumulate(entry_weights)),
+    )
+
+
+def roll_batch(
+    table: BandRollTable,
+    count: int,
+    *,
+    rng: Optional[random.Random] = None,
+    seed: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> tuple[Counter[str], Counter[str]]:
+    """Draw ``count`` rolls from ``table``; return frequency and species histograms."""
+
+    if rng is None:
+        rng = random.Random(seed) if seed is not None else random
+    indices = range(len(table.species))
+    index_counts: Counter[int] = Counter()
+    remaining = count
+    while remaining > 0:
+        size = min(remaining, chunk_size)
+        index_counts.update(rng.choices(indices, cum_weights=table.cum_weights, k=size))
+        remaining -= size
+
+    frequency_counts: Counter[str] = Counter()
+    species_counts: Counter[str] = Counter()
+    for index, hits in index_counts.items():
+        frequency_counts[table.frequencies[index]] += hits
+        species_counts[table.species[index]] += hits
+    return frequency_counts, species_counts
+
+
+def wilson_interval(successes: int, trials: int, z: float = DEFAULT_CONFIDENCE_Z) -> tuple[float, float]:
+    """Return the Wilson score interval for a binomial proportion."""
+
+    if trials <= 0:
+        return 0.0, 0.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def confidence_intervals(
+    counts: Mapping[str, int], trials: int, z: float = DEFAULT_CONFIDENCE_Z
+) -> dict[str, tuple[float, float]]:
+    """Return a Wilson interval for each key of ``counts``."""
+
+    return {key: wilson_interval(hits, trials, z) for key, hits in counts.items()}
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import random
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
-from .constants import NORMAL_FREQUENCIES, SPAWN_BANDS, SpawnFrequency
+from .constants import NORMAL_FREQUENCIES, SPAWN_BANDS
+from .rollengine import compile_band_roll_table, confidence_intervals, roll_batch
 from .schema import SpawnChart
-from .selection import eligible_entries, roll_spawn
 
 
 DEFAULT_ROLL_TEST_BAND = 1
@@ -35,6 +35,7 @@ class SpawnRollTestResult:
     frequency_counts: Counter[str]
     species_counts: Counter[str]
     error: str = ""
+    species_intervals: dict[str, tuple[float, float]] = field(default_factory=dict)
 
 
 def parse_rolltest_args(raw_args: str | None) -> SpawnRollTestOptions:
@@ -61,15 +62,22 @@ def run_spawn_roll_test(
     count: int,
     requested_count: Optional[int] = None,
     rng: Optional[random.Random] = None,
+    seed: Optional[int] = None,
 ) -> SpawnRollTestResult:
+    """Roll ``count`` normal spawns for ``band`` of ``chart`` without side effects.
+
+    The chart is validated and compiled once and the rolls are drawn as one
+    batch; pass ``rng`` or ``seed`` for reproducible results.
+    """
+
     if band not in SPAWN_BANDS:
         raise ValueError("Band must be a number from 1 to 4.")
     if count < 1:
         raise ValueError("Count must be a positive number.")
 
     requested = requested_count if requested_count is not None else count
-    rng = rng if rng is not None else random
-    if not _has_normal_entries(chart, band):
+    table = compile_band_roll_table(chart, band)
+    if table is None:
         return SpawnRollTestResult(
             area_key=chart.area_key,
             band=band,
@@ -81,13 +89,7 @@ def run_spawn_roll_test(
             error=f"No normal spawn entries are available for band {band}.",
         )
 
-    frequency_counts: Counter[str] = Counter()
-    species_counts: Counter[str] = Counter()
-    for _ in range(count):
-        result = roll_spawn(chart, band, rng=rng)
-        frequency_counts[result.frequency] += 1
-        species_counts[result.species_id] += 1
-
+    frequency_counts, species_counts = roll_batch(table, count, rng=rng, seed=seed)
     return SpawnRollTestResult(
         area_key=chart.area_key,
         band=band,
@@ -96,6 +98,7 @@ def run_spawn_roll_test(
         successful_rolls=sum(species_counts.values()),
         frequency_counts=frequency_counts,
         species_counts=species_counts,
+        species_intervals=confidence_intervals(species_counts, count),
     )
 
 
@@ -123,7 +126,8 @@ def format_spawn_roll_test(result: SpawnRollTestResult, *, source: str) -> str:
 
     lines.append("Top species:")
     for species_id, count in _top_species(result):
-        lines.append(f"  {species_id}: {count}")
+        low, high = result.species_intervals.get(species_id, (0.0, 0.0))
+        lines.append(f"  {species_id}: {count} (95% CI {low:.1%}-{high:.1%})")
     return "\n".join(lines)
 
 
@@ -147,14 +151,6 @@ def _parse_count(value: str) -> int:
     return count
 
 
-def _has_normal_entries(chart: SpawnChart, band: int) -> bool:
-    return any(
-        eligible_entries(chart, band, frequency=frequency)
-        for frequency in NORMAL_FREQUENCIES
-        if frequency != SpawnFrequency.SPECIAL.value
-    )
-
-
 def _roll_count_line(result: SpawnRollTestResult) -> str:
     if result.requested_count != result.roll_count:
         return f"Roll count: {result.roll_count} (clamped from {result.requested_count})"
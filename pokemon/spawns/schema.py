@@ -21,6 +21,43 @@ class SpawnChart:
     entries: list[SpawnEntry]
 
 
+@dataclass(frozen=True)
+class IndexedSpawnChart(SpawnChart):
+    """A validated chart with its enabled entries indexed by band and frequency.
+
+    Build these with :func:`pokemon.spawns.chart_cache.compile_spawn_chart`;
+    selection helpers trust them without revalidating, so treat the entries
+    as read-only.
+    """
+
+    revision: int = 0
+    by_band: dict[int, dict[str, tuple[SpawnEntry, ...]]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        index: dict[int, dict[str, list[SpawnEntry]]] = {}
+        for entry in self.entries:
+            if entry.enabled:
+                index.setdefault(entry.band, {}).setdefault(entry.frequency, []).append(entry)
+        object.__setattr__(
+            self,
+            "by_band",
+            {
+                band: {frequency: tuple(entries) for frequency, entries in buckets.items()}
+                for band, buckets in index.items()
+            },
+        )
+
+    def entries_for(self, band: int, frequency: Optional[str] = None) -> list[SpawnEntry]:
+        """Return enabled entries for ``band``, optionally of one frequency."""
+
+        buckets = self.by_band.get(band, {})
+        if frequency is not None:
+            return list(buckets.get(frequency, ()))
+        return [entry for entry in self.entries if entry.enabled and entry.band == band]
+
+
 @dataclass(frozen=True)
 class SpawnContext:
     area_key: str
@@ -13,7 +13,7 @@ from .constants import (
     SpawnBandDefinition,
     SpawnFrequency,
 )
-from .schema import RotationBucket, SpawnChart, SpawnEntry, SpawnRollResult
+from .schema import IndexedSpawnChart, RotationBucket, SpawnChart, SpawnEntry, SpawnRollResult
 
 
 _FALLBACK_FREQUENCIES = {
@@ -90,6 +90,8 @@ def validate_spawn_entry(entry: SpawnEntry) -> SpawnEntry:
 
 
 def validate_spawn_chart(chart: SpawnChart) -> SpawnChart:
+    if isinstance(chart, IndexedSpawnChart):
+        return chart
     if not isinstance(chart, SpawnChart):
         raise TypeError("Spawn chart must be a SpawnChart.")
     if not isinstance(chart.area_key, str) or not chart.area_key.strip():
@@ -123,6 +125,8 @@ def eligible_entries(
     get_band_definition(band)
     if frequency is not None and frequency not in FREQUENCIES:
         raise ValueError(f"Unknown spawn frequency: {frequency!r}.")
+    if isinstance(chart, IndexedSpawnChart):
+        return chart.entries_for(band, frequency)
     return [
         entry
         for entry in chart.entries
@@ -14,14 +14,15 @@ from pokemon.spawns.adapters import (
 	SpawnAdapterError,
 	coerce_spawn_data_entries,
 	normalize_frequency,
-	spawn_chart_from_room,
 	spawn_chart_from_spawn_table,
 )
+from pokemon.spawns.chart_cache import cached_spawn_chart_for_room
 from pokemon.spawns.legacy_migration import (
 	recommend_bands_from_level_range,
 	recommend_frequency_from_weight,
 )
 from pokemon.spawns.preview import format_spawn_preview
+from pokemon.spawns.revision import bump_spawn_chart_revision
 from pokemon.spawns.rolltest import format_spawn_roll_test, run_spawn_roll_test
 
 try:
@@ -229,7 +230,7 @@ def _preview_band_value(value) -> int | None:
 def _spawn_outputs_for_room(room) -> tuple[str, str, str]:
 	"""Return preview output for currently saved room spawn data."""
 	try:
-		chart = spawn_chart_from_room(room)
+		chart = cached_spawn_chart_for_room(room)
 		preview_text, roll_text = _format_spawn_outputs(chart, source=_room_spawn_source(room))
 	except (SpawnAdapterError, ValueError) as err:
 		return "", "", str(err)
@@ -262,6 +263,7 @@ def _save_room_encounters(room, settings_data: dict, spawn_entries: list[dict])
 	room.db.spawn_area_key = (settings_data.get("spawn_area_key") or "").strip()
 	room.db.spawn_table = spawn_entries
 	room.db.hunt_chart = []
+	bump_spawn_chart_revision(room)
 
 def _add_aliases(obj, aliases):
 	"""Add aliases through Evennia's one-alias-at-a-time handler API."""
@@ -45,10 +45,16 @@ def at_server_start():
 	This is called every time the server starts up, regardless of
 	how it was shut down.
 	"""
+	from pokemon.battle.callbacks import warm_callback_cache
 	from pokemon.battle.handler import battle_handler
+	from pokemon.services.encounters import sweep_stale_encounters
 
+	# Pre-bind dex callback strings so battle hooks resolve with a dict lookup.
+	warm_callback_cache()
 	battle_handler.restore()
 	battle_handler.rebuild_ndb()
+	# Encounter rows outlive their battle only if it never ended cleanly.
+	sweep_stale_encounters()
 
 
 def at_server_stop():
@@ -57,8 +63,12 @@ def at_server_stop():
 	of it is for a reload, reset or shutdown.
 	"""
 	from pokemon.battle.handler import battle_handler
+	from pokemon.services.encounters import persist_pooled_encounters
 
 	battle_handler.save()
+	# Encounter Pokémon live in memory; write them out so restored battles
+	# can still resolve their ``encounter:`` references.
+	persist_pooled_encounters()
 	# Avoid calling logging.shutdown() here because Evennia and Twisted manage
 	# their own logging shutdown. Forcing it can lead to "I/O operation on
 	# closed file" errors if any component tries to log during shutdown.
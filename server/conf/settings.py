@@ -71,6 +71,7 @@ INSTALLED_APPS += (
 INSTALLED_APPS += (
     "pokemon.apps.PokemonConfig",
     "roomeditor",
+    "bboard.apps.BBoardConfig",
 )
 
 # Allow use of unconventional field names used in legacy models
@@ -10,7 +10,7 @@ from pokemon.models.core import OwnedPokemon
 from pokemon.models.moves import ActiveMoveslot, Move, Moveset, MovesetSlot
 from pokemon.models.stats import (
     add_evs,
-    add_experience,
+    add_experience_batch,
     apply_item_ev_mod,
     award_experience_to_party,
 )
@@ -18,26 +18,97 @@ from pokemon.models.trainer import Trainer
 from utils.locks import clear_battle_lock
 
 
+# Fields of a party entry copied straight onto the matching model.
+MON_FIELDS = ("current_hp", "friendship", "held_item")
+
+
 class CommitAdapter:
-    """Commit post-battle changes back to persistent models."""
+    """Commit post-battle changes back to persistent models.
+
+    Party updates for every participant are applied in memory to Pokémon
+    and move slots fetched with one query each, then written back with
+    ``bulk_update`` inside the single ``transaction.atomic()`` block.
+    """
+
+    @staticmethod
+    def _fetch_party(participants: list[Mapping[str, Any]]) -> dict[str, OwnedPokemon]:
+        uids = {
+            str(pmon["unique_id"])
+            for part in participants
+            for pmon in part.get("party", [])
+            if pmon.get("unique_id")
+        }
+        if not uids:
+            return {}
+        return {str(mon.unique_id): mon for mon in OwnedPokemon.objects.filter(unique_id__in=uids)}
+
+    @staticmethod
+    def _fetch_slots(mons) -> dict[tuple[Any, int], ActiveMoveslot]:
+        if not mons:
+            return {}
+        return {
+            (slot.pokemon_id, slot.slot): slot
+            for slot in ActiveMoveslot.objects.filter(pokemon__in=list(mons))
+        }
 
     @staticmethod
-    def _apply_mon_updates(mon: OwnedPokemon, data: Mapping[str, Any]) -> None:
-        if "current_hp" in data:
-            mon.current_hp = data["current_hp"]
+    def _apply_mon_updates(
+        mon: OwnedPokemon,
+        data: Mapping[str, Any],
+        slots: Mapping[tuple[Any, int], ActiveMoveslot],
+        fields: set[str],
+        changed_slots: list[ActiveMoveslot],
+    ) -> None:
+        for field in MON_FIELDS:
+            if field in data:
+                setattr(mon, field, data[field])
+                fields.add(field)
         if "status" in data:
             mon.status = data["status"]
-        if "friendship" in data:
-            mon.friendship = data["friendship"]
-        if "held_item" in data:
-            mon.held_item = data["held_item"]
         for mv in data.get("moves", []):
-            slot = mv.get("slot")
+            try:
+                slot = slots.get((mon.pk, int(mv.get("slot"))))
+            except (TypeError, ValueError):
+                continue
             pp = mv.get("current_pp")
             if slot is None or pp is None:
                 continue
-            ActiveMoveslot.objects.filter(pokemon=mon, slot=slot).update(current_pp=pp)
-        mon.save()
+            slot.current_pp = pp
+            changed_slots.append(slot)
+
+    @classmethod
+    def _commit_parties(cls, participants: list[Mapping[str, Any]]) -> None:
+        mons = cls._fetch_party(participants)
+        slots = cls._fetch_slots(mons.values())
+        fields: set[str] = set()
+        changed_slots: list[ActiveMoveslot] = []
+        updated: dict[str, OwnedPokemon] = {}
+        exp_awards = []
+        ev_awards = []
+        for part in participants:
+            for pmon in part.get("party", []):
+                uid = pmon.get("unique_id")
+                mon = mons.get(str(uid)) if uid else None
+                if not mon:
+                    continue
+                cls._apply_mon_updates(mon, pmon, slots, fields, changed_slots)
+                updated[str(uid)] = mon
+                if "exp" in pmon:
+                    exp_awards.append((mon, int(pmon["exp"])))
+                if "evs" in pmon:
+                    ev_awards.append((mon, pmon["evs"]))
+
+        if exp_awards:
+            add_experience_batch(exp_awards)
+            fields.update(("total_exp", "level"))
+        for mon, gains in ev_awards:
+            add_evs(mon, apply_item_ev_mod(mon, gains))
+            fields.add("evs")
+
+        if changed_slots:
+            ActiveMoveslot.objects.bulk_update(changed_slots, ["current_pp"])
+        if updated and fields:
+            OwnedPokemon.objects.bulk_update(list(updated.values()), sorted(fields))
 
     @staticmethod
     def _capture(trainer: Trainer | None, spec: Mapping[str, Any]) -> OwnedPokemon:
@@ -58,37 +129,38 @@ class CommitAdapter:
             flags=list(spec.get("flags", []) or []),
         )
         moveset = Moveset.objects.create(pokemon=mon, index=0)
-        for idx, mv in enumerate(spec.get("moves", []), start=1):
-            name = mv.get("name")
-            if not name:
-                continue
-            move_obj, _ = Move.objects.get_or_create(name=name)
-            MovesetSlot.objects.create(moveset=moveset, move=move_obj, slot=idx)
-            ActiveMoveslot.objects.create(
-                pokemon=mon, move=move_obj, slot=idx, current_pp=mv.get("current_pp")
-            )
+        moves = [
+            (idx, mv) for idx, mv in enumerate(spec.get("moves", []), start=1) if mv.get("name")
+        ]
+        names = {mv["name"] for _idx, mv in moves}
+        move_objs = {move.name: move for move in Move.objects.filter(name__in=names)} if names else {}
+        missing = [Move(name=name) for name in sorted(names - set(move_objs))]
+        if missing:
+            Move.objects.bulk_create(missing, ignore_conflicts=True)
+            move_objs = {move.name: move for move in Move.objects.filter(name__in=names)}
+        MovesetSlot.objects.bulk_create(
+            [MovesetSlot(moveset=moveset, move=move_objs[mv["name"]], slot=idx) for idx, mv in moves]
+        )
+        ActiveMoveslot.objects.bulk_create(
+            [
+                ActiveMoveslot(
+                    pokemon=mon, move=move_objs[mv["name"]], slot=idx, current_pp=mv.get("current_pp")
+                )
+                for idx, mv in moves
+            ]
+        )
         mon.active_moveset = moveset
-        mon.save()
+        mon.save(update_fields=["active_moveset"])
         return mon
 
     @classmethod
     def apply(cls, participants: Iterable[Mapping[str, Any]]) -> None:
+        participants = list(participants)
         with transaction.atomic():
+            cls._commit_parties(participants)
             for part in participants:
                 char = part.get("character")
                 trainer = getattr(char, "trainer", None)
-                for pmon in part.get("party", []):
-                    uid = pmon.get("unique_id")
-                    if not uid:
-                        continue
-                    mon = OwnedPokemon.objects.filter(unique_id=uid).first()
-                    if not mon:
-                        continue
-                    cls._apply_mon_updates(mon, pmon)
-                    if "exp" in pmon:
-                        add_experience(mon, int(pmon["exp"]))
-                    if "evs" in pmon:
-                        add_evs(mon, apply_item_ev_mod(mon, pmon["evs"]))
                 exp = part.get("exp")
                 if exp:
                     award_experience_to_party(char, int(exp), part.get("evs"))
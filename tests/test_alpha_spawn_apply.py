@@ -160,6 +160,18 @@ def test_apply_does_not_change_unrelated_attrs():
     assert room.db.notes == "leave me alone"
 
 
+def test_apply_bumps_spawn_chart_revision_of_updated_rooms():
+    seed_charts = {"Alpha Route": [seed_entry()]}
+    room = Room(hunt_chart=[stale_entry()])
+
+    apply_alpha_spawn_seed_updates(
+        seed_charts=seed_charts,
+        live_room_lookup=lookup_from({"Alpha Route": room}),
+    )
+
+    assert room.db.spawn_chart_revision == 1
+
+
 def test_apply_writes_exact_parsed_seed_hunt_chart_as_copy():
     seed_charts = {"Alpha Route": [seed_entry()]}
     room = Room(hunt_chart=[stale_entry()])
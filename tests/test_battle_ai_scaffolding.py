@@ -404,6 +404,91 @@ def test_feature_boss_tolerates_strong_inaccurate_move_more_than_gym_leader():
     assert "risk_tolerance_0.7" in boss_score.reasons
 
 
+def _damage_calc_setup():
+    from pokemon.battle._shared import _normalize_key
+
+    movedex = {
+        _normalize_key(name): types.SimpleNamespace(
+            raw={"name": name, "type": move_type, "category": "Special", "basePower": 90, "accuracy": 100, "pp": 15}
+        )
+        for name, move_type in (("Surf", "Water"), ("Ice Beam", "Ice"))
+    }
+    moves = [types.SimpleNamespace(name=name, pp=None, current_pp=None) for name in ("Surf", "Ice Beam")]
+    user = types.SimpleNamespace(name="Lapras", types=["Water", "Ice"], level=50, stats={"special_attack": 100})
+    target = types.SimpleNamespace(
+        name="Dragonite",
+        types=["Dragon", "Flying"],
+        level=50,
+        hp=150,
+        max_hp=150,
+        stats={"special_defense": 100},
+    )
+    return movedex, moves, user, target
+
+
+def test_damage_calc_profile_scores_from_shared_per_turn_estimates():
+    from pokemon.battle.ai_profiles import DEFAULT_AI_PROFILES
+    from pokemon.battle.ai_scoring import ai_damage_cache, score_ai_moves
+
+    movedex, moves, user, target = _damage_calc_setup()
+    battle = types.SimpleNamespace(turn_count=1)
+    context = types.SimpleNamespace(profile=DEFAULT_AI_PROFILES["gym_leader"])
+
+    def score(on_battle=battle):
+        return score_ai_moves(
+            context,
+            moves,
+            user=user,
+            target=target,
+            movedex=movedex,
+            raw_getter=lambda entry: dict(getattr(entry, "raw", {}) or {}),
+            battle=on_battle,
+        )
+
+    score(types.SimpleNamespace(turn_count=0))  # pays one-off stat helper imports
+    surf, ice_beam = score()
+    assert "damage_calc" in ice_beam.reasons
+    assert "super_effective" in ice_beam.reasons and "resisted" not in ice_beam.reasons
+    assert ice_beam.score > surf.score
+    cache = ai_damage_cache(battle)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    score()
+    assert ai_damage_cache(battle) is cache
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    battle.turn_count = 2
+    assert ai_damage_cache(battle) is not cache
+
+
+def test_damage_calc_budget_falls_back_to_heuristic():
+    import dataclasses
+
+    from pokemon.battle.ai_profiles import DEFAULT_AI_PROFILES
+    from pokemon.battle.ai_scoring import score_ai_moves
+
+    movedex, moves, user, target = _damage_calc_setup()
+    gym = DEFAULT_AI_PROFILES["gym_leader"]
+    spent = dataclasses.replace(gym, scoring=dataclasses.replace(gym.scoring, damage_calc_budget_ms=1e-9))
+    heuristic = dataclasses.replace(gym, scoring=dataclasses.replace(gym.scoring, damage_calc_budget_ms=0.0))
+
+    def score(profile, battle):
+        return score_ai_moves(
+            types.SimpleNamespace(profile=profile),
+            moves,
+            user=user,
+            target=target,
+            movedex=movedex,
+            raw_getter=lambda entry: dict(getattr(entry, "raw", {}) or {}),
+            battle=battle,
+        )
+
+    assert all("damage_budget_exhausted" in move.reasons for move in score(spent, types.SimpleNamespace(turn_count=1)))
+    plain = score(heuristic, types.SimpleNamespace(turn_count=1))
+    assert not any("damage_calc" in move.reasons for move in plain)
+    assert DEFAULT_AI_PROFILES["wild_basic"].scoring.damage_calc_budget_ms == 0.0
+
+
 def _scored_move(key: str, score: float):
     from pokemon.battle.ai_scoring import ScoredAIMove
 
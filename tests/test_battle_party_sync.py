@@ -0,0 +1,88 @@
+"""Tests for the end-of-battle party HP/status sync."""
+
+import sys
+import types
+
+# Ensure real battle modules are used even if other tests stubbed them.
+for name in [key for key in list(sys.modules) if key.startswith("pokemon.battle")]:
+	sys.modules.pop(name)
+
+from pokemon.battle.battleinstance import BattleSession
+
+
+class SyncedMon:
+	saves = []
+
+	class objects:
+		updates = []
+
+		@classmethod
+		def bulk_update(cls, rows, fields):
+			cls.updates.append(([row.unique_id for row in rows], fields))
+
+	def __init__(self, uid):
+		self.unique_id = uid
+		self.current_hp = 30
+		self.status = ""
+
+	def get_max_hp(self):
+		raise AssertionError("max HP should come from the battle-side Pokémon")
+
+	def save(self, **kwargs):
+		SyncedMon.saves.append(self.unique_id)
+
+
+def _participant(prefix, hps):
+	mons = [SyncedMon(f"{prefix}{idx}") for idx in range(len(hps))]
+	calls = []
+
+	def get_party():
+		calls.append(1)
+		return list(mons)
+
+	pokes = [
+		types.SimpleNamespace(model_id=f"owned:{mon.unique_id}", hp=hp, max_hp=40, status="brn" if hp else 0)
+		for mon, hp in zip(mons, hps)
+	]
+	player = types.SimpleNamespace(storage=types.SimpleNamespace(get_party=get_party))
+	return types.SimpleNamespace(player=player, pokemons=pokes), mons, calls
+
+
+def _session(participants):
+	session = BattleSession.__new__(BattleSession)
+	session.logic = types.SimpleNamespace(battle=types.SimpleNamespace(participants=participants))
+	return session
+
+
+def test_party_sync_uses_one_bulk_update_for_all_participants():
+	SyncedMon.objects.updates.clear()
+	SyncedMon.saves.clear()
+	part_a, mons_a, calls_a = _participant("a", [0, 10, 55, 40, 1, 2])
+	part_b, mons_b, calls_b = _participant("b", [20, 30, 0, 0, 0, 0])
+	session = _session([part_a, part_b])
+
+	session._sync_player_pokemon_state()
+
+	assert [mon.current_hp for mon in mons_a] == [0, 10, 40, 40, 1, 2]
+	assert mons_a[1].status == "brn" and mons_a[0].status == ""
+	assert len(SyncedMon.objects.updates) == 1
+	ids, fields = SyncedMon.objects.updates[0]
+	assert ids == [mon.unique_id for mon in mons_a + mons_b]
+	assert fields == ["current_hp", "status"]
+	assert SyncedMon.saves == []
+	assert calls_a == calls_b == [1]
+
+
+def test_party_sync_falls_back_to_row_saves(monkeypatch):
+	SyncedMon.saves.clear()
+
+	def fail(rows, fields):
+		raise RuntimeError("bulk write failed")
+
+	monkeypatch.setattr(SyncedMon.objects, "bulk_update", fail)
+	part, mons, _calls = _participant("c", [5, 6])
+	session = _session([part])
+
+	session._sync_player_pokemon_state()
+
+	assert SyncedMon.saves == ["c0", "c1"]
@@ -0,0 +1,52 @@
+"""Tests for the headless battle simulation runner."""
+
+import random
+
+from pokemon.battle import pokemon_factory
+from pokemon.battle.simulation import BatchReport, SimulationResult, simulate_batch, simulate_battle
+from pokemon.battle.tests.outcome_harness import PokemonSpec
+
+TEAM_A = (PokemonSpec("Pikachu", 20, moves=("Thunderbolt", "Quick Attack")),)
+TEAM_B = (PokemonSpec("Squirtle", 20, moves=("Water Gun", "Tackle")),)
+
+
+def test_same_seed_replays_the_same_battle():
+	first = [simulate_battle(TEAM_A, TEAM_B, seed=seed) for seed in range(3)]
+	second = [simulate_battle(TEAM_A, TEAM_B, seed=seed) for seed in range(3)]
+
+	assert first == second
+	assert all(result.winner in {"A", "B"} and result.turns > 0 for result in first)
+
+
+def test_simulation_leaves_global_random_state_alone():
+	random.seed(7)
+	expected = random.random()
+	random.seed(7)
+	simulate_battle(TEAM_A, TEAM_B, seed=1)
+
+	assert random.random() == expected
+
+
+def test_simulation_does_not_write_encounter_rows(monkeypatch):
+	calls = []
+	monkeypatch.setattr(pokemon_factory, "create_encounter_pokemon", lambda **kwargs: calls.append(kwargs))
+
+	simulate_battle(TEAM_A, TEAM_B, seed=0)
+
+	assert calls == []
+
+
+def test_turn_limit_scores_a_truncated_draw():
+	result = simulate_battle(TEAM_A, TEAM_B, seed=0, max_turns=0)
+
+	assert result == SimulationResult(seed=0, winner=None, turns=0, truncated=True)
+
+
+def test_batch_report_aggregates_seeded_battles():
+	report = simulate_batch(TEAM_A, TEAM_B, battles=4, seed=10, workers=1)
+	results = [simulate_battle(TEAM_A, TEAM_B, seed=seed) for seed in range(10, 14)]
+
+	assert report.battles == 4
+	assert report.wins == BatchReport.from_results(results, 1.0).wins
+	assert report.total_turns == sum(result.turns for result in results)
+	assert "Battles: 4" in report.format()
@@ -0,0 +1,80 @@
+"""Tests for journaled battle persistence on room attributes."""
+
+from types import SimpleNamespace
+
+from pokemon.battle import storage as storage_mod
+from pokemon.battle.battledata import BattleData, Move, Pokemon, Team
+from pokemon.battle.storage import BattleDataWrapper
+
+
+def _data():
+	moves = [Move("tackle"), Move("growl")]
+	for move in moves:
+		move.pp = 35
+	team_a = Team("Ash", [Pokemon("Pikachu", level=5, hp=20, moves=moves, model_id=1)])
+	team_b = Team("Wild", [Pokemon("Pidgey", level=3, hp=15, moves=[Move("gust")])])
+	return BattleData(team_a, team_b)
+
+
+def _room():
+	return SimpleNamespace(db=SimpleNamespace())
+
+
+def test_record_journals_only_changes_and_load_replays_them():
+	room = _room()
+	data = _data()
+	storage = BattleDataWrapper(room, 7)
+	storage.set("data", data.to_dict())
+	storage.set("state", {"declare": {}, "watchers": [1]})
+	checkpoint = room.db.battle_7_data
+
+	mon = data.teams["A"].returnlist()[0]
+	mon.hp = 12
+	mon.boosts["atk"] = 1
+	mon.moves[0].pp = 34
+	data.field.weather = "rain"
+	storage.record(data=data.to_dict(), state={"declare": {"A1": {"move": "tackle"}}, "watchers": [1]})
+
+	entry = room.db.battle_7_journal_1
+	paths = {op[0] for op in entry["data"]}
+	assert ("teams", "A", "pokemon", 0, "moves", 0, "pp") in paths
+	assert ("field", "weather") in paths
+	assert all(path[-1] != "ivs" for path in paths)
+	assert room.db.battle_7_data is checkpoint
+
+	restored, state = BattleDataWrapper(room, 7).load()
+	assert restored == data.to_dict()
+	assert state["declare"] == {"A1": {"move": "tackle"}}
+
+
+def test_journal_is_compacted_into_a_checkpoint(monkeypatch):
+	monkeypatch.setattr(storage_mod, "JOURNAL_COMPACT_EVERY", 2)
+	room = _room()
+	data = _data()
+	storage = BattleDataWrapper(room, 1)
+	storage.record(data=data.to_dict(), state={"watchers": []})
+	mon = data.teams["B"].returnlist()[0]
+	for hp in (14, 13, 12):
+		mon.hp = hp
+		storage.record(data=data.to_dict(), state={"watchers": []})
+
+	assert storage.journal_length() == 0
+	assert room.db.battle_1_data["teams"]["B"]["pokemon"][0]["hp"] == 12
+	assert not hasattr(room.db, "battle_1_journal_1")
+
+
+def test_whole_write_folds_pending_journal():
+	room = _room()
+	data = _data()
+	storage = BattleDataWrapper(room, 2)
+	storage.record(data=data.to_dict(), state={"declare": {}})
+	storage.record(data=data.to_dict(), state={"declare": {"A1": {"run": True}}})
+	assert storage.journal_length() == 1
+
+	data.battle.turn = 5
+	storage.set("data", data.to_dict())
+
+	assert storage.journal_length() == 0
+	assert room.db.battle_2_state == {"declare": {"A1": {"run": True}}}
+	loaded, _ = BattleDataWrapper(room, 2).load()
+	assert loaded["battle"]["turn"] == 5
@@ -131,3 +131,74 @@ def test_initial_state_serializes_for_script_db(monkeypatch):
     assert restored["p1"]["trainer_id"] == 22
     assert restored["hazards"] == {"p1": [], "p2": []}
     assert restored["queue"] == []
+
+
+class _Watcher:
+    def __init__(self, wid, location="arena", ignore=False):
+        self.id = wid
+        self.location = location
+        self.attributes = types.SimpleNamespace(get=lambda key: ignore if key == "battle_ignore_notify" else None)
+        self.received = []
+
+    def msg(self, text):
+        self.received.append(text)
+
+
+def _watcher_module(monkeypatch, watchers):
+    monkeypatch.setenv("PF2_NO_EVENNIA", "1")
+    watchers_module = importlib.import_module("pokemon.battle.watchers")
+    lookups = []
+
+    def fake_search(ref):
+        lookups.append(ref)
+        wid = int(ref.lstrip("#"))
+        return [watchers[wid]] if wid in watchers else []
+
+    monkeypatch.setattr(watchers_module, "search_object", fake_search)
+    return watchers_module, lookups
+
+
+def test_watcher_cache_resolves_each_watcher_once(monkeypatch):
+    watchers = {1: _Watcher(1), 2: _Watcher(2, ignore=True), 3: _Watcher(3, location="lobby")}
+    module, lookups = _watcher_module(monkeypatch, watchers)
+    state = {"watchers": [1, 2, 3, 4]}
+    cache = module.WatcherCache()
+
+    module.notify_watchers(state, "first", room="arena", cache=cache)
+    module.notify_watchers(state, "second", room="arena", cache=cache)
+
+    assert watchers[1].received == ["first", "second"]
+    assert watchers[2].received == []
+    assert watchers[3].received == []
+    assert sorted(lookups) == ["#1", "#2", "#3", "#4"]
+
+    watchers[3].location = "arena"
+    module.notify_watchers(state, "third", room="arena", cache=cache)
+    assert watchers[3].received == ["third"]
+
+
+def test_watcher_batch_coalesces_messages(monkeypatch):
+    watchers = {1: _Watcher(1), 2: _Watcher(2)}
+    module, lookups = _watcher_module(monkeypatch, watchers)
+
+    class Session(module.WatcherManager):
+        def __init__(self):
+            self.state = {"watchers": [1, 2]}
+            self.room = "arena"
+            self.ndb = types.SimpleNamespace()
+
+    session = Session()
+    with session.watcher_batch():
+        session.notify("== Turn 1 ==")
+        with session.watcher_batch():
+            session.notify("Pikachu used Thunderbolt!")
+        assert watchers[1].received == []
+        session.notify("== End of Turn 1 ==")
+
+    expected = ["== Turn 1 ==\nPikachu used Thunderbolt!\n== End of Turn 1 =="]
+    assert watchers[1].received == expected
+    assert watchers[2].received == expected
+    assert len(lookups) == 2
+
+    session.notify("after")
+    assert watchers[1].received[-1] == "after"
@@ -338,21 +338,41 @@ def test_bbseed_reports_created_default_boards(monkeypatch):
 	assert output == "Created 2 default boards. Existing boards left in place: 1."
 
 
-def test_bboard_migrates_legacy_index_reads_to_stable_post_ids():
-	_mod, _menu, restore = load_bboard_commands()
-	bboard_mod = sys.modules["bboard.bboard"]
+def test_legacy_board_rows_convert_index_and_id_reads_to_high_water_marks():
+	from bboard.storage import legacy_board_rows
+
+	posts = [post("p1", "Welcome"), post("p2", "Rules"), post("p3", "Events")]
+	del posts[2]["id"]
+
+	rows, reads = legacy_board_rows(
+		posts,
+		{
+			"#1": 1,
+			"#2": {"post_ids": ["p2", posts[2]["created"].isoformat()]},
+			"#3": ["p1", "p2", "gone"],
+		},
+	)
+
+	assert [(row["seq"], row["post_id"]) for row in rows] == [
+		(1, "p1"),
+		(2, "p2"),
+		(3, posts[2]["created"].isoformat()),
+	]
+	assert reads == {"#1": (1, []), "#2": (0, [2, 3]), "#3": (2, [])}
+
+
+def test_bbread_pages_post_list():
+	mod, _menu, restore = load_bboard_commands()
 	caller = FakeCaller()
-	board = bboard_mod.BBoard()
-	board.key = "Announcements"
-	board.db = FakeDB()
-	board.db.posts = [post("p1", "Welcome"), post("p2", "Rules")]
-	board.db.read_tracking = {caller.dbref: 1}
-	board.locks = FakeLocks()
+	posts = [post(f"p{n % 9 + 1}", f"Post {n}") for n in range(1, 36)]
+	board = FakeBoard("Announcements", posts, sort_order=1)
+	install_boards(mod, [board])
 
 	try:
-		assert board.has_read(caller, 1)
-		assert not board.has_read(caller, 2)
-		board.delete_post(1)
-		assert not board.has_read(caller, 1)
+		output = call(mod.CmdBBRead, caller, "1 #page 2")
 	finally:
 		restore()
+
+	assert "Page 2/2" in output
+	assert " 31" in output and "Post 35" in output
+	assert "Post 30" not in output
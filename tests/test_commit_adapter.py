@@ -2,7 +2,19 @@ import sys
 import types
 
 
+def _matches(obj, kwargs):
+    for key, value in kwargs.items():
+        if key.endswith("__in"):
+            if getattr(obj, key[: -len("__in")]) not in value:
+                return False
+        elif getattr(obj, key) != value:
+            return False
+    return True
+
+
 def setup_env(monkeypatch):
+    queries = []
+
     class DummyQuery(list):
         def first(self):
             return self[0] if self else None
@@ -28,8 +40,12 @@ def setup_env(monkeypatch):
             self.total_exp = kwargs.get("total_exp", 0)
             self.status = kwargs.get("status", "")
 
-        def save(self):
-            pass
+        @property
+        def pk(self):
+            return self.unique_id
+
+        def save(self, **kwargs):
+            queries.append("save")
 
     class OwnedManager:
         def __init__(self):
@@ -41,8 +57,11 @@ def setup_env(monkeypatch):
             return obj
 
         def filter(self, **kwargs):
-            res = [obj for obj in self.store.values() if all(getattr(obj, k) == v for k, v in kwargs.items())]
-            return DummyQuery(res)
+            queries.append("select")
+            return DummyQuery(obj for obj in self.store.values() if _matches(obj, kwargs))
+
+        def bulk_update(self, objs, fields):
+            queries.append("update")
 
     OwnedPokemon.objects = OwnedManager()
 
@@ -55,6 +74,10 @@ def setup_env(monkeypatch):
             self.slot = slot
             self.current_pp = current_pp
 
+        @property
+        def pokemon_id(self):
+            return self.pokemon.unique_id
+
         def save(self):
             pass
 
@@ -67,9 +90,17 @@ def setup_env(monkeypatch):
             self.store.append(obj)
             return obj
 
+        def bulk_create(self, objs):
+            queries.append("insert")
+            self.store.extend(objs)
+            return objs
+
         def filter(self, **kwargs):
-            res = [obj for obj in self.store if all(getattr(obj, k) == v for k, v in kwargs.items())]
-            return DummyQuery(res)
+            queries.append("select")
+            return DummyQuery(obj for obj in self.store if _matches(obj, kwargs))
+
+        def bulk_update(self, objs, fields):
+            queries.append("update")
 
     ActiveMoveslot.objects = ActiveManager()
 
@@ -114,6 +145,11 @@ def setup_env(monkeypatch):
             self.store.append(obj)
             return obj
 
+        def bulk_create(self, objs):
+            queries.append("insert")
+            self.store.extend(objs)
+            return objs
+
     MovesetSlot.objects = MovesetSlotManager()
 
     class Move:
@@ -134,6 +170,16 @@ def setup_env(monkeypatch):
                 return obj, True
             return obj, False
 
+        def filter(self, **kwargs):
+            queries.append("select")
+            return DummyQuery(obj for obj in self.store.values() if _matches(obj, kwargs))
+
+        def bulk_create(self, objs, ignore_conflicts=False):
+            queries.append("insert")
+            for obj in objs:
+                self.store.setdefault(obj.name, obj)
+            return objs
+
     Move.objects = MoveManager()
 
     fake_core = types.ModuleType("pokemon.models.core")
@@ -175,8 +221,12 @@ def setup_env(monkeypatch):
     def apply_item_ev_mod(mon, gains):
         return gains
 
+    def add_experience_batch(awards):
+        for mon, amount in awards:
+            add_experience(mon, amount)
+
     fake_stats.award_experience_to_party = award_experience_to_party
-    fake_stats.add_experience = add_experience
+    fake_stats.add_experience_batch = add_experience_batch
     fake_stats.add_evs = add_evs
     fake_stats.apply_item_ev_mod = apply_item_ev_mod
     monkeypatch.setitem(sys.modules, "pokemon.models.stats", fake_stats)
@@ -198,11 +248,11 @@ def setup_env(monkeypatch):
 
     monkeypatch.delitem(sys.modules, "services.battle.commit_adapter", raising=False)
 
-    return OwnedPokemon, ActiveMoveslot, Move
+    return OwnedPokemon, ActiveMoveslot, Move, queries
 
 
 def test_commit_updates(monkeypatch):
-    OwnedPokemon, ActiveMoveslot, Move = setup_env(monkeypatch)
+    OwnedPokemon, ActiveMoveslot, Move, queries = setup_env(monkeypatch)
     from services.battle.commit_adapter import CommitAdapter
 
     move, _ = Move.objects.get_or_create("Tackle")
@@ -271,7 +321,7 @@ def test_commit_updates(monkeypatch):
 
 
 def test_commit_capture(monkeypatch):
-    OwnedPokemon, ActiveMoveslot, Move = setup_env(monkeypatch)
+    OwnedPokemon, ActiveMoveslot, Move, queries = setup_env(monkeypatch)
     from services.battle.commit_adapter import CommitAdapter
 
     char = types.SimpleNamespace(
@@ -296,3 +346,36 @@ def test_commit_capture(monkeypatch):
     assert slot.current_pp == 35
     assert bulba.level == 5
     assert not hasattr(char.db, "battle_lock")
+
+
+def test_commit_query_count_is_independent_of_party_size(monkeypatch):
+    OwnedPokemon, ActiveMoveslot, Move, queries = setup_env(monkeypatch)
+    from services.battle.commit_adapter import CommitAdapter
+
+    move, _ = Move.objects.get_or_create("Tackle")
+
+    def party_spec(count):
+        party = []
+        for idx in range(count):
+            mon = OwnedPokemon.objects.create(species="Pidgey", current_hp=10, evs={})
+            for slot in range(1, 5):
+                ActiveMoveslot.objects.create(pokemon=mon, move=move, slot=slot, current_pp=10)
+            party.append(
+                {
+                    "unique_id": mon.unique_id,
+                    "current_hp": idx,
+                    "moves": [{"slot": slot, "current_pp": 5} for slot in range(1, 5)],
+                    "exp": 10,
+                    "evs": {"speed": 1},
+                }
+            )
+        return {"character": None, "party": party}
+
+    counts = []
+    for size in (1, 6):
+        queries.clear()
+        CommitAdapter.apply([party_spec(size), party_spec(size)])
+        counts.append(len(queries))
+
+    assert counts[0] == counts[1] == 4
+    assert all(slot.current_pp == 5 for slot in ActiveMoveslot.objects.store)
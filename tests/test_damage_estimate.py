@@ -0,0 +1,69 @@
+"""Tests for the side-effect-free damage estimate used by AI scoring."""
+
+import random
+
+from pokemon.battle.damage import DamageEstimate, damage_calc, estimate_damage
+from pokemon.dex.entities import Move, Pokemon, Stats
+
+
+def _pokemon(name, types, **stats):
+	values = dict(hp=100, attack=50, defense=50, special_attack=50, special_defense=50, speed=50)
+	values.update(stats)
+	pokemon = Pokemon(name=name, num=1, types=types, base_stats=Stats(**values))
+	pokemon.level = 50
+	return pokemon
+
+
+def _move(**raw):
+	raw = {"type": "Water", "category": "Special", "basePower": 80, **raw}
+	return Move(
+		name="Test Move",
+		num=1,
+		type=raw["type"],
+		category=raw["category"],
+		power=raw["basePower"],
+		accuracy=True,
+		raw=raw,
+	)
+
+
+def test_estimate_brackets_every_non_critical_damage_roll():
+	attacker = _pokemon("Attacker", ["Water"], special_attack=90)
+	target = _pokemon("Target", ["Fire"], special_defense=70)
+
+	estimate = estimate_damage(attacker, target, _move())
+	rolls = []
+	for seed in range(200):
+		result = damage_calc(attacker, target, _move(), rng=random.Random(seed))
+		if not result.debug["critical"][0]:
+			rolls.append(result.debug["damage"][0])
+
+	assert (estimate.stab, estimate.effectiveness) == (1.5, 2.0)
+	assert (estimate.min_damage, estimate.max_damage) == (min(rolls), max(rolls))
+
+
+def test_estimate_runs_no_rolls_and_leaves_move_untouched():
+	attacker = _pokemon("Attacker", ["Normal"])
+	target = _pokemon("Target", ["Normal"])
+	move = _move(type="Normal", category="Physical", multihit=[2, 5], secondary={"chance": 100, "status": "brn"})
+	state = random.getstate()
+
+	estimate = estimate_damage(attacker, target, move)
+
+	assert random.getstate() == state
+	assert getattr(target, "status", None) is None
+	assert move.power == 80 and not hasattr(move, "hit")
+	assert estimate.hits == 3.0
+	assert estimate.expected == (estimate.min_damage + estimate.max_damage) / 2 * 3.0
+
+
+def test_estimate_special_cases():
+	attacker = _pokemon("Attacker", ["Normal"])
+	target = _pokemon("Target", ["Ghost"])
+
+	assert estimate_damage(attacker, target, _move(category="Status", basePower=0)) == DamageEstimate()
+	assert estimate_damage(attacker, target, _move(damageCallback="superfang")) is None
+	assert estimate_damage(attacker, target, _move(type="Normal", category="Physical")).max_damage == 0
+	fixed = estimate_damage(attacker, _pokemon("Target", ["Water"]), _move(damage="level"))
+	assert (fixed.min_damage, fixed.max_damage) == (50, 50)
+	assert fixed.ko_chance(50) == 1.0 and fixed.ko_chance(51) == 0.0
@@ -0,0 +1,58 @@
+from pokemon.dex import snapshot
+from pokemon.dex.entities import Ability
+
+
+def _tables():
+	static = Ability(name="Static", num=9, raw={"onDamagingHit": "Static.onDamagingHit"})
+	return {
+		"ABILITYDEX": {"Static": static},
+		"POKEDEX": {"Pikachu": {"abilities": {"0": static}}},
+		"MOVEDEX": {},
+		"ITEMDEX": {},
+		"CONDITIONDEX": {},
+	}
+
+
+def test_snapshot_round_trip_preserves_shared_entities(tmp_path, monkeypatch):
+	path = tmp_path / "dex.pickle"
+	builds = []
+
+	def build():
+		builds.append(1)
+		return _tables()
+
+	monkeypatch.setattr(snapshot, "source_fingerprint", lambda paths=None: "v1")
+	first = snapshot.load_dex_tables(build, path)
+	second = snapshot.load_dex_tables(build, path)
+
+	assert len(builds) == 1
+	assert second["ABILITYDEX"]["Static"] == first["ABILITYDEX"]["Static"]
+	assert second["POKEDEX"]["Pikachu"]["abilities"]["0"] is second["ABILITYDEX"]["Static"]
+
+
+def test_snapshot_rebuilds_when_sources_change(tmp_path, monkeypatch):
+	path = tmp_path / "dex.pickle"
+	source = tmp_path / "movesdex.py"
+	source.write_text("py_dict = {}\n")
+	builds = []
+
+	def build():
+		builds.append(1)
+		return _tables()
+
+	monkeypatch.setattr(snapshot, "source_paths", lambda: [source])
+	snapshot.load_dex_tables(build, path)
+	snapshot.load_dex_tables(build, path)
+	source.write_text("py_dict = {'tackle': {}}\n")
+	snapshot.load_dex_tables(build, path)
+
+	assert len(builds) == 2
+
+
+def test_snapshot_can_be_disabled(tmp_path, monkeypatch):
+	path = tmp_path / "dex.pickle"
+	monkeypatch.setenv("PF2_DEX_SNAPSHOT", "0")
+
+	snapshot.load_dex_tables(_tables, path)
+
+	assert not path.exists()
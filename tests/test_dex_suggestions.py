@@ -1,11 +1,16 @@
 import sys
 import types
+from difflib import get_close_matches
 
 from utils.dex_suggestions import (
+	SuggestionIndex,
 	is_known_species,
 	item_not_found_message,
 	move_not_found_message,
+	normalize_dex_key,
+	pokemon_index,
 	species_not_found_message,
+	suggest_pokemon_name,
 )
 
 
@@ -33,3 +38,27 @@ def test_move_and_item_messages_append_suggestions(monkeypatch):
 	assert item_not_found_message("Potoin", "No item found.") == (
 		"No item found. Did you mean Potion?"
 	)
+
+
+def test_pokemon_index_is_reused_until_dex_changes(monkeypatch):
+	fake_dex = types.ModuleType("pokemon.dex")
+	fake_dex.POKEDEX = {"pikachu": {"name": "Pikachu"}}
+	monkeypatch.setitem(sys.modules, "pokemon.dex", fake_dex)
+
+	index = pokemon_index()
+	assert pokemon_index() is index
+	assert suggest_pokemon_name("Pikachoo") == "Pikachu"
+
+	fake_dex.POKEDEX["raichu"] = {"name": "Raichu"}
+	assert pokemon_index() is not index
+	assert suggest_pokemon_name("Raichoo") == "Raichu"
+
+
+def test_index_matches_get_close_matches_scoring():
+	names = ["Tr95", "Tr93", "Potion", "Protein", "Thunderbolt", "Thunder", "Mew", "Mewtwo"]
+	index = SuggestionIndex(names)
+
+	for query in ["T0r5", "Protein", "Thunderblt", "Mewto", "Meww", "zzz"]:
+		lookup = {normalize_dex_key(name): name for name in names if normalize_dex_key(name) != normalize_dex_key(query)}
+		match = get_close_matches(normalize_dex_key(query), lookup.keys(), n=1, cutoff=0.74)
+		assert index.closest(query) == (lookup[match[0]] if match else None)
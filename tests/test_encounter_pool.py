@@ -0,0 +1,136 @@
+"""Tests for pooled encounter Pokémon and the stale-row sweeper."""
+
+import sys
+import types
+from datetime import datetime, timedelta
+
+import pytest
+
+from pokemon.services import encounters
+
+
+class FakeQuerySet:
+	"""Lazy like a Django queryset: every read re-runs the filter."""
+
+	def __init__(self, manager, filters, order=None):
+		self.manager = manager
+		self.filters = filters
+		self.order = order
+
+	def _rows(self):
+		rows = [row for row in self.manager.rows if self.manager.matches(row, self.filters)]
+		return sorted(rows, key=lambda row: getattr(row, self.order)) if self.order else rows
+
+	def order_by(self, field):
+		return FakeQuerySet(self.manager, self.filters, field)
+
+	def values_list(self, field, flat=False):
+		return [getattr(row, field) for row in self._rows()]
+
+	def first(self):
+		rows = self._rows()
+		return rows[0] if rows else None
+
+	def delete(self):
+		for row in self._rows():
+			row.delete()
+
+
+class FakeManager:
+	def __init__(self):
+		self.rows = []
+		self.writes = 0
+
+	def matches(self, row, filters):
+		for key, value in filters.items():
+			if key.endswith("__lt"):
+				matched = getattr(row, key[:-4]) < value
+			elif key.endswith("__in"):
+				matched = getattr(row, key[:-4]) in value
+			else:
+				matched = str(getattr(row, key)) == str(value)
+			if not matched:
+				return False
+		return True
+
+	def filter(self, **kwargs):
+		return FakeQuerySet(self, kwargs)
+
+	def update_or_create(self, encounter_id, defaults):
+		self.writes += 1
+		row = self.filter(encounter_id=encounter_id).first()
+		if row is None:
+			row = FakeRow(self, encounter_id=encounter_id, created_at=datetime(2026, 1, 1, 12))
+			self.rows.append(row)
+		row.__dict__.update(defaults)
+		return row, True
+
+
+class FakeRow(types.SimpleNamespace):
+	def __init__(self, manager, **fields):
+		super().__init__(**fields)
+		self._manager = manager
+
+	def delete(self):
+		self._manager.rows.remove(self)
+
+
+@pytest.fixture
+def rows(monkeypatch):
+	manager = FakeManager()
+	core = types.ModuleType("pokemon.models.core")
+	core.EncounterPokemon = types.SimpleNamespace(objects=manager)
+	monkeypatch.setitem(sys.modules, "pokemon.models.core", core)
+	monkeypatch.setattr(encounters, "_POOL", {})
+	return manager
+
+
+def _create(**kwargs):
+	return encounters.create_encounter_pokemon(species="Pidgey", level=3, source_kind="wild", **kwargs)
+
+
+def test_encounters_stay_in_memory_until_deleted(rows):
+	encounter = _create(move_names=["Tackle"], current_hp=15)
+	ref = encounters.encounter_ref(encounter)
+
+	assert rows.writes == 0
+	assert encounters.get_encounter_from_ref(ref) is encounter
+	assert (encounter.name, encounter.active_moves, encounter.ivs) == ("Pidgey", ["Tackle"], [0] * 6)
+
+	assert encounters.delete_encounter_by_ref(ref) is True
+	assert encounters.pooled_encounter_count() == 0
+	assert encounters.delete_encounter_by_ref(ref) is False
+	assert rows.writes == 0
+
+
+def test_persisted_encounters_survive_losing_the_pool(rows):
+	first = _create()
+	second = _create(persist=True)
+
+	assert rows.writes == 1
+	assert encounters.persist_pooled_encounters() == 1
+	assert encounters.persist_pooled_encounters() == 0
+
+	encounters._POOL.clear()  # what a server reload does
+	row = encounters.get_encounter_from_ref(encounters.encounter_ref(first))
+	assert row.species == "Pidgey" and row is not first
+	assert encounters.delete_encounter_by_ref(encounters.encounter_ref(second)) is True
+	assert len(rows.rows) == 1
+
+
+def test_sweeper_removes_stale_pool_entries_and_rows_in_batches(rows):
+	now = datetime(2026, 1, 2, 12)
+	fresh = _create()
+	for _ in range(5):
+		_create(persist=True).created_at = now - timedelta(days=2)
+	encounters._POOL.clear()
+	orphan = _create()
+	orphan.created_at = now - timedelta(days=1)
+	encounters._POOL[str(fresh.encounter_id)] = fresh
+	fresh.created_at = now
+
+	removed = encounters.sweep_stale_encounters(now=now, batch_size=2)
+
+	assert removed == 6
+	assert rows.rows == []
+	assert encounters.pooled_encounter(fresh.encounter_id) is fresh
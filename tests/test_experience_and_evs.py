@@ -41,10 +41,12 @@ stats_mod.POKEDEX = pokemon_dex.POKEDEX
 from pokemon.models.stats import (
 	add_evs,
 	add_experience,
+	add_experience_batch,
 	calculate_stats,
 	exp_for_level,
 	get_trainer_xp,
 	level_for_exp,
+	levels_for_exp,
 	set_trainer_xp,
 )
 
@@ -67,6 +69,35 @@ def test_add_experience_updates_level():
 	assert mon.level == 10
 
 
+def test_level_lookup_matches_formula_scan():
+	def scan(exp, rate):
+		level = 1
+		for lvl in range(1, 101):
+			if exp < stats_mod._exp_formula(lvl, stats_mod._normalize_growth_rate(rate)):
+				break
+			level = lvl
+		return level
+
+	rates = ["Fast", "Medium Fast", "medium-slow", "Slow", "Fluctuating", "Erratic", None]
+	for rate in rates:
+		for exp in (-100, 0, 1, 7, 8, 999, 125000, 10**7):
+			assert level_for_exp(exp, rate) == scan(exp, rate)
+	assert levels_for_exp([8, 8, 0], ["medium_fast", "slow", "fast"]) == [2, 1, 1]
+
+
+def test_add_experience_batch_levels_whole_party():
+	mons = [
+		types.SimpleNamespace(experience=0, level=1, growth_rate="medium_fast"),
+		types.SimpleNamespace(total_exp=0, level=1, growth_rate="slow"),
+		types.SimpleNamespace(experience=0, level=1, growth_rate="fast"),
+	]
+	add_experience_batch([(mons[0], 1000), (mons[1], 1250), (mons[2], 0)])
+
+	assert [mon.level for mon in mons] == [10, 10, 1]
+	assert mons[1].total_exp == 1250
+	assert mons[2].experience == 0
+
+
 def test_set_trainer_xp_updates_legacy_and_named_attrs():
 	player = types.SimpleNamespace(db=types.SimpleNamespace(txp=12))
 
@@ -515,3 +515,56 @@ def test_return_appearance_items_in_sr_mode_are_plain_text():
                 item_line = next((line for line in lines if line.strip().startswith("- Potion")), "")
                 assert item_line.strip() == "- Potion #201"
                 assert "|" not in item_line  # item line should be plain text
+
+
+def test_return_appearance_reuses_cached_layers_until_invalidated():
+        with load_rooms_module() as rooms:
+                room = rooms.FusionRoom()
+                room.key = "Hub"
+                room.id = 60
+                room.default_description = "A default description."
+                room.db = DummyDB(desc="A busy hub.", weather="clear")
+                room.ndb = DummyDB()
+                north = types.SimpleNamespace(key="(N)orth", id=601, db=DummyDB(priority=2, dark=False))
+                south = types.SimpleNamespace(key="(S)outh", id=602, db=DummyDB(priority=1, dark=False))
+                north.access = south.access = lambda *_args, **_kwargs: True
+                renders = []
+
+                def display_name(looker=None, **kwargs):
+                        renders.append(looker)
+                        return "|gPotion|n"
+
+                potion = types.SimpleNamespace(key="Potion", id=701, db=DummyDB(dark=False), get_display_name=display_name)
+                contents = {"exit": [north, south], "character": [], "object": [potion]}
+                room.contents_get = lambda content_type=None, **_kwargs: list(contents[content_type])
+                room.filter_visible = lambda objects, *_args, **_kwargs: objects
+
+                def make_looker(builder):
+                        looker = types.SimpleNamespace(key="Ash", id=7, has_account=False)
+                        looker.db = DummyDB(ui_mode="sr")
+                        looker.ndb = DummyDB(cols=80)
+                        looker.attributes = DummyDB(npc=False)
+                        looker.check_permstring = lambda _perm: builder
+                        return looker
+
+                player = make_looker(False)
+                first = room.return_appearance(player)
+                assert first.index("(S)outh") < first.index("(N)orth")
+                assert room.return_appearance(player) == first
+                assert len(renders) == 1
+
+                room.db.desc = "A quiet hub."
+                north.db.priority = 0
+                second = room.return_appearance(player)
+                assert "A quiet hub." in second
+                assert second.index("(S)outh") < second.index("(N)orth")
+
+                room.invalidate_appearance()
+                reordered = room.return_appearance(player)
+                assert reordered.index("(N)orth") < reordered.index("(S)outh")
+
+                south.access = lambda *_args, **_kwargs: False
+                contents["object"] = []
+                third = room.return_appearance(player)
+                assert "- (S)outh [Locked]" in third and "Potion" not in third
+                assert "- (N)orth #601" in room.return_appearance(make_looker(True))
@@ -201,8 +201,8 @@ def test_hunt_chart_accepts_rarity_weights(monkeypatch):
 	hunter.location = room
 	captured = {}
 
-	def fake_choices(entries, weights, k):
-		captured["weights"] = weights
+	def fake_choices(entries, cum_weights, k):
+		captured["weights"] = cum_weights
 		return [entries[0]]
 
 	monkeypatch.setattr("world.hunt_system.random.choices", fake_choices)
@@ -211,7 +211,7 @@ def test_hunt_chart_accepts_rarity_weights(monkeypatch):
 	msg = hs._resolve_wild_encounter(hunter, 0)
 
 	assert msg == "A wild Rattata (Lv 5) appeared!"
-	assert captured["weights"] == [RARITY_WEIGHTS["rare"], 7]
+	assert captured["weights"] == (RARITY_WEIGHTS["rare"], RARITY_WEIGHTS["rare"] + 7)
 
 
 def test_hunt_falls_back_to_spawn_table(monkeypatch):
@@ -224,7 +224,7 @@ def test_hunt_falls_back_to_spawn_table(monkeypatch):
 	hunter = DummyHunter()
 	hunter.location = room
 
-	monkeypatch.setattr("world.hunt_system.random.choices", lambda entries, weights, k: [entries[0]])
+	monkeypatch.setattr("world.hunt_system.random.choices", lambda entries, cum_weights, k: [entries[0]])
 	monkeypatch.setattr("world.hunt_system.random.randint", lambda low, high: low)
 
 	msg = hs._resolve_wild_encounter(hunter, 0)
@@ -233,3 +233,78 @@ def test_hunt_falls_back_to_spawn_table(monkeypatch):
 	assert captured["data"]["weight"] == RARITY_WEIGHTS["uncommon"]
 	assert captured["data"]["min_level"] == 10
 	assert captured["data"]["max_level"] == 25
+
+
+def test_compiled_chart_is_reused_until_revision_changes(monkeypatch):
+	from pokemon.spawns.revision import bump_spawn_chart_revision
+
+	room = DummyRoom()
+	room.db.hunt_chart = [
+		{"name": "Hoothoot", "weight": 2, "time": "night", "min_level": 3, "max_level": 3},
+		{"name": "Pidgey", "weight": 5, "min_level": 3, "max_level": 3},
+	]
+	normalized = []
+	original = HuntSystem._normalize_spawn_entry
+
+	def counted(self, entry):
+		normalized.append(entry)
+		return original(self, entry)
+
+	monkeypatch.setattr(HuntSystem, "_normalize_spawn_entry", counted)
+
+	night = HuntSystem(room)._get_valid_entries("night", "clear")
+	day = HuntSystem(room)._get_valid_entries("day", "rain")
+	assert [e["name"] for e in night] == ["Hoothoot", "Pidgey"]
+	assert [e["name"] for e in day] == ["Pidgey"]
+	assert len(normalized) == 2
+	assert HuntSystem(room)._compiled_chart().bucket("night", "clear")[1] == (2, 7)
+
+	room.db.hunt_chart = [{"name": "Rattata", "min_level": 2, "max_level": 2}]
+	bump_spawn_chart_revision(room)
+	assert [e["name"] for e in HuntSystem(room)._get_valid_entries("day", "clear")] == ["Rattata"]
+	assert len(normalized) == 3
+
+
+def test_hunt_pops_prepared_encounter_until_chart_changes(monkeypatch):
+	from pokemon.spawns.revision import bump_spawn_chart_revision
+
+	room = DummyRoom()
+	room.db.encounter_rate = 100
+	room.db.hunt_chart = [{"name": "Pidgey", "min_level": 4, "max_level": 4}]
+	created = []
+	released = []
+
+	def fake_create(name, level, is_wild=False):
+		created.append(name)
+		return types.SimpleNamespace(name=name, level=level, model_id=f"encounter:{len(created)}")
+
+	monkeypatch.setattr("world.hunt_system.create_battle_pokemon", fake_create)
+	monkeypatch.setattr("world.hunt_system.generate_random_trainer_encounter", lambda room: types.SimpleNamespace(team=[]))
+	monkeypatch.setattr("world.hunt_system.delete_encounter_by_ref", released.append)
+	sessions = []
+
+	class RecordingBattleSession:
+		def __init__(self, player, opponent=None):
+			self.temp_pokemon_ids = []
+			sessions.append(self)
+
+		def start(self):
+			pass
+
+	monkeypatch.setattr("world.hunt_system.BattleSession", RecordingBattleSession)
+	hs = HuntSystem(room)
+	hunter = DummyHunter()
+	hunter.location = room
+
+	pool = hs.refill_encounter_pool("day", "clear")
+	assert len(pool.wild[("day", "clear")]) == 3 and len(pool.trainers) == 2
+	monkeypatch.setattr(hs, "get_time_of_day", lambda: "day")
+	monkeypatch.setattr(hs, "get_current_weather", lambda: "clear")
+
+	assert hs._resolve_wild_encounter(hunter, 0) == "A wild Pidgey (Lv 4) appeared!"
+	assert len(created) == 3
+	assert sessions[0].temp_pokemon_ids == ["encounter:1"]
+
+	bump_spawn_chart_revision(room)
+	assert hs.encounter_pool() is not pool
+	assert released == ["encounter:2", "encounter:3"]
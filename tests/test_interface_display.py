@@ -99,3 +99,37 @@ def test_display_interface_uses_battle_ui_style_preference():
 	assert "Team A" in clean
 	assert "┌" not in clean
 	assert max(len(line) for line in clean.splitlines()) <= 78
+
+
+def test_broadcast_renders_each_distinct_frame_once(monkeypatch):
+	mon_a = DummyMon("Pika", 15, 20)
+	mon_b = DummyMon("Bulba", 30, 60)
+	t_a = DummyTrainer("Ash", mon_a)
+	t_b = DummyTrainer("Gary", mon_b)
+	watchers = [types.SimpleNamespace(db=types.SimpleNamespace(battle_ui_style=None)) for _ in range(4)]
+	watchers[0].db.battle_ui_style = "pf1"
+	sent = []
+	session = types.SimpleNamespace(
+		captainA=t_a,
+		captainB=t_b,
+		state=BattleState(),
+		teamA=[t_a],
+		teamB=[t_b],
+		observers=watchers,
+		_msg_to=lambda target, text: sent.append((target, text)),
+	)
+	renders = []
+	original = iface.display_battle_interface
+
+	def counted(*args, **kwargs):
+		renders.append((kwargs["viewer_team"], kwargs["style"]))
+		return original(*args, **kwargs)
+
+	monkeypatch.setattr(iface, "display_battle_interface", counted)
+	iface.broadcast_interfaces(session)
+
+	assert len(sent) == 6
+	assert len(renders) == 4
+	observer_frames = [text for target, text in sent if target in watchers]
+	assert observer_frames[1] == observer_frames[2] == observer_frames[3]
+	assert observer_frames[0] != observer_frames[1]
@@ -0,0 +1,55 @@
+import pickle
+
+from pokemon.battle._shared import _normalize_key
+from pokemon.dex.entities import LazyDex, Move
+
+
+def _movedex(built):
+	def factory(name, data):
+		built.append(name)
+		return Move.from_dict(name, data)
+
+	return LazyDex(
+		[
+			("ancientpower", "Ancient Power", {"num": 246, "basePower": 60}),
+			("tackle", "Tackle", {"num": 33, "basePower": 40}),
+		],
+		factory,
+	)
+
+
+def test_entries_are_built_once_on_first_access():
+	built = []
+	dex = _movedex(built)
+
+	assert len(dex) == 2 and "tackle" in dex
+	assert built == []
+	assert dex["tackle"] is dex.get("tackle")
+	assert dex["tackle"].power == 40
+	assert built == ["Tackle"]
+	assert dex.get("missing") is None
+
+
+def test_aliases_share_the_pending_entry():
+	built = []
+	dex = _movedex(built)
+
+	dex.add_aliases(_normalize_key)
+	assert "Ancientpower" in dex
+	assert built == []
+	assert dex["Ancientpower"] is dex["ancientpower"]
+	assert built == ["Ancient Power"]
+
+	override = object()
+	dex["Tackle"] = override
+	dex.add_aliases(_normalize_key)
+	assert dex["Tackle"] is override
+
+
+def test_lazy_dex_pickles_without_building():
+	dex = LazyDex([("tackle", "Tackle", {"num": 33})], Move.from_dict)
+
+	restored = pickle.loads(pickle.dumps(dex))
+
+	assert repr(restored) == "<LazyDex 0/1 built>"
+	assert restored["tackle"].name == "Tackle"
@@ -0,0 +1,55 @@
+from pokemon.data.learnsets import store as store_mod
+from pokemon.data.learnsets.store import LearnsetStore
+from pokemon.middleware import build_moveset
+
+LEARNSETS = {
+	"pichu": {
+		"learnset": {
+			"thundershock": ["9L1", "8L1", "7L1"],
+			"charm": ["9L1", "7L5"],
+			"thunderwave": ["9M", "8L13", "7L13"],
+			"nastyplot": ["9L20", "9E", "8E"],
+			"volttackle": ["9S0", "8E"],
+		},
+	},
+	"raichu": {
+		"learnset": {
+			"thunderbolt": ["9M", "9L1"],
+			"thunderwave": ["9M", "9T"],
+		},
+	},
+}
+
+
+def test_level_up_queries_bisect_on_level():
+	store = LearnsetStore.from_learnsets(LEARNSETS)
+
+	assert store.level_up("pichu", 5) == [
+		(1, "thundershock", 9),
+		(1, "charm", 9),
+		(5, "charm", 7),
+	]
+	assert store.level_up_moves("pichu", 13) == [(1, "thundershock"), (1, "charm"), (13, "thunderwave")]
+	assert store.level_up("missingno", 100) == []
+
+
+def test_moveset_matches_build_moveset():
+	store = LearnsetStore.from_learnsets(LEARNSETS)
+
+	for name, data in LEARNSETS.items():
+		assert store.moveset(name) == build_moveset(data["learnset"])
+	assert store.moves_from("pichu", "ME") == ["thunderwave", "nastyplot", "volttackle"]
+	assert store.moveset("missingno") is None
+
+
+def test_saved_index_is_ignored_when_source_changes(tmp_path, monkeypatch):
+	path = tmp_path / "learnsets_index.pickle"
+	stamp = [(10, 1)]
+	monkeypatch.setattr(store_mod, "source_stamp", lambda path=None: stamp[0])
+
+	LearnsetStore.from_learnsets(LEARNSETS).save(path)
+	loaded = LearnsetStore.load(path)
+	assert loaded.level_up_moves("raichu") == [(1, "thunderbolt")]
+
+	stamp[0] = (11, 2)
+	assert LearnsetStore.load(path) is None
@@ -0,0 +1,79 @@
+"""Tests for the shared move resolver and compiled move records."""
+
+import copy
+import pickle
+import types
+
+import pytest
+
+from pokemon.battle.engine import BattleMove
+from pokemon.battle.moveindex import MoveRecord, move_id, move_record, move_resolver, resolve_move
+
+
+def _movedex():
+	return {
+		"icebeam": types.SimpleNamespace(raw={"priority": 0, "flags": {"protect": 1, "mirror": 1}}),
+		"Quickattack": types.SimpleNamespace(raw={"priority": 1, "flags": {"contact": 1}, "target": "normal"}),
+		"Power Up Punch": types.SimpleNamespace(raw={"priority": 0, "target": "normal"}),
+	}
+
+
+def test_resolver_matches_any_spelling():
+	movedex = _movedex()
+
+	assert resolve_move("Ice Beam", movedex) is movedex["icebeam"]
+	assert resolve_move("ICEBEAM", movedex) is movedex["icebeam"]
+	assert resolve_move("quick-attack", movedex) is movedex["Quickattack"]
+	assert resolve_move("Power-Up Punch", movedex) is movedex["Power Up Punch"]
+	assert resolve_move("Splash", movedex) is None
+	assert move_id("Power-Up Punch") == "poweruppunch"
+
+
+def test_resolver_is_shared_and_rebuilt_after_edits():
+	movedex = _movedex()
+	resolver = move_resolver(movedex)
+
+	assert move_resolver(movedex) is resolver
+	record = move_record("Quick Attack", movedex)
+	assert (record.priority, record.flags, record.target) == (1, frozenset({"contact"}), "normal")
+	assert move_record("quickattack", movedex) is record
+
+	movedex["Splash"] = types.SimpleNamespace(raw={"priority": 0, "target": "self"})
+	assert move_resolver(movedex) is not resolver
+	assert move_record("splash", movedex).target == "self"
+
+	movedex["Quickattack"] = types.SimpleNamespace(raw={"priority": 2})
+	assert move_record("Quick Attack", movedex).priority == 2
+
+
+def test_move_record_is_immutable_with_precomputed_flags():
+	raw = {
+		"priority": 0,
+		"flags": {"contact": 1, "punch": 1, "protect": 1, "sound": 0},
+		"target": "allAdjacentFoes",
+		"multihit": [2, 5],
+		"drain": [1, 2],
+		"critRatio": 2,
+		"secondary": {"chance": 10, "status": "brn"},
+	}
+	record = MoveRecord(raw, key="firepunch")
+
+	assert (record.contact, record.punch, record.protectable, record.sound) == (True, True, True, False)
+	assert record.spread and not record.self_target
+	assert (record.multihit, record.drain, record.crit_ratio) == ((2, 5), (1, 2), 2)
+	assert record.secondaries == (raw["secondary"],)
+	assert not hasattr(record, "__dict__")
+	with pytest.raises(AttributeError):
+		record.priority = 3
+	assert copy.deepcopy(record) is record
+	assert pickle.loads(pickle.dumps(record)).crit_ratio == 2
+
+
+def test_battle_move_record_follows_raw_replacement():
+	move = BattleMove(name="Tackle", raw={"target": "normal", "flags": {"contact": 1}})
+
+	record = move.record
+	assert record.contact and move.record is record
+	move.raw = dict(move.raw, target="self")
+	assert move.record is not record
+	assert move.record.self_target
@@ -62,18 +62,17 @@ def test_initialize_generated_moveset_sets_learned_and_active_moves(monkeypatch)
 	monkeypatch.setitem(sys.modules, "pokemon.dex", dex_mod)
 
 	middleware_mod = types.ModuleType("pokemon.middleware")
-	middleware_mod.get_moveset_by_name = lambda name: (
-		name,
-		{
-			"level-up": [
-				(1, "tackle"),
-				(1, "growl"),
-				(5, "quickattack"),
-				(8, "thunderwave"),
-				(12, "electroball"),
-			]
-		},
-	)
+	level_up = [
+		(1, "tackle"),
+		(1, "growl"),
+		(5, "quickattack"),
+		(8, "thunderwave"),
+		(12, "electroball"),
+	]
+	middleware_mod.get_moveset_by_name = lambda name: (name, {"level-up": level_up})
+	middleware_mod.get_level_up_moves = lambda name, max_level=None: [
+		row for row in level_up if max_level is None or row[0] <= max_level
+	]
 	monkeypatch.setitem(sys.modules, "pokemon.middleware", middleware_mod)
 
 	class FakeMove:
@@ -0,0 +1,52 @@
+import types
+
+from pokemon.spawns.chart_cache import cached_spawn_chart_for_room, compile_spawn_chart
+from pokemon.spawns.preview import format_spawn_preview
+from pokemon.spawns.revision import bump_spawn_chart_revision
+from pokemon.spawns.schema import IndexedSpawnChart, SpawnChart, SpawnEntry
+from pokemon.spawns.selection import build_rotation_buckets, eligible_entries
+
+
+def _room(hunt_chart):
+    return types.SimpleNamespace(
+        key="Route 9",
+        id=9,
+        db=types.SimpleNamespace(hunt_chart=hunt_chart),
+        ndb=types.SimpleNamespace(),
+    )
+
+
+def test_room_chart_is_compiled_once_per_revision():
+    room = _room([{"name": "Pidgey", "frequency": "common", "tiers": [1, 2]}])
+
+    first = cached_spawn_chart_for_room(room)
+    room.db.hunt_chart = [{"name": "Rattata", "frequency": "common"}]
+    assert cached_spawn_chart_for_room(room) is first
+
+    bump_spawn_chart_revision(room)
+    second = cached_spawn_chart_for_room(room)
+    assert second is not first
+    assert isinstance(second, IndexedSpawnChart)
+    assert [entry.species_id for entry in second.entries] == ["Rattata"]
+    assert second.revision == 1
+
+
+def test_indexed_chart_matches_plain_chart_queries():
+    chart = SpawnChart(
+        area_key="route",
+        entries=[
+            SpawnEntry(species_id="A", frequency="common", band=1),
+            SpawnEntry(species_id="B", frequency="rare", band=1),
+            SpawnEntry(species_id="C", frequency="common", band=1, enabled=False),
+            SpawnEntry(species_id="D", frequency="common", band=2),
+        ],
+    )
+    indexed = compile_spawn_chart(chart)
+
+    for band in (1, 2, 3):
+        assert eligible_entries(indexed, band) == eligible_entries(chart, band)
+        assert eligible_entries(indexed, band, frequency="common") == eligible_entries(
+            chart, band, frequency="common"
+        )
+        assert build_rotation_buckets(indexed, band) == build_rotation_buckets(chart, band)
+    assert format_spawn_preview(indexed, source="hunt_chart") == format_spawn_preview(chart, source="hunt_chart")
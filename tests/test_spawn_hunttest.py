@@ -136,7 +136,7 @@ def test_command_handles_adapter_error_without_traceback(monkeypatch):
 
         raise SpawnAdapterError("bad adapter data")
 
-    monkeypatch.setattr(cmd_spawnhunttest, "spawn_chart_from_room", fail_adapter)
+    monkeypatch.setattr(cmd_spawnhunttest, "cached_spawn_chart_for_room", fail_adapter)
     cmd = cmd_spawnhunttest.CmdSpawnHuntTest()
     cmd.caller = Caller()
     cmd.args = "1"
@@ -163,7 +163,7 @@ def test_command_reports_roll_and_battle(monkeypatch):
         def msg(self, text):
             self.messages.append(text)
 
-    monkeypatch.setattr(cmd_spawnhunttest, "spawn_chart_from_room", lambda room: chart)
+    monkeypatch.setattr(cmd_spawnhunttest, "cached_spawn_chart_for_room", lambda room: chart)
     cmd = cmd_spawnhunttest.CmdSpawnHuntTest()
     cmd.caller = Caller()
     cmd.args = "1"
@@ -92,7 +92,7 @@ def test_command_handles_adapter_error_without_traceback(monkeypatch):
     def fail_adapter(room):
         raise SpawnAdapterError("bad spawn data")
 
-    monkeypatch.setattr(cmd_spawnpreview, "spawn_chart_from_room", fail_adapter)
+    monkeypatch.setattr(cmd_spawnpreview, "cached_spawn_chart_for_room", fail_adapter)
     cmd = cmd_spawnpreview.CmdSpawnPreview()
     cmd.caller = Caller()
     cmd.args = ""
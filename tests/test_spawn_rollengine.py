@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from pokemon.spawns.rollengine import compile_band_roll_table, roll_batch, wilson_interval
+from pokemon.spawns.schema import SpawnChart, SpawnEntry
+from pokemon.spawns.selection import roll_spawn
+
+
+def _chart():
+    return SpawnChart(
+        area_key="route-gamma",
+        entries=[
+            SpawnEntry(species_id="A", frequency="frequent", band=1),
+            SpawnEntry(species_id="B", frequency="common", band=1),
+            SpawnEntry(species_id="C", frequency="common", band=1),
+            SpawnEntry(species_id="D", frequency="rare", band=1),
+            SpawnEntry(species_id="E", frequency="uncommon", band=1, enabled=False),
+            SpawnEntry(species_id="F", frequency="frequent", band=2),
+        ],
+    )
+
+
+def test_compiled_table_folds_fallbacks_into_exact_probabilities():
+    table = compile_band_roll_table(_chart(), 1)
+
+    # Uncommon rolls (150) fall back to the common bucket; rare keeps its own.
+    assert table.probabilities() == pytest.approx({"A": 0.47, "B": 0.25, "C": 0.25, "D": 0.03})
+    assert table.frequency_probabilities() == pytest.approx({"frequent": 0.47, "common": 0.5, "rare": 0.03})
+    assert compile_band_roll_table(SpawnChart(area_key="empty", entries=[]), 1) is None
+
+
+def test_batched_rolls_match_scalar_rolls_and_are_seedable():
+    chart = _chart()
+    table = compile_band_roll_table(chart, 1)
+    count = 20000
+
+    _freq, batched = roll_batch(table, count, seed=11, chunk_size=3000)
+    _freq_again, repeat = roll_batch(table, count, seed=11)
+    rng = random.Random(5)
+    scalar = {}
+    for _ in range(count):
+        species_id = roll_spawn(chart, 1, rng=rng).species_id
+        scalar[species_id] = scalar.get(species_id, 0) + 1
+
+    assert sum(batched.values()) == count
+    assert batched == repeat
+    for species_id, expected in table.probabilities().items():
+        low, high = wilson_interval(scalar[species_id], count, z=4)
+        assert low <= expected <= high
+        low, high = wilson_interval(batched[species_id], count, z=4)
+        assert low <= expected <= high
@@ -142,7 +142,7 @@ def test_command_handles_adapter_error_without_traceback(monkeypatch):
     def fail_adapter(room):
         raise SpawnAdapterError("bad spawn data")
 
-    monkeypatch.setattr(cmd_spawnrolltest, "spawn_chart_from_room", fail_adapter)
+    monkeypatch.setattr(cmd_spawnrolltest, "cached_spawn_chart_for_room", fail_adapter)
     cmd = cmd_spawnrolltest.CmdSpawnRollTest()
     cmd.caller = Caller()
     cmd.args = "1 5"
@@ -0,0 +1,66 @@
+"""Tests for the input-keyed stat cache."""
+
+import sys
+import types
+
+import pokemon.helpers.pokemon_helpers as helpers
+
+
+def _install_calculator(monkeypatch):
+	calls = []
+
+	def fake_calculate(species, level, ivs, evs, nature):
+		calls.append((species, level))
+		return {"hp": level + ivs["hp"], "attack": evs["attack"], "speed": 1}
+
+	stats_mod = types.ModuleType("pokemon.models.stats")
+	stats_mod.calculate_stats = fake_calculate
+	monkeypatch.setitem(sys.modules, "pokemon.models.stats", stats_mod)
+	helpers.clear_stat_cache()
+	return calls
+
+
+def _mon(**fields):
+	base = dict(species="Testmon", level=5, ivs=[1, 0, 0, 0, 0, 0], evs={}, nature="Hardy")
+	base.update(fields)
+	return types.SimpleNamespace(**base)
+
+
+def test_stats_are_cached_by_inputs(monkeypatch):
+	calls = _install_calculator(monkeypatch)
+	mon = _mon()
+
+	first = helpers.get_stats(mon)
+	first["hp"] = 999
+	assert helpers.get_stats(mon)["hp"] == 6
+	assert len(calls) == 1
+
+	mon.evs = {"atk": 8}
+	assert helpers.get_stats(mon)["attack"] == 8
+	mon.level = 6
+	assert helpers.get_max_hp(mon) == 7
+	assert len(calls) == 3
+	assert helpers.stat_cache_info()["hits"] == 1
+	assert helpers.stat_cache_info()["misses"] == 3
+
+
+def test_replaced_calculator_is_not_served_stale_results(monkeypatch):
+	_install_calculator(monkeypatch)
+	mon = _mon()
+	helpers.get_stats(mon)
+
+	stats_mod = types.ModuleType("pokemon.models.stats")
+	stats_mod.calculate_stats = lambda *args: {"hp": 1}
+	monkeypatch.setitem(sys.modules, "pokemon.models.stats", stats_mod)
+
+	assert helpers.get_stats(mon) == {"hp": 1}
+
+
+def test_get_stats_batch_keeps_order_and_seeded_stats(monkeypatch):
+	calls = _install_calculator(monkeypatch)
+	seeded = _mon(_cached_stats={"hp": 42})
+
+	results = helpers.get_stats_batch([_mon(), seeded, None, _mon(), _mon(level=10)])
+
+	assert [stats.get("hp") for stats in results] == [6, 42, None, 6, 11]
+	assert len(calls) == 2
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark bytes written per turn when persisting a battle.
+
+A six-against-six battle plays scripted turns that change HP, PP, boosts,
+status and weather.  Each row reports the pickled bytes written to room
+attributes per turn by the journaled :class:`BattleDataWrapper` against
+rewriting the full ``data`` and ``state`` parts, as before the journal.
+
+Usage::
+
+	PF2_NO_EVENNIA=1 python tools/benchmarks/battle_persist.py
+	PF2_NO_EVENNIA=1 python tools/benchmarks/battle_persist.py --turns 200
+"""
+
+import argparse
+import pickle
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+	sys.path.insert(0, str(REPO_ROOT))
+
+from pokemon.battle.battledata import BattleData, Move, Pokemon, Team
+from pokemon.battle.storage import BattleDataWrapper
+
+
+class _CountingDB:
+	"""Attribute holder recording the pickled size of every write."""
+
+	def __init__(self):
+		object.__setattr__(self, "written", 0)
+
+	def __setattr__(self, key, value):
+		object.__setattr__(self, "written", self.written + len(pickle.dumps(value)))
+		object.__setattr__(self, key, value)
+
+
+class _Room:
+	def __init__(self):
+		self.db = _CountingDB()
+
+
+def _team(trainer: str, rng: random.Random) -> Team:
+	mons = []
+	for slot in range(6):
+		moves = [Move(f"move{slot}{index}", priority=0) for index in range(4)]
+		for move in moves:
+			move.pp = 20
+		mon = Pokemon(
+			f"{trainer}mon{slot}",
+			level=50,
+			hp=150,
+			moves=moves,
+			ivs=[rng.randint(0, 31) for _ in range(6)],
+			evs=[rng.randint(0, 252) for _ in range(6)],
+			model_id=rng.randint(1, 10**6),
+			types=["Normal"],
+		)
+		mons.append(mon)
+	return Team(trainer, mons)
+
+
+def _play_turn(data: BattleData, state: dict, rng: random.Random, turn: int) -> None:
+	for side in ("A", "B"):
+		mon = data.teams[side].returnlist()[0]
+		mon.hp = max(mon.hp - rng.randint(1, 10), 1)
+		mon.moves[rng.randrange(4)].pp -= 1
+		if rng.random() < 0.3:
+			mon.boosts["atk"] = mon.boosts.get("atk", 0) + 1
+		if rng.random() < 0.1:
+			mon.status = "psn"
+	if turn % 5 == 0:
+		data.field.weather = rng.choice(["rain", "sun", None])
+	data.battle.turn = turn
+	state["declare"] = {"A1": {"move": "move00", "target": "B1"}, "B1": {"move": "move10", "target": "A1"}}
+
+
+def _run(turns: int, journaled: bool, seed: int):
+	rng = random.Random(seed)
+	data = BattleData(_team("A", rng), _team("B", rng))
+	state = {"declare": {}, "watchers": [1, 2]}
+	room = _Room()
+	storage = BattleDataWrapper(room, 1)
+	storage.set("data", data.to_dict())
+	storage.set("state", dict(state))
+	room.db.written = 0
+	start = time.perf_counter()
+	for turn in range(1, turns + 1):
+		_play_turn(data, state, rng, turn)
+		if journaled:
+			storage.record(data=data.to_dict(), state=dict(state))
+		else:
+			setattr(room.db, "battle_1_data", data.to_dict())
+			setattr(room.db, "battle_1_state", dict(state))
+	elapsed = (time.perf_counter() - start) / turns * 1e3
+	return room.db.written / turns, elapsed
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--turns", type=int, default=100)
+	parser.add_argument("--seed", type=int, default=0)
+	args = parser.parse_args()
+
+	print(f"{'mode':<10} {'bytes/turn':>12} {'ms/turn':>10}")
+	for label, journaled in (("full", False), ("journal", True)):
+		written, elapsed = _run(args.turns, journaled, args.seed)
+		print(f"{label:<10} {written:>12.0f} {elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+	main()
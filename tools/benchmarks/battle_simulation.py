@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Benchmark headless AI-vs-AI battle simulation throughput.
+
+Runs the same seeded batch of battles in this process and across a pool of
+worker processes, printing battles per second for each and the aggregated
+balance report.  Both runs use the same seeds, so their win counts match.
+
+Usage::
+
+	PF2_NO_EVENNIA=1 python tools/benchmarks/battle_simulation.py
+	PF2_NO_EVENNIA=1 python tools/benchmarks/battle_simulation.py --battles 1000 --workers 8
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+	sys.path.insert(0, str(REPO_ROOT))
+
+from pokemon.battle.simulation import simulate_batch
+from pokemon.battle.tests.outcome_harness import PokemonSpec
+
+TEAM_A = (
+	PokemonSpec("Pikachu", 30, moves=("Thunderbolt", "Quick Attack")),
+	PokemonSpec("Bulbasaur", 30, moves=("Vine Whip", "Tackle")),
+)
+TEAM_B = (
+	PokemonSpec("Charmander", 30, moves=("Ember", "Scratch")),
+	PokemonSpec("Squirtle", 30, moves=("Water Gun", "Tackle")),
+)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--battles", type=int, default=200)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--workers", type=int, default=None)
+	args = parser.parse_args()
+
+	serial = simulate_batch(TEAM_A, TEAM_B, battles=args.battles, seed=args.seed, workers=1)
+	pooled = simulate_batch(TEAM_A, TEAM_B, battles=args.battles, seed=args.seed, workers=args.workers)
+	print(f"{'mode':<10} {'battles/s':>10}")
+	print(f"{'serial':<10} {serial.battles_per_second:>10.1f}")
+	print(f"{'pooled':<10} {pooled.battles_per_second:>10.1f}")
+	print(pooled.format())
+
+
+if __name__ == "__main__":
+	main()
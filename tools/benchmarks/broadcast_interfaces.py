@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark ``broadcast_interfaces`` for a battle with many observers.
+
+Two trainers fight while 50 observers watch.  Each row times one full
+broadcast with the shared-frame renderer against the legacy loop that
+renders the interface once per viewer.  Rows cover every battle UI style
+plus a mix of all three.
+
+Usage::
+
+	PF2_NO_EVENNIA=1 python tools/benchmarks/broadcast_interfaces.py
+	PF2_NO_EVENNIA=1 python tools/benchmarks/broadcast_interfaces.py --observers 200
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+	sys.path.insert(0, str(REPO_ROOT))
+
+from pokemon.battle import interface
+from pokemon.battle.state import BattleState
+from pokemon.ui.battle_render import BATTLE_UI_STYLES
+
+
+def _viewer(name: str, style: str, hp: int = 0):
+	mon = SimpleNamespace(name=f"{name}mon", level=50, hp=hp or 100, max_hp=120, status="")
+	return SimpleNamespace(
+		name=name,
+		active_pokemon=mon,
+		team=[mon],
+		db=SimpleNamespace(battle_ui_style=style),
+		ndb=SimpleNamespace(cols=80),
+	)
+
+
+def _session(styles, observers: int):
+	captain_a = _viewer("Ash", styles[0], hp=80)
+	captain_b = _viewer("Gary", styles[-1], hp=60)
+	return SimpleNamespace(
+		captainA=captain_a,
+		captainB=captain_b,
+		state=BattleState(),
+		teamA=[captain_a],
+		teamB=[captain_b],
+		observers=[_viewer(f"Obs{i}", styles[i % len(styles)]) for i in range(observers)],
+		_msg_to=lambda target, text: None,
+	)
+
+
+def _legacy_broadcast(session) -> None:
+	"""Render every viewer's interface separately, as before frame sharing."""
+	for team, viewers in (("A", session.teamA), ("B", session.teamB), (None, session.observers)):
+		for viewer in viewers:
+			session._msg_to(
+				viewer,
+				interface.display_battle_interface(
+					session.captainA,
+					session.captainB,
+					session.state,
+					viewer_team=team,
+					style=interface.get_battle_ui_style(viewer),
+					total_width=interface.get_battle_ui_width(viewer),
+				),
+			)
+
+
+def _time_call(func, iterations: int) -> float:
+	"""Return the mean runtime of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(iterations):
+		func()
+	return (time.perf_counter() - start) / iterations * 1e3
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--observers", type=int, default=50)
+	parser.add_argument("--iterations", type=int, default=20)
+	args = parser.parse_args()
+
+	rows = [(style, (style,)) for style in BATTLE_UI_STYLES]
+	rows.append(("mixed", tuple(BATTLE_UI_STYLES)))
+	print(f"{'style':<16} {'shared ms':>10} {'legacy ms':>10}")
+	for label, styles in rows:
+		session = _session(styles, args.observers)
+		shared = _time_call(lambda: interface.broadcast_interfaces(session), args.iterations)
+		legacy = _time_call(lambda: _legacy_broadcast(session), args.iterations)
+		print(f"{label:<16} {shared:>10.2f} {legacy:>10.2f}")
+
+
+if __name__ == "__main__":
+	main()
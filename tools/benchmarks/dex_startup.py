@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Benchmark building the dex tables from source against the snapshot.
+
+``source`` execs the generated data modules and constructs every entity,
+which is what each process paid before the snapshot existed.  ``snapshot``
+fingerprints the source files and unpickles the stored tables.
+
+Usage::
+
+	PF2_NO_EVENNIA=1 python tools/benchmarks/dex_startup.py
+	PF2_NO_EVENNIA=1 python tools/benchmarks/dex_startup.py --repeat 10
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+	sys.path.insert(0, str(REPO_ROOT))
+
+from pokemon.dex import snapshot
+
+
+def _timings(func, repeat: int) -> tuple[float, float]:
+	"""Return the first and the fastest runtime of ``func`` in milliseconds."""
+	runs = []
+	for _ in range(repeat):
+		start = time.perf_counter()
+		func()
+		runs.append((time.perf_counter() - start) * 1e3)
+	return runs[0], min(runs)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--repeat", type=int, default=5)
+	args = parser.parse_args()
+
+	from pokemon import dex
+
+	snapshot.rebuild_snapshot()
+
+	def from_snapshot():
+		if snapshot.read_snapshot(snapshot.source_fingerprint()) is None:
+			raise SystemExit("snapshot is stale")
+
+	print(f"{'path':<10} {'first ms':>10} {'best ms':>10}")
+	for label, func in (("snapshot", from_snapshot), ("source", dex.build_dex_tables)):
+		first, best = _timings(func, args.repeat)
+		print(f"{label:<10} {first:>10.1f} {best:>10.1f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Benchmark ``level_for_exp`` for every growth rate.
+
+Each row times looking up the level of a spread of experience totals with
+the precomputed bisect tables against the legacy loop that recomputed
+``exp_for_level`` for each level in turn.
+
+Usage::
+
+	PF2_NO_EVENNIA=1 python tools/benchmarks/exp_levels.py
+	PF2_NO_EVENNIA=1 python tools/benchmarks/exp_levels.py --samples 5000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+	sys.path.insert(0, str(REPO_ROOT))
+
+from pokemon.models import stats
+
+GROWTH_RATES = ("Erratic", "Fast", "Medium Fast", "Medium Slow", "Slow", "Fluctuating")
+
+
+def _legacy_level_for_exp(exp: int, rate: str) -> int:
+	"""Scan levels 1-100 recomputing each threshold, as before the tables."""
+	level = 1
+	for lvl in range(1, 101):
+		if exp >= stats._exp_formula(lvl, stats._normalize_growth_rate(rate)):
+			level = lvl
+		else:
+			break
+	return level
+
+
+def _time_call(func, iterations: int) -> float:
+	"""Return the mean runtime of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(iterations):
+		func()
+	return (time.perf_counter() - start) / iterations * 1e3
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--samples", type=int, default=1000)
+	parser.add_argument("--iterations", type=int, default=20)
+	args = parser.parse_args()
+
+	rng = random.Random(0)
+	print(f"{'growth rate':<14} {'table ms':>10} {'batch ms':>10} {'legacy ms':>10}")
+	for rate in GROWTH_RATES:
+		top = stats.exp_for_level(100, rate)
+		totals = [rng.randint(0, top) for _ in range(args.samples)]
+		rates = [rate] * len(totals)
+		table = _time_call(lambda: [stats.level_for_exp(exp, rate) for exp in totals], args.iterations)
+		batch = _time_call(lambda: stats.levels_for_exp(totals, rates), args.iterations)
+		legacy = _time_call(lambda: [_legacy_level_for_exp(exp, rate) for exp in totals], args.iterations)
+		print(f"{rate:<14} {table:>10.2f} {batch:>10.2f} {legacy:>10.2f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark compiled move records against probing raw move dicts.
+
+``memory`` compares the heap held by one :class:`MoveRecord` per dex move
+with a detached copy of every move's raw dict, which is what each battle
+move carried before.  ``access`` times reading the fields the damage and
+turn code needs (priority, flags, target, multihit, drain, crit ratio,
+secondary) from the records against the equivalent ``raw.get`` probes.
+
+Usage::
+
+	PF2_NO_EVENNIA=1 python tools/benchmarks/move_records.py
+	PF2_NO_EVENNIA=1 python tools/benchmarks/move_records.py --passes 50
+"""
+
+import argparse
+import copy
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+	sys.path.insert(0, str(REPO_ROOT))
+
+from pokemon.battle.moveindex import MoveRecord
+
+
+def _time_call(func) -> float:
+	"""Return the runtime of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	func()
+	return (time.perf_counter() - start) * 1e3
+
+
+def _allocated(func) -> int:
+	"""Return the bytes still held by the result of ``func``."""
+	tracemalloc.start()
+	result = func()
+	size = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	del result
+	return size
+
+
+def _read_raw(raws) -> int:
+	hits = 0
+	for raw in raws:
+		flags = raw.get("flags", {}) or {}
+		hits += int(raw.get("priority", 0) or 0)
+		hits += bool(flags.get("contact")) + bool(flags.get("protect"))
+		hits += raw.get("target") in {"allAdjacent", "allAdjacentFoes"}
+		hits += bool(raw.get("multihit")) + bool(raw.get("drain"))
+		hits += int(raw.get("critRatio", 0) or 0) + bool(raw.get("secondary"))
+	return hits
+
+
+def _read_records(records) -> int:
+	hits = 0
+	for record in records:
+		hits += record.priority
+		hits += record.contact + record.protectable
+		hits += record.spread
+		hits += bool(record.multihit) + bool(record.drain)
+		hits += record.crit_ratio + bool(record.secondary)
+	return hits
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--passes", type=int, default=20)
+	args = parser.parse_args()
+
+	from pokemon.dex import MOVEDEX
+
+	raws = {id(move.raw): move.raw for move in MOVEDEX.values() if isinstance(getattr(move, "raw", None), dict)}
+	raws = list(raws.values())
+	records = [MoveRecord(raw) for raw in raws]
+
+	raw_bytes = _allocated(lambda: [copy.deepcopy(raw) for raw in raws])
+	record_bytes = _allocated(lambda: [MoveRecord(raw) for raw in raws])
+	print(f"{len(raws)} moves")
+	print(f"{'memory':<8} {'records KiB':>12} {'raw KiB':>10}")
+	print(f"{'':<8} {record_bytes / 1024:>12.1f} {raw_bytes / 1024:>10.1f}")
+
+	record_ms = _time_call(lambda: [_read_records(records) for _ in range(args.passes)])
+	raw_ms = _time_call(lambda: [_read_raw(raws) for _ in range(args.passes)])
+	print(f"{'access':<8} {'records ms':>12} {'raw ms':>10}")
+	print(f"{'':<8} {record_ms:>12.1f} {raw_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Benchmark ``Battle.runEvent`` with and without the handler index.
+
+The indexed path pays for one effect fingerprint per event; the legacy path
+resolves and probes every holder.  Both are timed on the same two-Pokemon
+battle for an event nobody listens to and for a populated one.
+
+Usage::
+
+	PF2_NO_EVENNIA=1 python tools/benchmarks/run_event_index.py
+	PF2_NO_EVENNIA=1 python tools/benchmarks/run_event_index.py --iterations 50000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+	sys.path.insert(0, str(REPO_ROOT))
+
+from pokemon.battle.tests.helpers import build_battle
+
+
+def _time_call(func, iterations: int) -> float:
+	"""Return the mean runtime of ``func`` in microseconds."""
+	start = time.perf_counter()
+	for _ in range(iterations):
+		func()
+	return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--iterations", type=int, default=20000)
+	args = parser.parse_args()
+
+	battle, attacker, defender = build_battle(attacker_ability="Intimidate")
+	defender.item = "Leftovers"
+	cases = {
+		"fingerprint only": battle._event_index_fingerprint,
+		"no subscribers": lambda: battle.runEvent("NoSuchEvent", attacker, defender, None, 1),
+		"ModifyAtk": lambda: battle.runEvent("ModifyAtk", attacker, defender, None, 100),
+	}
+	print(f"{'case':<18} {'indexed us':>12} {'legacy us':>12}")
+	for label, func in cases.items():
+		battle.event_index_enabled = True
+		func()
+		indexed = _time_call(func, args.iterations)
+		battle.event_index_enabled = False
+		legacy = _time_call(func, args.iterations) if label != "fingerprint only" else float("nan")
+		print(f"{label:<18} {indexed:>12.2f} {legacy:>12.2f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark spawn roll tests with the batched engine.
+
+Each row times drawing ``--rolls`` normal spawns for one band of a sample
+chart with the compiled batch engine against calling ``roll_spawn`` once per
+roll, which revalidates the chart and rescans its entries every time.
+
+Usage::
+
+	PF2_NO_EVENNIA=1 python tools/benchmarks/spawn_rolls.py
+	PF2_NO_EVENNIA=1 python tools/benchmarks/spawn_rolls.py --rolls 1000000 --entries 60
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+	sys.path.insert(0, str(REPO_ROOT))
+
+from pokemon.spawns.constants import NORMAL_FREQUENCIES, SPAWN_BANDS
+from pokemon.spawns.rollengine import compile_band_roll_table, roll_batch
+from pokemon.spawns.schema import SpawnChart, SpawnEntry
+from pokemon.spawns.selection import roll_spawn
+
+
+def _chart(entries: int) -> SpawnChart:
+	rng = random.Random(0)
+	return SpawnChart(
+		area_key="benchmark",
+		entries=[
+			SpawnEntry(
+				species_id=f"{index:03d}",
+				frequency=rng.choice(NORMAL_FREQUENCIES),
+				band=rng.choice(list(SPAWN_BANDS)),
+			)
+			for index in range(entries)
+		],
+	)
+
+
+def _time_call(func) -> float:
+	"""Return the runtime of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	func()
+	return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--rolls", type=int, default=100000)
+	parser.add_argument("--entries", type=int, default=40)
+	args = parser.parse_args()
+
+	chart = _chart(args.entries)
+	print(f"{'band':<6} {'batch ms':>10} {'scalar ms':>10}")
+	for band in SPAWN_BANDS:
+		table = compile_band_roll_table(chart, band)
+		if table is None:
+			continue
+		batch = _time_call(lambda: roll_batch(table, args.rolls, seed=1))
+		rng = random.Random(1)
+		scalar = _time_call(lambda: [roll_spawn(chart, band, rng=rng) for _ in range(args.rolls)])
+		print(f"{band:<6} {batch:>10.1f} {scalar:>10.1f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import pprint
 import re
+import sys
 from pathlib import Path
 
 import json5
@@ -10,7 +11,8 @@ import json5
 BASE_DIR = Path(__file__).parent
 TS_DIR = BASE_DIR / "ts"
 JSON_DIR = BASE_DIR / "json"
-POKEMON_LEARNSET_DIR = BASE_DIR.parents[2] / "pokemon" / "data" / "learnsets"
+REPO_ROOT = BASE_DIR.parents[2]
+POKEMON_LEARNSET_DIR = REPO_ROOT / "pokemon" / "data" / "learnsets"
 
 HEADER_RE = re.compile(r"^export const Learnsets:[^=]+=\s*{", re.MULTILINE)
 
@@ -43,6 +45,13 @@ def convert_ts() -> None:
 	with (POKEMON_LEARNSET_DIR / "learnsets.py").open("w") as f:
 		f.write("LEARNSETS = " + pretty + "\n")
 
+	# Write the compiled index used for learnset queries
+	if str(REPO_ROOT) not in sys.path:
+		sys.path.insert(0, str(REPO_ROOT))
+	from pokemon.data.learnsets.store import LearnsetStore
+
+	LearnsetStore.from_learnsets(data).save(POKEMON_LEARNSET_DIR / "learnsets_index.pickle")
+
 	print("Processed learnsets")
 
 
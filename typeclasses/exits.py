@@ -83,3 +83,10 @@ class Exit(ObjectParent, DefaultExit):
             except Exception:
                 return False
         return False
+
+    def at_rename(self, oldname, newname):
+        """Refresh the cached exit list of the room this exit leaves from."""
+        super().at_rename(oldname, newname)
+        invalidate = getattr(self.location, "invalidate_appearance", None)
+        if invalidate:
+            invalidate()
@@ -7,6 +7,8 @@ Rooms are simple containers that has no location of their own.
 
 import random
 import shutil
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
 
 from evennia.objects.objects import DefaultRoom
 
@@ -19,6 +21,7 @@ except Exception:  # pragma: no cover - fallback if Evennia not available
 
 
 from pokemon.battle.battleinstance import BattleSession
+from pokemon.spawns.revision import bump_spawn_chart_revision
 from utils.ansi import ansi
 from utils.exit_display import format_exit_name
 
@@ -36,6 +39,24 @@ except Exception:  # pragma: no cover - fallback if Evennia not available
 from .objects import ObjectParent
 
 
+@dataclass
+class AppearanceLayers:
+	"""Looker-independent pieces of a room's look output.
+
+	``exits`` holds ``(exit, colored name, dark)`` in display order and
+	``items`` holds ``(obj, name, screen reader name)`` as a non-builder sees
+	them.  ``key`` records the appearance revision and content ids they were
+	built from.  Wrapped descriptions are memoized per ``(width, indent)`` for
+	the description text in ``desc``.
+	"""
+
+	key: Tuple = ()
+	exits: List[Tuple[Any, str, bool]] = field(default_factory=list)
+	items: List[Tuple[Any, str, str]] = field(default_factory=list)
+	desc: str = ""
+	wrapped_desc: Dict[Tuple[int, int], str] = field(default_factory=dict)
+
+
 class Room(ObjectParent, DefaultRoom):
 	"""
 	Rooms are like any Object, except their location is None
@@ -89,6 +110,7 @@ class FusionRoom(Room):
 	def set_hunt_chart(self, chart):
 		"""Helper to set this room's hunt chart."""
 		self.db.hunt_chart = chart
+		bump_spawn_chart_revision(self)
 
 	def at_object_receive(self, moved_obj, source_location, move_type="move", **kwargs):
 		super().at_object_receive(moved_obj, source_location, move_type=move_type, **kwargs)
@@ -143,6 +165,78 @@ class FusionRoom(Room):
 		"""Set the room's weather."""
 		self.db.weather = str(weather).lower()
 
+	# ------------------------------------------------------------------
+	# Appearance cache
+	# ------------------------------------------------------------------
+	def appearance_revision(self) -> int:
+		"""Return the in-memory revision stamp for this room's look output."""
+		return getattr(getattr(self, "ndb", None), "appearance_revision", None) or 0
+
+	def invalidate_appearance(self) -> None:
+		"""Drop cached look layers after an exit or item changed in place.
+
+		Objects entering or leaving are noticed automatically; attribute edits
+		such as an exit's ``priority`` or ``dark`` flag need this call.
+		"""
+		ndb = getattr(self, "ndb", None)
+		if ndb is not None:
+			ndb.appearance_revision = self.appearance_revision() + 1
+
+	def _appearance_layers(self, looker, **kwargs) -> AppearanceLayers:
+		"""Return the cached look layers, rebuilding them when stale."""
+		exits = list(self.contents_get(content_type="exit"))
+		items = list(self.contents_get(content_type="object"))
+		key = (
+			self.appearance_revision(),
+			tuple(getattr(ex, "id", None) for ex in exits),
+			tuple(getattr(obj, "id", None) for obj in items),
+		)
+		ndb = getattr(self, "ndb", None)
+		layers = getattr(ndb, "appearance_layers", None)
+		if layers is not None and layers.key == key:
+			return layers
+
+		prioritized = [ex for ex in exits if ex.db.priority is not None]
+		unprioritized = [ex for ex in exits if ex.db.priority is None]
+		prioritized.sort(key=lambda e: e.db.priority)
+		layers = AppearanceLayers(
+			key=key,
+			exits=[(ex, self._color_exit_name(ex.key), bool(ex.db.dark)) for ex in prioritized + unprioritized],
+			items=[(obj, *self._item_names(obj, looker, False, **kwargs)) for obj in items],
+		)
+		if ndb is not None:
+			ndb.appearance_layers = layers
+		return layers
+
+	def _wrapped_desc(self, layers: AppearanceLayers, desc: str, width: int, indent: int) -> str:
+		"""Return ``desc`` wrapped to ``width``, reusing the cached wrap."""
+		if layers.desc != desc:
+			layers.desc = desc
+			layers.wrapped_desc = {}
+		wrapped = layers.wrapped_desc.get((width, indent))
+		if wrapped is None:
+			wrapped = layers.wrapped_desc[(width, indent)] = self._wrap_ansi(desc, width, indent=indent)
+		return wrapped
+
+	def _item_names(self, obj, looker, is_builder: bool, **kwargs) -> Tuple[str, str]:
+		"""Return the ANSI and screen reader names for an item."""
+		name = getattr(obj, "key", "") or "Unknown"
+		if hasattr(obj, "get_display_name"):
+			try:
+				name = obj.get_display_name(looker=looker, **kwargs)
+			except Exception:
+				name = getattr(obj, "key", name) or name
+		text = strip_ansi(name)
+		if is_builder:
+			ident = getattr(obj, "id", None)
+			ident_str = f"#{ident}" if ident is not None else "#?"
+			name += f" |y({ident_str})|n"
+			text += f" {ident_str}"
+			if getattr(getattr(obj, "db", None), "dark", False):
+				name += " |m(Dark)|n"
+				text += " (Dark)"
+		return name, text
+
 	# ---------- ANSI + width helpers ----------
 	def _term_width(self, looker) -> int:
 		"""
@@ -300,10 +394,14 @@ class FusionRoom(Room):
 			f" {self._tc(looker, 'accent')}(#{self.id})|n" if is_builder else ""
 		)
 
+		# Exit order, item names and the wrapped description do not depend on
+		# the looker; locks, visibility and the builder view are applied below.
+		layers = self._appearance_layers(looker, **kwargs)
+
 		# Description (wrapped, ANSI-safe)
 		desc = self.db.desc or self.default_description
 		desc_indent = self.PAD_LEFT if ui_mode == "boxed" else 0
-		desc_wrapped = self._wrap_ansi(desc, width, indent=desc_indent)
+		desc_wrapped = self._wrapped_desc(layers, desc, width, desc_indent)
 
 		# Boxed mode keeps the previous full-frame header for A/B testing.
 		if ui_mode == "boxed":
@@ -317,20 +415,17 @@ class FusionRoom(Room):
 		if weather and weather != "clear":
 			output.append(self._wrap_ansi(f"|wIt's {weather} here.|n", width, indent=desc_indent))
 
-		exits = self.filter_visible(self.contents_get(content_type="exit"), looker, **kwargs)
-		prioritized = [ex for ex in exits if ex.db.priority is not None]
-		unprioritized = [ex for ex in exits if ex.db.priority is None]
-		prioritized.sort(key=lambda e: e.db.priority)
+		visible = {id(ex) for ex in self.filter_visible([entry[0] for entry in layers.exits], looker, **kwargs)}
+		shown_exits = [
+			(ex, name, dark) for ex, name, dark in layers.exits if id(ex) in visible and (is_builder or not dark)
+		]
 		exit_box_lines = []
 		exit_entries = []
-		for ex in prioritized + unprioritized:
-			if ex.db.dark and not is_builder:
-				continue
-			name = self._color_exit_name(ex.key)
+		for ex, name, dark in shown_exits:
 			flags = []
 			if not ex.access(looker, "traverse"):
 				flags.append("|rLocked|n")
-			if ex.db.dark:
+			if dark:
 				flags.append("|mDark|n")
 			flag_str = f" [{' '.join(flags)}]" if flags else ""
 			id_str = f"|y(#{ex.id})|n" if is_builder else ""
@@ -356,46 +451,13 @@ class FusionRoom(Room):
 			players.append(looker)
 		npcs = [c for c in characters if c.attributes.get("npc")]
 
-		items = self.filter_visible(self.contents_get(content_type="object"), looker, **kwargs)
-
-		def _fmt_item(obj):
-			"""Return ANSI-formatted item name for fancy/simple view."""
-			name = getattr(obj, "key", "") or "Unknown"
-			if hasattr(obj, "get_display_name"):
-				try:
-					name = obj.get_display_name(looker=looker, **kwargs)
-				except Exception:
-					name = getattr(obj, "key", name) or name
-			if is_builder:
-				ident = getattr(obj, "id", None)
-				ident_str = f"#{ident}" if ident is not None else "#?"
-				name += f" |y({ident_str})|n"
-				db = getattr(obj, "db", None)
-				if getattr(db, "dark", False):
-					name += " |m(Dark)|n"
-			return name
-
-		item_names = [_fmt_item(obj) for obj in items]
-
-		def _fmt_item_sr(obj):
-			"""Return plain-text item name for screen reader mode."""
-			base = getattr(obj, "key", "") or "Unknown"
-			if hasattr(obj, "get_display_name"):
-				try:
-					base = obj.get_display_name(looker=looker, **kwargs)
-				except Exception:
-					base = getattr(obj, "key", base) or base
-			text = strip_ansi(base)
-			if is_builder:
-				ident = getattr(obj, "id", None)
-				ident_str = f" #{ident}" if ident is not None else " #?"
-				text += ident_str
-				db = getattr(obj, "db", None)
-				if getattr(db, "dark", False):
-					text += " (Dark)"
-			return text
-
-		sr_item_lines = [_fmt_item_sr(obj) for obj in items]
+		visible = {id(obj) for obj in self.filter_visible([entry[0] for entry in layers.items], looker, **kwargs)}
+		if is_builder:
+			item_rows = [self._item_names(obj, looker, True, **kwargs) for obj, _, _ in layers.items if id(obj) in visible]
+		else:
+			item_rows = [(name, text) for obj, name, text in layers.items if id(obj) in visible]
+		item_names = [name for name, _ in item_rows]
+		sr_item_lines = [text for _, text in item_rows]
 
 		def _fmt_char(c, color="|w"):
 			s = f"{color}{c.key}|n"
@@ -437,14 +499,12 @@ class FusionRoom(Room):
 			box.append("Exits:")
 			if exit_entries:
 				# Rebuild exit lines without spacing tricks; one-per-line
-				for ex in prioritized + unprioritized:
-					if ex.db.dark and not is_builder:
-						continue
+				for ex, _, dark in shown_exits:
 					n = ex.key
 					flags = []
 					if not ex.access(looker, "traverse"):
 						flags.append("Locked")
-					if ex.db.dark:
+					if dark:
 						flags.append("Dark")
 					meta = f" #{ex.id}" if is_builder else ""
 					flag_text = f" [{' '.join(flags)}]" if flags else ""
@@ -1,9 +1,17 @@
-"""Shared fuzzy-name helpers for dex-backed commands."""
+"""Shared fuzzy-name helpers for dex-backed commands.
+
+Each name category (Pokémon, moves, items, learnsets) gets a
+:class:`SuggestionIndex` the first time it is queried.  The index keeps the
+normalized names together with a bigram index, so a lookup only scores the
+names sharing part of the query instead of every name in the dex.  It is
+rebuilt when the source tables are replaced or change size.
+"""
 
 from __future__ import annotations
 
-from difflib import get_close_matches
-from typing import Iterable
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Callable, Iterable
 
 
 def normalize_dex_key(name: object) -> str:
@@ -12,6 +20,161 @@ def normalize_dex_key(name: object) -> str:
 	return str(name or "").replace(" ", "").replace("-", "").replace("'", "").lower()
 
 
+def _bigrams(key: str) -> set[str]:
+	padded = f"^{key}$"
+	return {padded[idx : idx + 2] for idx in range(len(padded) - 1)}
+
+
+class SuggestionIndex:
+	"""Normalized display names with a bigram index for closest-name lookups."""
+
+	__slots__ = ("lookup", "_keys", "_chars", "_grams")
+
+	def __init__(self, candidates: Iterable[object]):
+		lookup: dict[str, str] = {}
+		for candidate in candidates:
+			if candidate is None:
+				continue
+			display = str(candidate)
+			key = normalize_dex_key(display)
+			if key:
+				lookup.setdefault(key, display)
+		self.lookup = lookup
+		self._keys = list(lookup)
+		self._chars = [dict(Counter(key)) for key in self._keys]
+		grams: dict[str, list[int]] = {}
+		for idx, key in enumerate(self._keys):
+			for gram in _bigrams(key):
+				grams.setdefault(gram, []).append(idx)
+		self._grams = grams
+
+	def __contains__(self, name: object) -> bool:
+		key = normalize_dex_key(name)
+		return bool(key) and key in self.lookup
+
+	def __len__(self) -> int:
+		return len(self._keys)
+
+	def closest(self, query: str, *, cutoff: float = 0.74) -> str | None:
+		"""Return the closest display name to ``query`` other than itself.
+
+		Scores candidates the same way as :func:`difflib.get_close_matches`,
+		but only those sharing at least one bigram (including the padded
+		first and last letters) with ``query``.
+		"""
+
+		query_key = normalize_dex_key(query)
+		if not query_key:
+			return None
+		shared: Counter = Counter()
+		for gram in _bigrams(query_key):
+			shared.update(self._grams.get(gram, ()))
+
+		matcher = SequenceMatcher()
+		matcher.set_seq2(query_key)
+		query_len = len(query_key)
+		query_chars = Counter(query_key).items()
+		best: tuple[float, str] | None = None
+		threshold = cutoff
+		# Names sharing the most bigrams usually score best, so trying them
+		# first raises the threshold early and lets the length and
+		# character-count bounds (difflib's real_quick_ratio and quick_ratio)
+		# skip most of the remaining names.
+		for idx, _count in shared.most_common():
+			key = self._keys[idx]
+			total = len(key) + query_len
+			if 2.0 * min(len(key), query_len) / total < threshold or key == query_key:
+				continue
+			chars = self._chars[idx]
+			common = 0
+			for char, count in query_chars:
+				have = chars.get(char, 0)
+				common += count if count < have else have
+			if 2.0 * common / total < threshold:
+				continue
+			matcher.set_seq1(key)
+			score = matcher.ratio()
+			if score >= threshold and (best is None or (score, key) > best):
+				best = (score, key)
+				threshold = score
+		if best is None:
+			return None
+		return self.lookup[best[1]]
+
+
+_INDEXES: dict[str, tuple[tuple, SuggestionIndex]] = {}
+
+
+def _source_token(*sources: object) -> tuple:
+	return tuple((source, len(source) if hasattr(source, "__len__") else None) for source in sources)
+
+
+def _same_sources(left: tuple, right: tuple) -> bool:
+	return len(left) == len(right) and all(
+		a is b and a_len == b_len for (a, a_len), (b, b_len) in zip(left, right)
+	)
+
+
+def _cached_index(category: str, sources: tuple, names: Callable[[], list[str]]) -> SuggestionIndex:
+	token = _source_token(*sources)
+	cached = _INDEXES.get(category)
+	if cached is not None and _same_sources(cached[0], token):
+		return cached[1]
+	index = SuggestionIndex(names())
+	_INDEXES[category] = (token, index)
+	return index
+
+
+def _optional_attr(module: str, name: str, default=None):
+	try:
+		return getattr(__import__(module, fromlist=[name]), name, default)
+	except Exception:
+		return default
+
+
+def pokemon_index() -> SuggestionIndex:
+	"""Return the suggestion index over Pokémon names."""
+
+	return _cached_index("pokemon", (_optional_attr("pokemon.dex", "POKEDEX"),), _pokemon_names)
+
+
+def move_index() -> SuggestionIndex:
+	"""Return the suggestion index over move names."""
+
+	sources = (
+		_optional_attr("pokemon.dex", "MOVEDEX"),
+		_optional_attr("pokemon.data.text", "MOVES_TEXT"),
+	)
+	return _cached_index("move", sources, _move_names)
+
+
+def item_index() -> SuggestionIndex:
+	"""Return the suggestion index over item names."""
+
+	sources = (
+		_optional_attr("pokemon.dex", "ITEMDEX"),
+		_optional_attr("pokemon.data.text", "ITEMS_TEXT"),
+	)
+	return _cached_index("item", sources, _item_names)
+
+
+def learnset_index() -> SuggestionIndex:
+	"""Return the suggestion index over species with learnsets."""
+
+	get_store = _optional_attr("pokemon.data.learnsets.store", "get_learnset_store")
+	try:
+		store = get_store() if get_store else None
+	except Exception:
+		store = None
+	return _cached_index("learnset", (store,), _learnset_names)
+
+
+def clear_suggestion_indexes() -> None:
+	"""Drop every cached suggestion index."""
+
+	_INDEXES.clear()
+
+
 def _get_value(obj: object, key: str, default=None):
 	if isinstance(obj, dict):
 		return obj.get(key, default)
@@ -83,34 +246,20 @@ def _item_names() -> list[str]:
 
 def _learnset_names() -> list[str]:
 	try:
-		from pokemon.data.learnsets.learnsets import LEARNSETS
+		from pokemon.data.learnsets.store import get_learnset_store
+
+		names = get_learnset_store().species_names()
 	except Exception:
 		return []
-	return sorted(str(name) for name in getattr(LEARNSETS, "keys", lambda: [])())
+	return sorted(str(name) for name in names)
 
 
 def suggest_name(query: str, candidates: Iterable[object], *, cutoff: float = 0.74) -> str | None:
 	"""Return the closest display candidate for ``query``, if one is likely."""
 
-	query_key = normalize_dex_key(query)
-	if not query_key:
-		return None
-
-	lookup: dict[str, str] = {}
-	for candidate in candidates:
-		if candidate is None:
-			continue
-		display = str(candidate)
-		key = normalize_dex_key(display)
-		if key and key != query_key:
-			lookup.setdefault(key, display)
-	if not lookup:
-		return None
-
-	match = get_close_matches(query_key, lookup.keys(), n=1, cutoff=cutoff)
-	if not match:
+	if not normalize_dex_key(query):
 		return None
-	return lookup[match[0]]
+	return SuggestionIndex(candidates).closest(query, cutoff=cutoff)
 
 
 def append_suggestion(message: str, query: str, suggestion: str | None) -> str:
@@ -120,24 +269,23 @@ def append_suggestion(message: str, query: str, suggestion: str | None) -> str:
 
 
 def suggest_pokemon_name(query: str) -> str | None:
-	return suggest_name(query, _pokemon_names())
+	return pokemon_index().closest(query)
 
 
 def suggest_move_name(query: str) -> str | None:
-	return suggest_name(query, _move_names())
+	return move_index().closest(query)
 
 
 def suggest_item_name(query: str) -> str | None:
-	return suggest_name(query, _item_names())
+	return item_index().closest(query)
 
 
 def suggest_learnset_name(query: str) -> str | None:
-	return suggest_name(query, _learnset_names())
+	return learnset_index().closest(query)
 
 
 def is_known_species(name: str) -> bool:
-	key = normalize_dex_key(name)
-	return bool(key and any(normalize_dex_key(candidate) == key for candidate in _pokemon_names()))
+	return name in pokemon_index()
 
 
 def is_species_not_found_error(err: Exception) -> bool:
@@ -4,7 +4,11 @@ import builtins
 import os
 import random
 import time
-from typing import Any, Callable, Dict, List, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 try:
         if os.getenv("PF2_NO_EVENNIA"):
@@ -21,12 +25,129 @@ from pokemon.battle.battleinstance import (
         BattleType,
         create_battle_pokemon,
 )
+from pokemon.services.encounters import delete_encounter_by_ref
 from pokemon.services.trainer_encounters import generate_random_trainer_encounter
 from pokemon.helpers.party_helpers import has_usable_pokemon
+from pokemon.spawns.revision import spawn_chart_revision
 from utils.dex_suggestions import is_species_not_found_error, species_not_found_message
 from utils.pokemon_config import RARITY_WEIGHTS, TIERS
 
 
+class CompiledSpawnChart:
+	"""Immutable, indexed form of a room's hunt chart.
+
+	Entries are normalized once and grouped by time of day and weather.  The
+	candidates and cumulative weights for each ``(time, weather)`` pair are
+	built on first use, so a hunt is a single bisecting weighted draw.
+	"""
+
+	__slots__ = ("revision", "entries", "_index", "_buckets")
+
+	def __init__(self, entries: List[Dict[str, Any]], revision: int = 0) -> None:
+		self.revision = revision
+		self.entries: Tuple[Mapping[str, Any], ...] = tuple(MappingProxyType(entry) for entry in entries)
+		index: Dict[str, Dict[str, List[Mapping[str, Any]]]] = {}
+		for entry in self.entries:
+			times = entry["time"]
+			weathers = entry["weather"]
+			times = ["any"] if "any" in times else times
+			weathers = ["any"] if "any" in weathers else weathers
+			for t in times:
+				bucket = index.setdefault(t, {})
+				for w in weathers:
+					bucket.setdefault(w, []).append(entry)
+		self._index = index
+		self._buckets: Dict[Tuple[str, str], Tuple[Tuple[Mapping[str, Any], ...], Tuple[float, ...]]] = {}
+
+	def bucket(self, time_of_day: str, weather: str) -> Tuple[Tuple[Mapping[str, Any], ...], Tuple[float, ...]]:
+		"""Return the entries valid for ``time_of_day``/``weather`` and their cumulative weights."""
+		key = (time_of_day, weather)
+		cached = self._buckets.get(key)
+		if cached is not None:
+			return cached
+		valid: List[Mapping[str, Any]] = []
+		seen = set()
+		for t in (time_of_day, "any"):
+			bucket = self._index.get(t, {})
+			for w in (weather, "any"):
+				for entry in bucket.get(w, []):
+					if id(entry) not in seen:
+						valid.append(entry)
+						seen.add(id(entry))
+		cached = self._buckets[key] = (tuple(valid), tuple(accumulate(e.get("weight", 1) for e in valid)))
+		return cached
+
+	def draw(self, time_of_day: str, weather: str) -> Optional[Mapping[str, Any]]:
+		"""Pick one weighted entry for ``time_of_day``/``weather`` or ``None``."""
+		entries, cum_weights = self.bucket(time_of_day, weather)
+		if not entries:
+			return None
+		return random.choices(entries, cum_weights=cum_weights, k=1)[0]
+
+
+WILD_POOL_SIZE = 3
+TRAINER_POOL_SIZE = 2
+
+
+@dataclass
+class PreparedWildEncounter:
+	"""A chart draw with its battle Pokémon already built.
+
+	``error`` holds the hunt reply when the drawn species could not be built.
+	"""
+
+	entry: Mapping[str, Any]
+	level: int
+	pokemon: Any = None
+	error: Optional[str] = None
+
+
+@dataclass
+class RoomEncounterPool:
+	"""Encounters prepared ahead of ``+hunt`` for one room.
+
+	Wild encounters are queued per ``(time of day, weather)`` so each pop
+	matches what a live draw would return.  The pool belongs to one spawn
+	chart revision and is discarded, releasing its encounter Pokémon, as soon
+	as the room's chart changes.
+	"""
+
+	revision: int
+	wild: Dict[Tuple[str, str], deque] = field(default_factory=dict)
+	trainers: deque = field(default_factory=deque)
+	refill_pending: bool = False
+
+	def pop_wild(self, time_of_day: str, weather: str) -> Optional[PreparedWildEncounter]:
+		queue = self.wild.get((time_of_day, weather))
+		return queue.popleft() if queue else None
+
+	def pop_trainer(self):
+		return self.trainers.popleft() if self.trainers else None
+
+	def release(self) -> None:
+		"""Drop every prepared encounter and its pooled encounter Pokémon."""
+		pokemon = [prepared.pokemon for queue in self.wild.values() for prepared in queue]
+		pokemon.extend(poke for encounter in self.trainers for poke in getattr(encounter, "team", []) or [])
+		for poke in pokemon:
+			model_id = getattr(poke, "model_id", None)
+			if model_id:
+				delete_encounter_by_ref(model_id)
+		self.wild.clear()
+		self.trainers.clear()
+
+
+def _defer(callback: Callable[[], Any]) -> bool:
+	"""Run ``callback`` on the next reactor tick; ``False`` when offline."""
+	try:
+		if os.getenv("PF2_NO_EVENNIA"):
+			raise ImportError("evennia disabled")
+		from evennia.utils.utils import delay  # type: ignore
+	except Exception:
+		return False
+	delay(0, callback)
+	return True
+
+
 class HuntSystem:
 	"""Utility for resolving Pokémon hunts in a room."""
 
@@ -35,8 +156,6 @@ class HuntSystem:
 	) -> None:
 		self.room = room
 		self.spawn_callback = spawn_callback
-		self._spawn_index: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
-		self._spawn_chart_cache: Optional[List[Dict[str, Any]]] = None
 
 	def get_time_of_day(self) -> str:
 		"""Return the current time of day. Override for custom logic."""
@@ -141,37 +260,78 @@ class HuntSystem:
 		normalized = [self._normalize_spawn_entry(entry) for entry in chart]
 		return [entry for entry in normalized if entry is not None]
 
-	def _build_spawn_index(self) -> None:
-		"""Precompute spawn entries grouped by time of day and weather."""
-		chart = self._get_spawn_chart()
-		index: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
-		for entry in chart:
-			times = entry.get("time", ["any"])
-			weathers = entry.get("weather", ["any"])
-			times = ["any"] if "any" in times else times
-			weathers = ["any"] if "any" in weathers else weathers
-			for t in times:
-				bucket = index.setdefault(t, {})
-				for w in weathers:
-					bucket.setdefault(w, []).append(entry)
-		self._spawn_index = index
-		self._spawn_chart_cache = chart
+	def _compiled_chart(self) -> CompiledSpawnChart:
+		"""Return the room's compiled chart, recompiling when its revision changes.
 
-	def _get_valid_entries(self, time_of_day: str, weather: str) -> List[Dict[str, Any]]:
+		The compiled chart is kept on ``room.ndb`` so it survives between
+		``HuntSystem`` instances but not across reloads.
+		"""
+		revision = spawn_chart_revision(self.room)
+		ndb = getattr(self.room, "ndb", None)
+		compiled = getattr(ndb, "compiled_hunt_chart", None)
+		if compiled is None or compiled.revision != revision:
+			compiled = CompiledSpawnChart(self._get_spawn_chart(), revision)
+			if ndb is not None:
+				ndb.compiled_hunt_chart = compiled
+		return compiled
+
+	def _get_valid_entries(self, time_of_day: str, weather: str) -> List[Mapping[str, Any]]:
 		"""Return spawn entries valid for the given time and weather."""
-		chart = self._get_spawn_chart()
-		if self._spawn_chart_cache != chart:
-			self._build_spawn_index()
-		valid: List[Dict[str, Any]] = []
-		seen = set()
-		for t in (time_of_day, "any"):
-			bucket = self._spawn_index.get(t, {})
-			for w in (weather, "any"):
-				for entry in bucket.get(w, []):
-					if id(entry) not in seen:
-						valid.append(entry)
-						seen.add(id(entry))
-		return valid
+		return list(self._compiled_chart().bucket(time_of_day, weather)[0])
+
+	# ------------------------------------------------------------------
+	# Prepared encounter pool
+	# ------------------------------------------------------------------
+	def encounter_pool(self) -> RoomEncounterPool:
+		"""Return the room's encounter pool, replacing it when the chart changed."""
+		revision = spawn_chart_revision(self.room)
+		ndb = getattr(self.room, "ndb", None)
+		pool = getattr(ndb, "encounter_pool", None)
+		if pool is not None and pool.revision == revision:
+			return pool
+		if pool is not None:
+			pool.release()
+		pool = RoomEncounterPool(revision)
+		if ndb is not None:
+			ndb.encounter_pool = pool
+		return pool
+
+	def _prepare_wild(self, time_of_day: str, weather: str) -> Optional[PreparedWildEncounter]:
+		"""Draw a chart entry and build its battle Pokémon."""
+		entry = self._compiled_chart().draw(time_of_day, weather)
+		if entry is None:
+			return None
+		min_level = entry.get("min_level", 1)
+		level = random.randint(min_level, entry.get("max_level", min_level))
+		try:
+			poke = create_battle_pokemon(entry["name"], level, is_wild=True)
+		except ValueError as err:
+			if is_species_not_found_error(err):
+				return PreparedWildEncounter(entry, level, error=species_not_found_message(entry["name"]))
+			raise
+		return PreparedWildEncounter(entry, level, poke)
+
+	def refill_encounter_pool(self, time_of_day: str, weather: str) -> RoomEncounterPool:
+		"""Top up the pool for ``time_of_day``/``weather`` and random trainers."""
+		pool = self.encounter_pool()
+		pool.refill_pending = False
+		queue = pool.wild.setdefault((time_of_day, weather), deque())
+		while len(queue) < WILD_POOL_SIZE:
+			prepared = self._prepare_wild(time_of_day, weather)
+			if prepared is None:
+				break
+			queue.append(prepared)
+		if getattr(self.room.db, "npc_chance", 15):
+			while len(pool.trainers) < TRAINER_POOL_SIZE:
+				pool.trainers.append(generate_random_trainer_encounter(self.room))
+		return pool
+
+	def _schedule_pool_refill(self, time_of_day: str, weather: str) -> None:
+		"""Refill the pool after the current command has replied."""
+		pool = self.encounter_pool()
+		if pool.refill_pending:
+			return
+		pool.refill_pending = _defer(lambda: self.refill_encounter_pool(time_of_day, weather))
 
 	# ------------------------------------------------------------------
 	# Main hunt entry points
@@ -206,7 +366,8 @@ class HuntSystem:
 
 	def _resolve_npc_encounter(self, hunter, tp_cost: int) -> str:
 		"""Handle trainer encounter generation and battle startup."""
-		encounter = generate_random_trainer_encounter(self.room)
+		encounter = self.encounter_pool().pop_trainer() or generate_random_trainer_encounter(self.room)
+		self._schedule_pool_refill(self.get_time_of_day(), self.get_current_weather())
 		poke = encounter.team[0]
 		self._start_battle_with_selection(
 			hunter,
@@ -228,26 +389,26 @@ class HuntSystem:
 		time_of_day = self.get_time_of_day()
 		weather = self.get_current_weather()
 
-		valid = self._get_valid_entries(time_of_day, weather)
-		if not valid:
+		# A prepared encounter skips species generation on the command path;
+		# an empty pool falls back to preparing one now.
+		prepared = self.encounter_pool().pop_wild(time_of_day, weather)
+		if prepared is None:
+			prepared = self._prepare_wild(time_of_day, weather)
+		self._schedule_pool_refill(time_of_day, weather)
+		if prepared is None:
 			return "No Pokémon are active right now."
 
-		selected_entry = random.choices(valid, weights=[e.get("weight", 1) for e in valid], k=1)[0]
+		selected_entry = prepared.entry
 		selected_name = selected_entry["name"]
-		min_level = selected_entry.get("min_level", 1)
-		max_level = selected_entry.get("max_level", min_level)
-		level = random.randint(min_level, max_level)
+		level = prepared.level
 
-		result = {"name": selected_name, "level": level, "data": selected_entry}
+		result = {"name": selected_name, "level": level, "data": dict(selected_entry)}
 		if self.spawn_callback:
 			self.spawn_callback(hunter, result)
 
-		try:
-			poke = create_battle_pokemon(selected_name, level, is_wild=True)
-		except ValueError as err:
-			if is_species_not_found_error(err):
-				return species_not_found_message(selected_name)
-			raise
+		if prepared.error:
+			return prepared.error
+		poke = prepared.pokemon
 		intro_text = f"A wild {poke.name} appears!"
 		self._start_battle_with_selection(hunter, poke, BattleType.WILD, intro_text)
 		self._deduct_training_points(hunter, tp_cost)